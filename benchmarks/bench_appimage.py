@@ -0,0 +1,61 @@
+"""Lectura de metadatos de AppImages: en serie, en paralelo y desde la caché.
+
+Genera N AppImages sintéticas (tests/appimage_fixtures: mitad gzip, mitad
+xz, con el icono en hicolor y .DirIcon enlazado). Que de cada una se lean
+los datos correctos, y que las corruptas no rompan nada, lo comprueba
+tests/test_appimage.py.
+
+Uso: python benchmarks/bench_appimage.py [appimages]   (por defecto 1000)
+"""
+import sys
+
+import common
+from tests.appimage_fixtures import Link, desktop_file, fake_png, make_appimage
+
+from pixellauncher.appimage import MetadataCache
+
+CATEGORIES = ["Game;RolePlaying;", "Game;ActionGame;", "Game;StrategyGame;", "Game;"]
+
+
+def make_fixtures(n: int) -> list:
+    folder = common.BENCH_HOME / "appimages"
+    folder.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for i in range(n):
+        categories = CATEGORIES[i % len(CATEGORIES)]
+        nombre = f"Juego Sintético {i}"
+        icon = fake_png(i, 2000 + 37 * (i % 200))
+        files = {
+            f"juego{i}.desktop": desktop_file(nombre, f"Descripción {i}", categories, f"juego{i}"),
+            f"usr/share/icons/hicolor/256x256/apps/juego{i}.png": icon,
+            ".DirIcon": Link(f"usr/share/icons/hicolor/256x256/apps/juego{i}.png"),
+            "AppRun": b"#!/bin/sh\n" * 50,
+            "usr/bin/juego": bytes(range(256)) * (40 + i % 60),
+        }
+        path = folder / f"Juego_{i}-x86_64.AppImage"
+        make_appimage(path, files, compression="xz" if i % 2 else "gzip")
+        paths.append(str(path))
+    return paths
+
+
+def run(label: str, paths: list, workers: int = None, fresh: bool = True):
+    cache_path = common.BENCH_HOME / "cache" / "appimage-meta.json"
+    if fresh and cache_path.exists():
+        cache_path.unlink()
+    cache = MetadataCache(cache_path, common.BENCH_HOME / "cache" / "icons", workers)
+    t, metas = common.timed(cache.get_many, paths)
+    unread = sum(meta is None for meta in metas.values())
+    print(f"{label:<26} {cache.workers:>7} {t * 1000:>10.1f} {t * 1e6 / len(paths):>12.1f} {unread:>8}")
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    try:
+        paths = make_fixtures(n)
+        print(f"{n} AppImages sintéticas")
+        print(f"{'pasada':<26} {'hilos':>7} {'total ms':>10} {'µs/AppImage':>12} {'sin datos':>8}")
+        run("en frío, un hilo", paths, workers=1)
+        run("en frío, pool de hilos", paths)
+        run("caché (nueva instancia)", paths, fresh=False)
+    finally:
+        common.cleanup()
@@ -0,0 +1,68 @@
+"""Validación de disponibilidad de 50k entradas sin bloquear el bucle de GTK.
+
+Mide el peor hueco entre iteraciones del bucle principal mientras se valida
+la biblioteca completa, y cuenta las llamadas a stat de una segunda pasada
+(debe ser cero: todo sale de la caché).
+
+Uso: python benchmarks/bench_availability.py [entradas]   (por defecto 50000)
+"""
+import os
+import sys
+import time
+
+import common
+
+from gi.repository import GLib  # noqa: E402
+
+from pixellauncher import availability  # noqa: E402
+
+
+def make_paths(n: int):
+    root = common.BENCH_HOME / "Games"
+    paths = []
+    for i in range(n):
+        directory = root / f"carpeta{i % 500}"
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f"juego{i}.AppImage"
+        if i % 3:  # un tercio de entradas "muertas"
+            path.touch(mode=0o755)
+        paths.append(str(path))
+    return paths
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    paths = make_paths(n)
+    loop = GLib.MainLoop()
+    seen = set()
+    index = availability.AvailabilityIndex(lambda changed: seen.update(changed))
+
+    gaps, last = [], [time.perf_counter()]
+
+    def tick():
+        now = time.perf_counter()
+        gaps.append(now - last[0])
+        last[0] = now
+        if len(index.status) == n:
+            loop.quit()
+            return False
+        return True
+
+    t0 = time.perf_counter()
+    index.check(paths)
+    GLib.timeout_add(1, tick)
+    loop.run()
+    total = time.perf_counter() - t0
+
+    stats = [0]
+    real_stat = os.stat
+    os.stat = lambda *a, **k: (stats.__setitem__(0, stats[0] + 1), real_stat(*a, **k))[1]
+    index.check(paths)
+    os.stat = real_stat
+
+    print(f"{n} entradas validadas en {total * 1000:.0f} ms, peor hueco del bucle {max(gaps) * 1000:.1f} ms")
+    print(f"segunda pasada: {stats[0]} llamadas a stat")
+    t_poll, _ = common.timed(lambda: [availability.dir_signature(d) for d in index.polled])
+    print(f"carpetas: {len(index.monitors)} con monitor, {len(index.polled)} revisadas cada "
+          f"{availability.POLL_SECONDS} s ({t_poll * 1000:.1f} ms por revisión)")
+    common.cleanup()
@@ -0,0 +1,105 @@
+"""Desplazamiento por la barra lateral con portadas y memoria residente.
+
+Genera N portadas distintas (300x450 PNG), recorre la lista entera de arriba
+abajo a saltos de un cuarto de página y mide cuánto tarda cada salto en
+procesarse (incluido el dibujado). Después espera a que terminen las cargas
+pendientes y mide la memoria residente (VmRSS).
+
+Se hace dos veces: en frío (sin miniaturas en disco) y en caliente (con la
+caché de miniaturas de la primera pasada, pero con una ventana nueva).
+
+Uso: python benchmarks/bench_covers.py [portadas]   (por defecto 10000)
+"""
+import statistics
+import sys
+import time
+
+import common
+
+xvfb = common.ensure_display()
+
+from gi.repository import GdkPixbuf, Gtk  # noqa: E402
+
+from pixellauncher.core import GamesManager  # noqa: E402
+from pixellauncher.gui import MainWindow  # noqa: E402
+
+FRAME_BUDGET = 1 / 60
+
+
+def make_covers(n: int) -> list:
+    folder = common.BENCH_HOME / "portadas"
+    folder.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for i in range(n):
+        pixbuf = GdkPixbuf.Pixbuf.new(GdkPixbuf.Colorspace.RGB, False, 8, 300, 450)
+        pixbuf.fill((i * 2654435761) & 0xFFFFFF00 | 0xFF)
+        path = str(folder / f"cover-{i}.png")
+        pixbuf.savev(path, "png", [], [])
+        paths.append(path)
+    return paths
+
+
+def rss_mb() -> float:
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+def scroll_through(win) -> list:
+    scrolled = win.listbox.get_ancestor(Gtk.ScrolledWindow)
+    adj = scrolled.get_vadjustment()
+    frames = []
+    value = 0.0
+    while value < adj.get_upper() - adj.get_page_size():
+        value += adj.get_page_size() / 4
+        t, _ = common.timed(lambda: (adj.set_value(value), common.pump_events()))
+        frames.append(t)
+    return frames
+
+
+def wait_covers(win):
+    while win.covers.pending:
+        Gtk.main_iteration_do(True)
+    common.pump_events()
+
+
+def bench(label: str):
+    rss_before = rss_mb()
+    win = MainWindow()
+    win.set_default_size(1100, 700)
+    win.show_all()
+    common.wait_loaded(win)
+    wait_covers(win)
+    t0 = time.perf_counter()
+    frames = scroll_through(win)
+    wait_covers(win)
+    total = time.perf_counter() - t0
+    frames_ms = sorted(f * 1000 for f in frames)
+    slow = sum(1 for f in frames if f > FRAME_BUDGET)
+    print(f"{label:>9} {len(frames):>6} {statistics.median(frames_ms):>8.2f} "
+          f"{frames_ms[int(len(frames_ms) * 0.95)]:>8.2f} {frames_ms[-1]:>8.2f} "
+          f"{100 * slow / len(frames):>7.1f}% {total:>7.2f} s "
+          f"{win.covers.bytes / 2 ** 20:>7.1f} {rss_mb() - rss_before:>+8.1f}  {win.covers.stats}")
+    win.destroy()
+    common.pump_events()
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    try:
+        covers = make_covers(n)
+        games = common.make_library(n)
+        for game, cover in zip(games, covers):
+            game.cover = cover
+        GamesManager.save_games(games)
+        print(f"{n} portadas; saltos de 1/4 de página; presupuesto de frame {FRAME_BUDGET * 1000:.1f} ms")
+        print(f"{'pasada':>9} {'saltos':>6} {'mediana':>8} {'p95':>8} {'máx':>8} {'>16ms':>8} "
+              f"{'total':>9} {'LRU MB':>7} {'ΔRSS MB':>8}")
+        bench("frío")
+        bench("caliente")
+    finally:
+        common.cleanup()
+        if xvfb:
+            xvfb.terminate()
@@ -0,0 +1,64 @@
+"""Coste de arranque del modo CLI frente a la interfaz.
+
+Mide en procesos nuevos (Python -X importtime no incluye el arranque del
+intérprete, así que se mide el proceso entero):
+
+- CLI: main.py --list sobre una biblioteca de N juegos.
+- Interfaz: solo el import de pixellauncher.gui (gi + GTK), sin abrir ventana.
+
+Comprueba además que el modo CLI no carga gi. Sale con código 1 si el CLI
+supera CLI_BUDGET_MS o si importa gi.
+
+Uso: python benchmarks/bench_import.py [juegos] [repeticiones]   (por defecto 1000 5)
+"""
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+import common
+
+from pixellauncher.storage import open_storage
+
+CLI_BUDGET_MS = 150
+
+GI_PROBE = ("import sys, main; main.main(['--list']); "
+            "sys.exit(3 if 'gi' in sys.modules else 0)")
+
+
+def run_ms(args, env) -> float:
+    t0 = time.perf_counter()
+    subprocess.run([sys.executable] + args, env=env, cwd=common.ROOT,
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+    return (time.perf_counter() - t0) * 1000
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    reps = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    config = common.BENCH_HOME / ".local" / "share" / "pixel-launcher"
+    config.mkdir(parents=True, exist_ok=True)
+    storage = open_storage(config)
+    storage.save(common.make_library(n))
+    storage.close()
+    env = dict(os.environ)
+    try:
+        cli = [run_ms(["main.py", "--list"], env) for _ in range(reps)]
+        gi_loaded = subprocess.run([sys.executable, "-c", GI_PROBE], env=env, cwd=common.ROOT,
+                                   stdout=subprocess.DEVNULL).returncode == 3
+        try:
+            gui = [run_ms(["-c", "import pixellauncher.gui"], env) for _ in range(reps)]
+        except subprocess.CalledProcessError:
+            gui = None      # Sin gi/GTK en esta máquina
+        cli_ms = statistics.median(cli)
+        print(f"CLI --list ({n} juegos): {cli_ms:7.1f} ms (mediana de {reps})  [límite {CLI_BUDGET_MS} ms]")
+        if gui is not None:
+            print(f"import de la interfaz:   {statistics.median(gui):7.1f} ms")
+        else:
+            print("import de la interfaz:   no disponible (falta gi)")
+        print(f"gi cargado en modo CLI:  {'SÍ' if gi_loaded else 'no'}")
+        failed = gi_loaded or cli_ms > CLI_BUDGET_MS
+    finally:
+        common.cleanup()
+    sys.exit(1 if failed else 0)
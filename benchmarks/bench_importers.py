@@ -0,0 +1,72 @@
+"""Importadores a escala: genera N entradas por fuente (Steam, Lutris, Heroic y
+una carpeta de .desktop), mide la lectura y guarda todo el lote con una sola
+llamada a GamesManager.add_games (frente a añadir de uno en uno).
+
+Lo que se importa de cada fuente y los duplicados los comprueba
+tests/test_importers.py, con ficheros de ejemplo.
+
+Uso: python benchmarks/bench_importers.py [entradas por fuente]   (por defecto 10000)
+"""
+import json
+import sqlite3
+import sys
+from pathlib import Path
+
+import common
+
+from pixellauncher.core import GamesManager  # noqa: E402
+from pixellauncher.importers import BulkImporter  # noqa: E402
+
+ONE_BY_ONE = 200   # Altas sueltas que se miden para estimar el coste de ir de una en una
+
+
+def generate(root: Path, n: int) -> dict:
+    """n entradas sintéticas por fuente"""
+    steamapps = root / "steam" / "steamapps"
+    steamapps.mkdir(parents=True)
+    desktop = root / "desktop"
+    desktop.mkdir()
+    heroic = root / "heroic" / "legendaryConfig" / "legendary"
+    heroic.mkdir(parents=True)
+    for i in range(n):
+        (steamapps / f"appmanifest_{i + 10}.acf").write_text(
+            f'"AppState"\n{{\n\t"appid"\t\t"{i + 10}"\n\t"name"\t\t"Juego Steam {i}"\n'
+            f'\t"StateFlags"\t\t"4"\n\t"installdir"\t\t"Juego {i}"\n}}\n', encoding="utf-8")
+        (desktop / f"juego{i}.desktop").write_text(
+            f"[Desktop Entry]\nType=Application\nName=Juego {i}\nExec=/opt/juegos/{i}/juego %U\n"
+            f"Categories=Game;RolePlaying;\n", encoding="utf-8")
+    (heroic / "installed.json").write_text(json.dumps(
+        {f"App{i}": {"app_name": f"App{i}", "title": f"Juego Epic {i}", "is_dlc": False} for i in range(n)}))
+    db = sqlite3.connect(str(root / "pga.db"))
+    db.execute("CREATE TABLE games (id INTEGER PRIMARY KEY, name TEXT, slug TEXT, installed INTEGER)")
+    db.executemany("INSERT INTO games VALUES (?, ?, ?, 1)", ((i, f"Juego Lutris {i}", f"juego-{i}") for i in range(n)))
+    db.commit()
+    db.close()
+    return {"desktop": desktop, "steam": root / "steam", "lutris": root / "pga.db", "heroic": root / "heroic"}
+
+
+def bench_scale(root: Path, n: int):
+    paths = generate(root, n)
+    print(f"{n} entradas por fuente")
+    print(f"{'fuente':<8} {'lectura ms':>11} {'µs/entrada':>11}")
+    for source, path in paths.items():
+        t, games = common.timed(BulkImporter().run, [(source, str(path))])
+        print(f"{source:<8} {t * 1000:>11.1f} {t * 1e6 / len(games):>11.1f}")
+
+    importer = BulkImporter()
+    t_read, games = common.timed(importer.run, [(s, str(p)) for s, p in paths.items()])
+    t_save, ok = common.timed(GamesManager.add_games, games)
+    assert ok and len(GamesManager.load_games()) == len(games)
+    print(f"{'todas':<8} {t_read * 1000:>11.1f}   + guardar {len(games)} juegos de una vez: {t_save * 1000:.1f} ms")
+
+    extra = BulkImporter().run([("steam", str(paths["steam"]))])[:ONE_BY_ONE]
+    t_one, _ = common.timed(lambda: [GamesManager.add_game(g) for g in extra])
+    print(f"{'':<8} {'':>11}   de uno en uno (estimado): {t_one / len(extra) * len(games) * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    try:
+        bench_scale(common.BENCH_HOME / "sintetico", n)
+    finally:
+        common.cleanup()
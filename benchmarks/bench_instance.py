@@ -0,0 +1,90 @@
+"""Latencia de la segunda invocación con la interfaz ya abierta.
+
+Arranca la interfaz (main.py) sobre un bus de sesión privado
+(dbus-run-session) y un XDG_RUNTIME_DIR propio, espera a que tome el
+cerrojo de instancia y mide, en procesos nuevos:
+
+- main.py              (solo presenta la ventana abierta)
+- main.py --launch X   (la instancia abierta lanza y vigila el juego)
+
+Sale con código 1 si la mediana supera SECOND_BUDGET_MS o si alguna
+invocación no termina con éxito. Que la orden llegue de verdad a la
+instancia abierta lo comprueba tests/test_instance.py.
+
+Uso: python benchmarks/bench_instance.py [juegos] [repeticiones]   (por defecto 10000 10)
+"""
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+
+if not os.environ.get("DBUS_SESSION_BUS_ADDRESS") and not os.environ.get("PIXEL_BENCH_DBUS"):
+    if shutil.which("dbus-run-session") is None:
+        sys.exit("Se necesita un bus de sesión o dbus-run-session")
+    os.environ["PIXEL_BENCH_DBUS"] = "1"
+    os.execvp("dbus-run-session", ["dbus-run-session", "--", sys.executable] + sys.argv)
+
+import common
+
+os.environ["XDG_RUNTIME_DIR"] = str(common.BENCH_HOME / "run")
+
+from pixellauncher import instance  # noqa: E402
+from pixellauncher.model import Game  # noqa: E402
+from pixellauncher.storage import open_storage  # noqa: E402
+
+SECOND_BUDGET_MS = 150
+TEST_GAME = "Prueba de instancia"
+
+
+def timed_run(args) -> float:
+    t0 = time.perf_counter()
+    result = subprocess.run([sys.executable, str(common.ROOT / "main.py")] + args,
+                            stdout=subprocess.DEVNULL, timeout=60)
+    ms = (time.perf_counter() - t0) * 1000
+    if result.returncode != 0:
+        raise RuntimeError(f"main.py {' '.join(args)} terminó con código {result.returncode}")
+    return ms
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    reps = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    xvfb = common.ensure_display()
+    config = common.BENCH_HOME / ".local" / "share" / "pixel-launcher"
+    config.mkdir(parents=True, exist_ok=True)
+    games = common.make_library(n)
+    games.append(Game(nombre=TEST_GAME, ruta_ejecutable=shutil.which("true"), tipo="binario", id=n + 1))
+    storage = open_storage(config)
+    storage.save(games)
+    storage.close()
+
+    primary = None
+    failed = True
+    try:
+        t0 = time.perf_counter()
+        primary = subprocess.Popen([sys.executable, str(common.ROOT / "main.py")],
+                                   stdout=subprocess.DEVNULL)
+        while not instance.is_running():
+            if primary.poll() is not None:
+                sys.exit("La interfaz terminó antes de registrarse")
+            time.sleep(0.005)
+        cold_ms = (time.perf_counter() - t0) * 1000
+
+        present = [timed_run([]) for _ in range(reps)]
+        launch = [timed_run(["--launch", TEST_GAME]) for _ in range(reps)]
+        present_ms, launch_ms = statistics.median(present), statistics.median(launch)
+        print(f"primera instancia (hasta registrarse): {cold_ms:7.1f} ms")
+        print(f"segunda invocación, presentar:        {present_ms:7.1f} ms (mediana de {reps})")
+        print(f"segunda invocación, --launch:         {launch_ms:7.1f} ms (mediana de {reps})")
+        print(f"límite: {SECOND_BUDGET_MS} ms")
+        failed = max(present_ms, launch_ms) > SECOND_BUDGET_MS
+    finally:
+        if primary is not None:
+            primary.terminate()
+            primary.wait()
+        common.cleanup()
+        if xvfb:
+            xvfb.terminate()
+    sys.exit(1 if failed else 0)
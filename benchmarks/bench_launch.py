@@ -0,0 +1,66 @@
+"""Latencia clic → juego arrancado, en frío y con precarga (prewarm).
+
+El "juego" es un stub ejecutable (script con shebang, lanzado directamente)
+que lee sus ficheros de datos y termina. En frío se sacan sus ficheros de
+la caché de páginas con POSIX_FADV_DONTNEED; con precarga se llama a
+prewarm() y se deja un margen, como si el usuario estuviera mirando la
+ficha. Ejecutar sobre un disco real: en tmpfs no hay diferencia.
+
+Uso: python benchmarks/bench_launch.py [carpeta] [MB de datos]   (por defecto HOME temporal, 64)
+"""
+import os
+import statistics
+import sys
+import time
+
+import common
+
+from pixellauncher.launch import build_command, evict, prewarm, spawn
+from pixellauncher.model import Game
+
+REPEATS = 10
+STUB = """#!/bin/sh
+cat "$(dirname "$0")"/*.pak > /dev/null
+"""
+
+
+def make_stub(directory: str, data_mb: int) -> Game:
+    os.makedirs(directory, exist_ok=True)
+    exe = os.path.join(directory, "juego stub (1)")  # espacios y paréntesis: sin shell no pasa nada
+    with open(exe, "w") as f:
+        f.write(STUB)
+    os.chmod(exe, 0o755)
+    chunk = os.urandom(1024 * 1024)
+    for i in range(4):
+        with open(os.path.join(directory, f"datos{i}.pak"), "wb") as f:
+            for _ in range(data_mb // 4):
+                f.write(chunk)
+            f.flush()
+            os.fsync(f.fileno())
+    return Game(nombre="Stub", ruta_ejecutable=exe, tipo="binario")
+
+
+def click_to_exit(game: Game) -> float:
+    t0 = time.perf_counter()
+    argv, cwd = build_command(game)
+    spawn(argv, cwd).wait()
+    return time.perf_counter() - t0
+
+
+if __name__ == "__main__":
+    directory = sys.argv[1] if len(sys.argv) > 1 else str(common.BENCH_HOME / "stub")
+    data_mb = int(sys.argv[2]) if len(sys.argv) > 2 else 64
+    game = make_stub(directory, data_mb)
+    cold, warm = [], []
+    try:
+        for _ in range(REPEATS):
+            evict(game)
+            cold.append(click_to_exit(game))
+            evict(game)
+            prewarm(game)
+            time.sleep(1.0)  # el usuario sigue en la tarjeta de detalles
+            warm.append(click_to_exit(game))
+        print(f"en frío:      {statistics.median(cold) * 1000:8.1f} ms (mediana de {REPEATS})")
+        print(f"con precarga: {statistics.median(warm) * 1000:8.1f} ms")
+    finally:
+        common.cleanup()
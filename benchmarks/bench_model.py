@@ -0,0 +1,52 @@
+"""Memoria y tiempo de construcción de la biblioteca: dicts frente a Game.
+
+Parte de las mismas filas JSON que guarda SqliteStorage y construye la
+biblioteca en memoria de las dos formas: el dict de json.loads (como antes)
+y model.Game (slots + cadenas internadas). Mide con tracemalloc lo que
+queda vivo y el tiempo de construcción.
+
+Uso: python benchmarks/bench_model.py [juegos]   (por defecto 100000)
+"""
+import gc
+import json
+import random
+import sys
+import time
+import tracemalloc
+
+import common
+
+from pixellauncher.model import Game  # noqa: E402
+
+
+def build(rows, factory):
+    gc.collect()
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    library = {i + 1: factory(row) for i, row in enumerate(rows)}
+    t = time.perf_counter() - t0
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return library, size, t
+
+
+def as_game(row: str) -> Game:
+    return Game.from_dict(json.loads(row))
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    try:
+        rnd = random.Random(42)
+        rows = [json.dumps(common.make_game_dict(i, rnd), ensure_ascii=False) for i in range(n)]
+        print(f"{n} juegos")
+        print(f"{'modelo':<8} {'MB':>8} {'bytes/juego':>12} {'construcción (ms)':>18}")
+        results = {}
+        for label, factory in (("dict", json.loads), ("Game", as_game)):
+            library, size, t = build(rows, factory)
+            results[label] = size
+            print(f"{label:<8} {size / 2 ** 20:>8.1f} {size / n:>12.0f} {t * 1000:>18.0f}")
+            del library
+        print(f"ahorro: {1 - results['Game'] / results['dict']:.0%}")
+    finally:
+        common.cleanup()
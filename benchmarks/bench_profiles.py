@@ -0,0 +1,37 @@
+"""Lo que añade un perfil de lanzamiento (afinidad, nice) al lanzar un juego:
+el hilo desechable que lo aplica antes del exec, frente a lanzar sin perfil.
+
+Que el juego reciba de verdad el perfil lo comprueba tests/test_profiles.py.
+
+Uso: python benchmarks/bench_profiles.py [lanzamientos]   (por defecto 50)
+"""
+import os
+import shutil
+import statistics
+import sys
+
+import common
+
+from pixellauncher.launch import spawn  # noqa: E402
+from pixellauncher.profiles import LaunchProfile  # noqa: E402
+
+
+def bench_spawn(runs: int):
+    true = shutil.which("true")
+    profile = LaunchProfile(cpus=os.sched_getaffinity(0), nice=min(19, os.getpriority(os.PRIO_PROCESS, 0) + 1))
+    print(f"{'lanzamiento':<12} {'mediana ms':>11} {'mín ms':>8}")
+    for label, prof in (("sin perfil", None), ("con perfil", profile)):
+        times = []
+        for _ in range(runs):
+            t, process = common.timed(spawn, [true], None, None, prof)
+            process.wait()
+            times.append(t * 1000)
+        print(f"{label:<12} {statistics.median(times):>11.2f} {min(times):>8.2f}")
+
+
+if __name__ == "__main__":
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    try:
+        bench_spawn(runs)
+    finally:
+        common.cleanup()
@@ -0,0 +1,169 @@
+"""Efectos visuales: repintados y tiempo de frame al desplazar la barra lateral.
+
+Con el tema cargado (StyleManager) y una biblioteca de N juegos, desplaza la
+barra lateral STEP_ROWS filas por frame desde una tick callback del reloj de
+frames de GDK, en cada modo de renderizado (gui.RENDER_MODES). Dos pasadas:
+
+- desplazar: solo el scroll
+- con puntero: además la fila que queda bajo un puntero quieto pasa a
+  :hover, como al desplazar con la rueda (en el modo normal, con transición)
+
+Por modo y pasada: frames pintados, filas repintadas por frame, tiempo de
+layout + pintado de cada frame (de "layout" a "after-paint": el trabajo de
+GTK y cairo, sin la espera hasta el frame siguiente) y frames que se siguen
+pintando durante SETTLE s al parar (transiciones y animaciones pendientes).
+Los modos se alternan en ROUNDS rondas tras una pasada de calentamiento
+que construye las filas. En un display sin pantalla (Xvfb) todo se pinta
+por software, el caso en el que más pesan sombras y degradados.
+
+Uso: python benchmarks/bench_render.py [juegos] [frames]   (por defecto 10000 300)
+"""
+import statistics
+import sys
+import time
+
+import common
+
+xvfb = common.ensure_display()
+
+from gi.repository import GLib, Gtk  # noqa: E402
+
+from pixellauncher.core import GamesManager  # noqa: E402
+from pixellauncher.gui import (RENDER_MODES, ROW_HEIGHT, THEME_BUNDLE, THEME_PREFIX, THEMES_DIR,  # noqa: E402
+                               MainWindow, StyleManager)
+
+ROUNDS = 3
+STEP_ROWS = 3        # Filas por frame (rueda rápida)
+SETTLE = 0.5
+PASSES = {"desplazar": False, "con puntero": True}
+
+
+class FrameMeter:
+    """Tiempo de layout + pintado y filas dibujadas de cada frame de la ventana"""
+
+    def __init__(self, win):
+        self.times = []
+        self.rows = []
+        self.after = 0           # Frames pintados durante el reposo final
+        self.phase = None        # None (no mide), "scroll" o "reposo"
+        self._start = 0.0
+        self._drawn = 0
+        clock = win.get_frame_clock()
+        clock.connect("layout", self.on_layout)
+        clock.connect("after-paint", self.on_after_paint)
+        for row in win.rows_by_id.values():
+            row.connect("draw", self.on_row_draw)
+
+    def on_layout(self, clock):
+        self._start = time.perf_counter()
+        self._drawn = 0
+
+    def on_row_draw(self, row, cr):
+        self._drawn += 1
+        return False
+
+    def on_after_paint(self, clock):
+        if self.phase == "scroll":
+            self.times.append(time.perf_counter() - self._start)
+            self.rows.append(self._drawn)
+        elif self.phase == "reposo":
+            self.after += 1
+
+
+def wait(seconds: float):
+    done = []
+    GLib.timeout_add(int(seconds * 1000), done.append, True)
+    while not done:
+        Gtk.main_iteration_do(True)
+
+
+def scroll(win, meter: FrameMeter, frames: int, hover: bool):
+    scrolled = win.listbox.get_ancestor(Gtk.ScrolledWindow)
+    adj = scrolled.get_vadjustment()
+    adj.set_value(0)
+    wait(SETTLE)
+    state = {"frame": 0, "row": None}
+
+    def tick(widget, clock):
+        state["frame"] += 1
+        adj.set_value(min(state["frame"] * STEP_ROWS * ROW_HEIGHT, adj.get_upper() - adj.get_page_size()))
+        if hover:
+            row = win.listbox.get_row_at_y(int(adj.get_value() + adj.get_page_size() / 2))
+            if row is not state["row"]:
+                if state["row"] is not None:
+                    state["row"].unset_state_flags(Gtk.StateFlags.PRELIGHT)
+                if row is not None:
+                    row.set_state_flags(Gtk.StateFlags.PRELIGHT, False)
+                state["row"] = row
+        return state["frame"] < frames
+
+    meter.phase = "scroll"
+    scrolled.add_tick_callback(tick)
+    while state["frame"] < frames:
+        Gtk.main_iteration_do(True)
+    meter.phase = "reposo"
+    wait(SETTLE)
+    meter.phase = None
+    if state["row"] is not None:
+        state["row"].unset_state_flags(Gtk.StateFlags.PRELIGHT)
+
+
+def theme_load_ms(load, repeats: int = 20) -> float:
+    t0 = time.perf_counter()
+    for _ in range(repeats):
+        for name in ("pixel.css", "normal.css"):
+            load(Gtk.CssProvider(), name)
+    return (time.perf_counter() - t0) / repeats * 1000
+
+
+def bench(n: int, frames: int):
+    GamesManager.save_games(common.make_library(n))
+    StyleManager.load_css()
+    win = MainWindow()
+    win.set_default_size(1100, 700)
+    win.show_all()
+    common.wait_loaded(win)
+
+    bundle = "no compilado, se leen los .css"
+    if StyleManager.bundle:
+        t = theme_load_ms(lambda p, name: p.load_from_resource(THEME_PREFIX + name))
+        bundle = f"{t:.2f} ms desde {THEME_BUNDLE.name}"
+    t = theme_load_ms(lambda p, name: p.load_from_path(str(THEMES_DIR / name)))
+    print(f"cargar pixel.css + normal.css: {bundle}; {t:.2f} ms desde los .css")
+
+    meter = FrameMeter(win)
+    scroll(win, meter, frames, hover=False)   # Calentamiento: construye las filas que se verán
+    results = {(mode, name): ([], [], []) for mode in RENDER_MODES for name in PASSES}
+    for i in range(ROUNDS):
+        modes = list(RENDER_MODES) if i % 2 == 0 else list(reversed(RENDER_MODES))
+        for mode in modes:
+            StyleManager.set_mode(mode)
+            for name, hover in PASSES.items():
+                meter.times, meter.rows, meter.after = [], [], 0
+                scroll(win, meter, frames, hover)
+                times, rows, after = results[mode, name]
+                times.extend(meter.times)
+                rows.extend(meter.rows)
+                after.append(meter.after)
+
+    print(f"\n{n} juegos, {frames} frames de {STEP_ROWS} filas por pasada, {ROUNDS} rondas")
+    print(f"{'modo':<12} {'pasada':<12} {'frames':>7} {'filas/fr':>9} {'mediana ms':>11} "
+          f"{'p95 ms':>8} {'máx ms':>8} {'tras parar':>11}")
+    for (mode, name), (times, rows, after) in results.items():
+        times_ms = sorted(t * 1000 for t in times)
+        print(f"{mode:<12} {name:<12} {len(times) // ROUNDS:>7} {statistics.mean(rows):>9.1f} "
+              f"{statistics.median(times_ms):>11.2f} {times_ms[int(len(times_ms) * 0.95)]:>8.2f} "
+              f"{times_ms[-1]:>8.2f} {statistics.median(after):>11.0f}")
+    win.destroy()
+    common.pump_events()
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    frames = int(sys.argv[2]) if len(sys.argv) > 2 else 300
+    try:
+        bench(n, frames)
+    finally:
+        common.cleanup()
+        if xvfb:
+            xvfb.terminate()
@@ -0,0 +1,55 @@
+"""Escaneo en frío frente a re-escaneo en caliente sobre un árbol sintético.
+
+Genera ~100k ficheros (datos, bibliotecas .so, binarios ELF y AppImages
+falsos) y mide el primer escaneo y un re-escaneo con la caché ya poblada.
+
+Uso: python benchmarks/bench_scanner.py [ficheros]   (por defecto 100000)
+"""
+import os
+import struct
+import sys
+
+import common
+
+from pixellauncher.scanner import LibraryScanner
+
+FILES_PER_DIR = 50
+
+
+def elf_header(e_type: int, interp: bool = False, appimage: bool = False) -> bytes:
+    ident = b"\x7fELF" + bytes([2, 1, 1, 0]) + (b"AI\x02" if appimage else b"\0\0\0") + b"\0" * 5
+    header = ident + struct.pack("<HHIQQQIHHHHHH", e_type, 62, 1, 0, 64, 0, 0, 64, 56, 1, 64, 0, 0)
+    phdr = struct.pack("<IIQQQQQQ", 3 if interp else 1, 4, 0, 0, 0, 0, 0, 8)
+    return header + phdr + b"\0" * 64
+
+
+def make_tree(root: str, n_files: int):
+    for i in range(n_files // FILES_PER_DIR):
+        game_dir = os.path.join(root, f"coleccion{i % 20}", f"juego{i}")
+        os.makedirs(os.path.join(game_dir, "data"))
+        for j in range(FILES_PER_DIR - 3):
+            with open(os.path.join(game_dir, "data", f"asset{j}.pak"), "wb") as f:
+                f.write(b"PAK" * 40)
+        with open(os.path.join(game_dir, "libmotor.so"), "wb") as f:
+            f.write(elf_header(3))
+        exe = os.path.join(game_dir, f"juego{i}.x86_64")
+        with open(exe, "wb") as f:
+            f.write(elf_header(3, interp=True) + b"\0" * 1024)
+        os.chmod(exe, 0o755)
+        with open(os.path.join(root, f"coleccion{i % 20}", f"Juego_{i}-x86_64.AppImage"), "wb") as f:
+            f.write(elf_header(2, appimage=True))
+
+
+if __name__ == "__main__":
+    n_files = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    root = str(common.BENCH_HOME / "Games")
+    cache = common.BENCH_HOME / "scan-cache.json"
+    try:
+        make_tree(root, n_files)
+        for label in ("frío", "caliente"):
+            scanner = LibraryScanner(cache)
+            t, games = common.timed(scanner.scan, [root])
+            print(f"{label:>9}: {t * 1000:8.0f} ms  {len(games)} juegos  "
+                  f"{scanner.stats['listed']} carpetas listadas  {scanner.stats['read']} ficheros leídos")
+    finally:
+        common.cleanup()
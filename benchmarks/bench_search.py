@@ -0,0 +1,36 @@
+"""Coste del índice de búsqueda: construcción, consulta por pulsación y alta/baja.
+
+Uso: python benchmarks/bench_search.py [tamaños...]   (por defecto 10000 100000)
+"""
+import random
+import statistics
+import sys
+
+import common
+
+from pixellauncher.search import SearchIndex
+
+# Lo que se va tecleando en la caja de búsqueda, pulsación a pulsación
+TYPED = ["c", "cy", "cyb", "cybe", "cyber", "cyber a", "cyber ac", "cyber acc", "o", "ok", "oka"]
+
+
+def bench(n: int):
+    games = common.make_library(n)
+    index = SearchIndex()
+    build, _ = common.timed(index.add_many, games)
+
+    keystrokes = [common.timed(index.search, query)[0] for query in TYPED]
+
+    extra = common.make_game(n + 1, random.Random(0))
+    add, _ = common.timed(index.add, extra.id, extra)
+    remove, _ = common.timed(index.remove, extra.id)
+    return build, statistics.median(keystrokes), max(keystrokes), add + remove
+
+
+if __name__ == "__main__":
+    sizes = [int(a) for a in sys.argv[1:]] or [10000, 100000]
+    print(f"{'juegos':>8} {'índice (s)':>11} {'mediana (ms)':>13} {'peor (ms)':>10} {'alta+baja (ms)':>15}")
+    for n in sizes:
+        build, median, worst, edit = bench(n)
+        print(f"{n:>8} {build:>11.2f} {median * 1000:>13.2f} {worst * 1000:>10.2f} {edit * 1000:>15.3f}")
+    common.cleanup()
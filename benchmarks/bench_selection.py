@@ -0,0 +1,53 @@
+"""Cambios de selección por segundo y peor frame al recorrer la lista con el teclado.
+
+Simula mantener pulsada la flecha abajo (señal move-cursor del Gtk.ListBox)
+sobre una biblioteca grande y mide cada iteración del bucle de GTK.
+
+Uso: python benchmarks/bench_selection.py [juegos] [pasos]   (por defecto 10000 500)
+"""
+import sys
+import time
+
+import common
+
+xvfb = common.ensure_display()
+
+from gi.repository import Gtk  # noqa: E402
+
+from pixellauncher.core import GamesManager  # noqa: E402
+from pixellauncher.gui import MainWindow  # noqa: E402
+
+
+def bench(n: int, steps: int):
+    GamesManager.save_games(common.make_library(n))
+    win = MainWindow()
+    win.show_all()
+    common.wait_loaded(win)
+
+    first = win.listbox.get_row_at_index(0)
+    win.listbox.select_row(first)
+    first.grab_focus()
+    common.pump_events()
+
+    frames = []
+    t0 = time.perf_counter()
+    for _ in range(steps):
+        t = time.perf_counter()
+        win.listbox.emit("move-cursor", Gtk.MovementStep.DISPLAY_LINES, 1)
+        common.pump_events()
+        frames.append(time.perf_counter() - t)
+    total = time.perf_counter() - t0
+    win.destroy()
+    return steps / total, max(frames)
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    steps = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    try:
+        per_sec, worst = bench(n, steps)
+        print(f"{n} juegos: {per_sec:.0f} selecciones/s, peor frame {worst * 1000:.1f} ms")
+    finally:
+        common.cleanup()
+        if xvfb:
+            xvfb.terminate()
@@ -0,0 +1,51 @@
+"""Coste de un alta y una baja en la barra lateral según el tamaño de la biblioteca.
+
+Uso: python benchmarks/bench_sidebar.py [tamaños...]   (por defecto 10 50000)
+"""
+import random
+import statistics
+import sys
+
+import common
+
+xvfb = common.ensure_display()
+
+from pixellauncher.core import GamesManager  # noqa: E402
+from pixellauncher.gui import MainWindow  # noqa: E402
+
+REPEATS = 20
+
+
+def bench(n: int):
+    GamesManager.save_games(common.make_library(n))
+
+    win = MainWindow()
+    win.show_all()
+    common.wait_loaded(win)
+
+    rnd = random.Random(n)
+    adds, deletes = [], []
+    for i in range(REPEATS):
+        game = common.make_game(n + i, rnd)
+        game.id = None  # lo asigna el almacenamiento
+        t, _ = common.timed(lambda: (win.add_game(game), common.pump_events()))
+        adds.append(t)
+        t, _ = common.timed(lambda: (win.remove_game(next(reversed(win.library.values()))), common.pump_events()))
+        deletes.append(t)
+
+    win.destroy()
+    common.pump_events()
+    return statistics.median(adds), statistics.median(deletes)
+
+
+if __name__ == "__main__":
+    sizes = [int(a) for a in sys.argv[1:]] or [10, 50000]
+    print(f"{'juegos':>8} {'alta (ms)':>10} {'baja (ms)':>10}")
+    try:
+        for n in sizes:
+            add, delete = bench(n)
+            print(f"{n:>8} {add * 1000:>10.2f} {delete * 1000:>10.2f}")
+    finally:
+        common.cleanup()
+        if xvfb:
+            xvfb.terminate()
@@ -0,0 +1,52 @@
+"""Índice de orden de la barra lateral (sorting.SortIndex) a escala.
+
+Mide, para cada modo:
+
+- construir el índice por lotes, como durante la carga de la biblioteca
+  (las claves se calculan antes con prepare(), que en la ventana va en el
+  hilo de carga; su coste se muestra aparte)
+- obtener la vista completa (lo que cuesta cambiar de modo, sin GTK)
+- alta y baja de un juego: posiciones que cambian, sin reordenar nada
+
+y, como referencia, ordenar la biblioteca completa con sorted() en cada
+edición, que es lo que habría que hacer sin el índice.
+
+Uso: python benchmarks/bench_sorting.py [juegos]   (por defecto 100000)
+"""
+import random
+import statistics
+import sys
+
+import common
+
+from pixellauncher.core import LOAD_BATCH  # noqa: E402
+from pixellauncher.sorting import MODES, SortIndex, collation_key  # noqa: E402
+
+EDITS = 200
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    try:
+        games = common.make_library(n)
+        rnd = random.Random(n)
+        playtime = {game.id: rnd.randrange(1, 100000) for game in rnd.sample(games, n // 10)}
+        print(f"{n} juegos ({len(playtime)} con tiempo de juego)")
+        print(f"{'modo':<10} {'claves (ms)':>12} {'carga (ms)':>11} {'vista (ms)':>11} {'alta (ms)':>10} {'baja (ms)':>10}")
+        for mode in MODES:
+            index = SortIndex(playtime.get)
+            batches = [games[i:i + LOAD_BATCH] for i in range(0, n, LOAD_BATCH)]
+            keys = sum(common.timed(index.prepare, batch)[0] for batch in batches)
+            load = sum(common.timed(index.insert, batch, mode)[0] for batch in batches)
+            view, _ = common.timed(index.order, mode)
+            adds, removes = [], []
+            for i in range(EDITS):
+                game = common.make_game(n + i, rnd)
+                adds.append(common.timed(index.insert, [game], mode)[0])
+                removes.append(common.timed(index.delete, game.id, mode)[0])
+            print(f"{mode:<10} {keys * 1000:>12.1f} {load * 1000:>11.1f} {view * 1000:>11.1f} "
+                  f"{statistics.median(adds) * 1000:>10.3f} {statistics.median(removes) * 1000:>10.3f}")
+        resort, _ = common.timed(sorted, games, key=lambda g: (collation_key(g.nombre), g.id))
+        print(f"referencia: sorted() de toda la biblioteca por nombre en cada edición: {resort * 1000:.1f} ms")
+    finally:
+        common.cleanup()
@@ -0,0 +1,46 @@
+"""Tiempo de arranque de la ventana: primer frame, primera pantalla y carga completa.
+
+Lanza main.py en un proceso nuevo por cada tamaño de biblioteca con
+PIXEL_LAUNCHER_TIMING=exit y recoge las marcas que imprime.
+
+Uso: python benchmarks/bench_startup.py [tamaños...]   (por defecto 100 10000 100000)
+"""
+import os
+import re
+import subprocess
+import sys
+
+import common
+
+from pixellauncher.storage import open_storage
+
+STAGE = re.compile(r"\[arranque\] (.+): (\d+) ms")
+
+
+def bench(n: int) -> dict:
+    home = common.BENCH_HOME / f"home-{n}"
+    config = home / ".local" / "share" / "pixel-launcher"
+    config.mkdir(parents=True, exist_ok=True)
+    storage = open_storage(config)
+    storage.save(common.make_library(n))
+    storage.close()
+
+    env = dict(os.environ, HOME=str(home), PIXEL_LAUNCHER_TIMING="exit")
+    out = subprocess.run([sys.executable, str(common.ROOT / "main.py")], env=env,
+                         capture_output=True, text=True, timeout=600).stdout
+    return {stage.split(" (")[0]: int(ms) for stage, ms in STAGE.findall(out)}
+
+
+if __name__ == "__main__":
+    xvfb = common.ensure_display()
+    sizes = [int(a) for a in sys.argv[1:]] or [100, 10000, 100000]
+    print(f"{'juegos':>8} {'primer frame':>13} {'1ª pantalla':>12} {'completa':>10}  (ms)")
+    try:
+        for n in sizes:
+            t = bench(n)
+            print(f"{n:>8} {t.get('primer frame', -1):>13} {t.get('primera pantalla', -1):>12} "
+                  f"{t.get('biblioteca completa', -1):>10}")
+    finally:
+        common.cleanup()
+        if xvfb:
+            xvfb.terminate()
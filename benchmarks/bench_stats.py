@@ -0,0 +1,171 @@
+"""Registro de sesiones (stats.StatsStore): coste de añadir y de arrancar.
+
+1. Añadir: lanzamiento + salida de N sesiones, una a una como hace la
+   ventana (mediana, p99 y el coste medio contando las compactaciones).
+2. Arranque con un millón de sesiones (dos millones de registros):
+   - sin totales guardados: se reaplica el registro entero (el peor caso)
+   - con los totales de la compactación y la cola más larga posible
+     (COMPACT_RECORDS - 1 registros), que es lo normal
+   y se comparan los totales con los calculados aparte.
+3. Cierres bruscos: un registro a medias al final y un corte entre vaciar
+   el registro y guardar los totales. No se pierde ni se duplica nada.
+
+Sale con código 1 si algún total no coincide.
+
+Uso: python benchmarks/bench_stats.py [sesiones] [juegos]   (por defecto 1000000 10000)
+"""
+import os
+import random
+import shutil
+import statistics
+import sys
+import time
+
+import common
+
+from pixellauncher import stats  # noqa: E402
+from pixellauncher.stats import EXIT, LAUNCH, RECORD, StatsStore  # noqa: E402
+
+APPENDS = 100000
+
+
+def fresh_dir(name: str):
+    path = common.BENCH_HOME / name
+    shutil.rmtree(path, ignore_errors=True)
+    path.mkdir()
+    return path
+
+
+def write_log(directory, sessions: int, games: int, seed: int = 1) -> dict:
+    """Escribe el registro directamente (rápido) y devuelve los totales esperados"""
+    rnd = random.Random(seed)
+    expected = {}
+    now = time.time() - sessions * 60
+    with open(directory / "sessions.log", "wb") as f:
+        chunk = []
+        for i in range(sessions):
+            game_id = rnd.randrange(1, games + 1)
+            start = now + i * 60
+            duration = float(rnd.randrange(60, 7200))
+            chunk.append(RECORD.pack(LAUNCH, 0, game_id, start, 0.0))
+            chunk.append(RECORD.pack(EXIT, 0, game_id, start + duration, duration))
+            launches, playtime, _ = expected.get(game_id, (0, 0.0, 0.0))
+            expected[game_id] = (launches + 1, playtime + duration, start)
+            if len(chunk) >= 20000:
+                f.write(b"".join(chunk))
+                chunk = []
+        f.write(b"".join(chunk))
+    return expected
+
+
+def matches(store: StatsStore, expected: dict) -> bool:
+    if len(store.games) != len(expected):
+        return False
+    for game_id, (launches, playtime, last) in expected.items():
+        s = store.get(game_id)
+        # La duración va como float32 en el registro: se compara con margen
+        if s is None or s.launches != launches or abs(s.playtime - playtime) > 1e-3 * launches \
+                or s.last_played != last:
+            return False
+    return True
+
+
+def bench_append() -> None:
+    store = StatsStore(fresh_dir("append"))
+    store.load()
+    times = []
+    t0 = time.perf_counter()
+    for i in range(APPENDS // 2):
+        t = time.perf_counter()
+        store.record_launch(i % 1000 + 1, time.time())
+        times.append(time.perf_counter() - t)
+        t = time.perf_counter()
+        store.record_exit(i % 1000 + 1, time.time(), 42.0, 0)
+        times.append(time.perf_counter() - t)
+    total = time.perf_counter() - t0
+    store.close()
+    times.sort()
+    print(f"añadir {APPENDS} registros: mediana {statistics.median(times) * 1e6:.1f} µs, "
+          f"p99 {times[int(len(times) * 0.99)] * 1e6:.1f} µs, "
+          f"media con compactaciones {total / APPENDS * 1e6:.1f} µs")
+
+
+def bench_startup(sessions: int, games: int) -> int:
+    errors = 0
+    directory = fresh_dir("arranque")
+    t_gen, expected = common.timed(write_log, directory, sessions, games)
+    size = os.path.getsize(directory / "sessions.log")
+    print(f"\n{sessions} sesiones de {games} juegos: registro de {size / 2 ** 20:.1f} MB "
+          f"(generado en {t_gen:.1f} s)")
+    print(f"{'arranque':<44} {'ms':>9} {'registros':>10}  totales")
+
+    def startup(label):
+        nonlocal errors
+        store = StatsStore(directory)
+        t, replayed = common.timed(store.load)
+        ok = matches(store, expected)
+        errors += not ok
+        print(f"{label:<44} {t * 1000:>9.1f} {replayed:>10}  {'ok' if ok else 'NO COINCIDEN'}")
+        store.close()
+
+    startup("sin totales: registro completo (+ compactar)")
+    startup("totales compactados, registro vacío")
+
+    # Lo normal: la cola más larga antes de la siguiente compactación
+    store = StatsStore(directory)
+    store.load()
+    rnd = random.Random(2)
+    for i in range(stats.COMPACT_RECORDS // 2 - 1):
+        game_id = rnd.randrange(1, games + 1)
+        when = time.time() + i
+        store.record_launch(game_id, when)
+        store.record_exit(game_id, when + 30, 30.0, 0)
+        launches, playtime, _ = expected.get(game_id, (0, 0.0, 0.0))
+        expected[game_id] = (launches + 1, playtime + 30.0, when)
+    store.close()
+    startup(f"totales + cola de {stats.COMPACT_RECORDS - 2} registros")
+    return errors
+
+
+def check_crashes() -> int:
+    errors = 0
+    directory = fresh_dir("cierres")
+    expected = write_log(directory, 1000, 50)
+
+    # Un registro a medias al final (el launcher murió escribiéndolo)
+    with open(directory / "sessions.log", "ab") as f:
+        f.write(RECORD.pack(LAUNCH, 0, 1, time.time(), 0.0)[:7])
+    store = StatsStore(directory)
+    store.load()
+    ok = matches(store, expected) and os.path.getsize(directory / "sessions.log") % RECORD.size == 0
+    errors += not ok
+    print(f"\nregistro a medias al final: {'ok' if ok else 'FALLO'}")
+
+    # Corte entre vaciar el registro y guardar los totales con offset 0
+    store._write_snapshot(os.path.getsize(directory / "sessions.log"))
+    os.truncate(directory / "sessions.log", 0)
+    store.close()
+    store = StatsStore(directory)
+    store.load()
+    store.record_launch(1, time.time() + 10)
+    store.close()
+    launches, playtime, _ = expected[1]
+    expected[1] = (launches + 1, playtime, store.get(1).last_played)
+    store = StatsStore(directory)
+    store.load()
+    ok = matches(store, expected)
+    errors += not ok
+    print(f"corte a mitad de compactación: {'ok' if ok else 'FALLO'}")
+    store.close()
+    return errors
+
+
+if __name__ == "__main__":
+    sessions = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    games = int(sys.argv[2]) if len(sys.argv) > 2 else 10000
+    try:
+        bench_append()
+        failures = bench_startup(sessions, games) + check_crashes()
+    finally:
+        common.cleanup()
+    sys.exit(1 if failures else 0)
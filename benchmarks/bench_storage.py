@@ -0,0 +1,55 @@
+"""Latencia por edición y bytes escritos de cada backend de almacenamiento.
+
+Uso: python benchmarks/bench_storage.py [tamaños...]   (por defecto 1000 10000 100000)
+"""
+import random
+import statistics
+import sys
+import tempfile
+from pathlib import Path
+
+import common
+
+from pixellauncher.storage import open_storage
+
+EDITS = 20
+
+
+def written_bytes() -> int:
+    """Bytes pasados a write() por este proceso (/proc/self/io, Linux)"""
+    with open("/proc/self/io") as f:
+        for line in f:
+            if line.startswith("wchar:"):
+                return int(line.split()[1])
+    return 0
+
+
+def bench(backend: str, n: int):
+    with tempfile.TemporaryDirectory() as tmp:
+        storage = open_storage(Path(tmp), backend)
+        storage.save(common.make_library(n))
+        rnd = random.Random(n)
+
+        times = []
+        before = written_bytes()
+        for i in range(EDITS):
+            game = common.make_game(n + i, rnd)
+            t, _ = common.timed(storage.add, game)
+            times.append(t)
+            t, _ = common.timed(storage.remove, game)
+            times.append(t)
+        per_edit = (written_bytes() - before) / (2 * EDITS)
+        storage.close()
+    return statistics.median(times), per_edit
+
+
+if __name__ == "__main__":
+    sizes = [int(a) for a in sys.argv[1:]] or [1000, 10000, 100000]
+    print(f"{'backend':>8} {'juegos':>8} {'ms/edición':>11} {'bytes/edición':>14}")
+    try:
+        for backend in ("json", "sqlite"):
+            for n in sizes:
+                latency, nbytes = bench(backend, n)
+                print(f"{backend:>8} {n:>8} {latency * 1000:>11.2f} {nbytes:>14.0f}")
+    finally:
+        common.cleanup()
@@ -0,0 +1,53 @@
+"""Supervisor de procesos (supervisor.ProcessSupervisor): lanzar y recoger
+muchos hijos a la vez dentro de un GLib.MainLoop, como en la ventana.
+
+Mide cuánto se tarda en lanzarlos y en recogerlos todos. Que cada uno se
+recoja con su código de salida lo comprueba tests/test_supervisor.py.
+
+Uso: python benchmarks/bench_supervisor.py [hijos a la vez]   (por defecto 200)
+"""
+import shutil
+import sys
+import time
+
+import common
+
+from gi.repository import GLib  # noqa: E402
+
+from pixellauncher.supervisor import ProcessSupervisor  # noqa: E402
+
+
+def run_until(cond, timeout: float = 30.0) -> bool:
+    """Hace girar un GLib.MainLoop hasta que cond() se cumple o pasa timeout"""
+    loop = GLib.MainLoop()
+    deadline = time.monotonic() + timeout
+    def check():
+        if cond() or time.monotonic() > deadline:
+            loop.quit()
+            return False
+        return True
+    GLib.timeout_add(5, check)
+    loop.run()
+    return cond()
+
+
+def bench_many(n: int):
+    supervisor = ProcessSupervisor()
+    sh = shutil.which("sh")
+    t_launch, _ = common.timed(
+        lambda: [supervisor.launch(i, [sh, "-c", "sleep 0.5; exit $0", str(i % 7)]) for i in range(n)])
+    peak = len(supervisor.running)
+    t0 = time.perf_counter()
+    reaped = run_until(lambda: not supervisor.running)
+    t_reap = time.perf_counter() - t0
+    print(f"{n} hijos: lanzados en {t_launch * 1000:.0f} ms ({peak} a la vez), "
+          f"recogidos en {t_reap * 1000:.0f} ms (0,5 s de sleep incluidos)")
+    if not reaped:
+        sys.exit(f"quedan {len(supervisor.running)} sin recoger")
+
+
+if __name__ == "__main__":
+    try:
+        bench_many(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
+    finally:
+        common.cleanup()
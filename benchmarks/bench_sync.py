@@ -0,0 +1,93 @@
+"""Dos procesos editando la misma biblioteca a la vez, y la relectura por diferencias.
+
+Para cada backend arranca dos procesos que, a la vez, dan de alta juegos,
+editan juegos distintos, editan los dos el mismo juego y dan de baja otros.
+Mide cuánto tardan en escribir, y cuánto tarda un tercer Storage abierto
+desde antes (como la interfaz) en releer (reload) y en sacar las
+diferencias (sync.diff_library). Que no se pierda nada y que las
+diferencias sean exactas lo comprueba tests/test_sync.py.
+
+Uso: python benchmarks/bench_sync.py [juegos] [ediciones por proceso]   (por defecto 2000 50)
+"""
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import common
+
+from pixellauncher.model import Game  # noqa: E402
+from pixellauncher.storage import open_storage  # noqa: E402
+from pixellauncher.sync import diff_library  # noqa: E402
+
+WORKERS = ("A", "B")
+SHARED_ID = 1        # Lo editan los dos procesos: gana la última escritura
+
+
+def plan(tag: str, edits: int):
+    """IDs que edita y que elimina cada proceso (sin solaparse entre ellos)"""
+    offset = WORKERS.index(tag) * edits
+    edited = [2 + offset + i for i in range(edits)]
+    removed = [2 + len(WORKERS) * edits + offset + i for i in range(edits)]
+    return edited, removed
+
+
+def worker(backend: str, directory: str, tag: str, edits: int, start: float):
+    storage = open_storage(Path(directory), backend)
+    games = {game.id: game for game in storage.load()}
+    edited, removed = plan(tag, edits)
+    time.sleep(max(0.0, start - time.time()))
+    for i in range(edits):
+        storage.add(Game(nombre=f"Nuevo {tag} {i}", ruta_ejecutable=f"/opt/{tag}/{i}", tipo="binario"))
+        game = games[edited[i]]
+        game.descripcion = f"editado por {tag}"
+        storage.update(game)
+        storage.remove(games[removed[i]])
+        shared = games[SHARED_ID]
+        shared.descripcion = f"último: {tag}"
+        storage.update(shared)
+    storage.close()
+
+
+def run(backend: str, n: int, edits: int):
+    directory = common.BENCH_HOME / backend
+    directory.mkdir()
+    storage = open_storage(directory, backend)
+    storage.save(common.make_library(n))
+    storage.close()
+
+    watcher = open_storage(directory, backend)
+    snapshot = {game.id: game for game in watcher.load()}
+    start = time.time() + 0.5
+    t0 = time.perf_counter()
+    procs = [subprocess.Popen([sys.executable, __file__, "--worker", backend, str(directory), tag,
+                               str(n), str(edits), repr(start)]) for tag in WORKERS]
+    codes = [proc.wait() for proc in procs]
+    elapsed = time.perf_counter() - t0 - 0.5
+    if any(codes):
+        sys.exit("algún proceso terminó con error")
+
+    t_reload, fresh = common.timed(watcher.reload)
+    t_diff, diff = common.timed(diff_library, snapshot, fresh)
+    watcher.close()
+    print(f"{backend:<7} {elapsed * 1000:>10.0f} {len(fresh):>7} {t_reload * 1000:>11.1f} "
+          f"{t_diff * 1000:>9.1f}  +{len(diff.added)} ~{len(diff.changed)} -{len(diff.removed)}")
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--worker"]:
+        backend, directory, tag, n, edits, start = sys.argv[2:]
+        try:
+            worker(backend, directory, tag, int(edits), float(start))
+        finally:
+            common.cleanup()
+        sys.exit(0)
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    edits = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    try:
+        print(f"{n} juegos, {len(WORKERS)} procesos con {edits} altas, ediciones y bajas cada uno")
+        print(f"{'backend':<7} {'escrit. ms':>10} {'juegos':>7} {'relectura ms':>11} {'diff ms':>9}  cambios")
+        for backend in ("json", "sqlite"):
+            run(backend, n, edits)
+    finally:
+        common.cleanup()
@@ -0,0 +1,68 @@
+"""Coste del modo de instrumentación por llamada, apagado y encendido.
+
+Mide en procesos nuevos una función vacía sin decorar, decorada con @traced,
+un bloque with span() y ese bloque tras comprobar trace.ENABLED (como en las
+portadas), con PIXEL_LAUNCHER_TRACE sin definir y definido. Con el modo
+apagado @traced devuelve la misma función: el coste debe ser 0.
+
+Uso: python benchmarks/bench_trace.py [llamadas]   (por defecto 200000)
+"""
+import os
+import subprocess
+import sys
+
+import common
+
+PROBE = """
+import sys, time
+from pixellauncher import trace
+from pixellauncher.trace import span, traced
+
+def plain():
+    pass
+
+decorated = traced(plain)
+n = int(sys.argv[1])
+
+def per_call(fn):
+    t0 = time.perf_counter()
+    for _ in range(n):
+        fn()
+    return (time.perf_counter() - t0) / n * 1e9
+
+def with_span():
+    with span("bloque"):
+        pass
+
+def guarded_span():
+    if trace.ENABLED:
+        with span("bloque"):
+            pass
+
+base = per_call(plain)
+print(base, per_call(decorated) - base, per_call(with_span) - base, per_call(guarded_span) - base,
+      decorated is plain)
+"""
+
+
+def probe(n: int, trace: str) -> list:
+    env = dict(os.environ)
+    env.pop("PIXEL_LAUNCHER_TRACE", None)
+    if trace:
+        env["PIXEL_LAUNCHER_TRACE"] = trace
+    out = subprocess.run([sys.executable, "-c", PROBE, str(n)], env=env, cwd=common.ROOT,
+                         capture_output=True, text=True, check=True).stdout.split()
+    return [float(x) for x in out[:4]] + [out[4] == "True"]
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    try:
+        print(f"{'modo':<10} {'llamada':>10} {'+@traced':>10} {'+span()':>10} {'+si ENABLED':>12}"
+              f"  (ns por llamada)")
+        for label, trace in (("apagado", ""), ("encendido", str(common.BENCH_HOME / "trace.json"))):
+            base, decorated, block, guarded, same = probe(n, trace)
+            print(f"{label:<10} {base:>10.1f} {decorated:>+10.1f} {block:>+10.1f} {guarded:>+12.1f}"
+                  f"{'  (@traced devuelve la misma función)' if same else ''}")
+    finally:
+        common.cleanup()
@@ -0,0 +1,104 @@
+"""Utilidades compartidas por los benchmarks.
+
+Cada benchmark importa este módulo ANTES que pixellauncher: redirige HOME a un
+directorio temporal para no tocar la biblioteca real del usuario.
+"""
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+BENCH_HOME = Path(tempfile.mkdtemp(prefix="pixel-bench-"))
+os.environ["HOME"] = str(BENCH_HOME)
+
+from pixellauncher.model import Game  # noqa: E402  (no depende de HOME)
+
+NOMBRES = ["Cyberpunk", "Señor de los Anillos", "Ōkami", "Crónicas", "Fußball", "Ναυμαχία",
+           "Кузница", "ゼルダ", "Mañana", "Über", "Doom", "Hollow", "Dragón", "Élite", "Niño"]
+CATEGORIAS = ["RPG", "Acción", "Estrategia", "Plataformas", "Simulación", "Carreras", "Puzle", "Aventura"]
+EMOJIS = ["🎮", "👾", "🕹", "🐉", "🚀", "⚔", "🏎", "🧩", "🌌", "🔫"]
+
+
+def make_game_dict(i: int, rnd: random.Random) -> dict:
+    """Un juego en el formato de games.json"""
+    nombre = f"{rnd.choice(NOMBRES)} {rnd.choice(NOMBRES)} {i}"
+    return {
+        "id": i + 1,
+        "nombre": nombre,
+        "descripcion": f"Descripción de {nombre} — edición Ñandú",
+        "categoria": rnd.choice(CATEGORIAS),
+        "tipo": rnd.choice(["appimage", "binario"]),
+        "ruta_ejecutable": f"/opt/juegos/{i}/{nombre.replace(' ', '_')}.AppImage",
+        "icono_emoji": rnd.choice(EMOJIS),
+    }
+
+
+def make_game(i: int, rnd: random.Random) -> Game:
+    return Game.from_dict(make_game_dict(i, rnd))
+
+
+def make_library(n: int, seed: int = 42) -> list:
+    """Biblioteca sintética de n juegos con nombres Unicode y emoji"""
+    rnd = random.Random(seed)
+    return [make_game(i, rnd) for i in range(n)]
+
+
+def ensure_display(backend: str = None):
+    """Arranca un display sin pantalla si no hay ninguno. Devuelve el proceso o None.
+
+    backend: "xvfb" (por defecto) o "broadway"; también PIXEL_BENCH_BACKEND.
+    """
+    backend = backend or os.environ.get("PIXEL_BENCH_BACKEND", "xvfb")
+    if backend == "broadway":
+        if shutil.which("broadwayd") is None:
+            sys.exit("Se necesita broadwayd (GTK 3) para el backend broadway")
+        display = ":%d" % (5 + os.getpid() % 50)
+        proc = subprocess.Popen(["broadwayd", display], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        os.environ["GDK_BACKEND"] = "broadway"
+        os.environ["BROADWAY_DISPLAY"] = display
+        time.sleep(0.5)
+        return proc
+    if os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY"):
+        return None
+    if shutil.which("Xvfb") is None:
+        sys.exit("Se necesita un display (DISPLAY) o Xvfb instalado")
+    display = ":%d" % (90 + os.getpid() % 100)
+    proc = subprocess.Popen(["Xvfb", display, "-screen", "0", "1280x800x24", "-nolisten", "tcp"],
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    os.environ["DISPLAY"] = display
+    time.sleep(0.5)
+    return proc
+
+
+def pump_events():
+    """Procesa todos los eventos pendientes del bucle de GTK"""
+    from gi.repository import Gtk
+    while Gtk.events_pending():
+        Gtk.main_iteration_do(False)
+
+
+def wait_loaded(win):
+    """Espera a que MainWindow termine de cargar la biblioteca en segundo plano"""
+    from gi.repository import Gtk
+    while win.loading:
+        Gtk.main_iteration_do(True)
+    pump_events()
+
+
+def timed(fn, *args, **kwargs):
+    """Ejecuta fn y devuelve (segundos, resultado)"""
+    t0 = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return time.perf_counter() - t0, result
+
+
+def cleanup():
+    shutil.rmtree(BENCH_HOME, ignore_errors=True)
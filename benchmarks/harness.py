@@ -0,0 +1,216 @@
+"""Suite de escalabilidad: GamesManager y las rutas calientes de MainWindow.
+
+Para cada tamaño de biblioteca (nombres Unicode y emoji, common.make_library)
+mide en un proceso aparte:
+
+- GamesManager.load_games / save_games
+- MainWindow: carga completa, refresh_list, cambio de orden, show_game_details,
+  alta y baja
+- el pico de memoria residente del proceso (ru_maxrss)
+
+Las partes GTK corren sobre un display sin pantalla (Xvfb o Broadway). El
+resultado se escribe en JSON, con los datos de la máquina; con --baseline
+se compara con una ejecución anterior y se sale con código 1 si algo
+empeora más que --threshold.
+
+benchmarks/baseline.json es la referencia del repositorio. Solo tiene
+sentido comparar con ella en una máquina parecida (ver su "machine"), y
+solo se comparan las medidas que estén en las dos. Para renovarla, en la
+máquina de referencia y sin otra carga:
+
+    python benchmarks/harness.py --output benchmarks/baseline.json --notes "..."
+
+y se sube junto con el cambio que la justifica. Otra máquina, mejor una
+base propia: una ejecución con --output antes del cambio.
+
+Uso:
+    python benchmarks/harness.py [--sizes 100 10000 100000] [--output resultados.json]
+                                 [--baseline benchmarks/baseline.json] [--threshold 0.20]
+                                 [--backend xvfb|broadway] [--skip-gui] [--notes TEXTO]
+"""
+import argparse
+import itertools
+import json
+import os
+import platform
+import random
+import resource
+import statistics
+import subprocess
+import sys
+import time
+
+import common
+
+DEFAULT_SIZES = [100, 10000, 100000]
+MIN_RUNS, MAX_RUNS, BUDGET = 3, 20, 2.0   # Repeticiones: al menos 3, hasta 20 o 2 s
+NOISE_MS = 0.5                            # Diferencias menores no cuentan como regresión
+
+
+def measure(fn, setup=None) -> dict:
+    """Repite fn() y devuelve mediana y mínimo en ms"""
+    runs = []
+    start = time.perf_counter()
+    while len(runs) < MIN_RUNS or (len(runs) < MAX_RUNS and time.perf_counter() - start < BUDGET):
+        if setup is not None:
+            setup()
+        t0 = time.perf_counter()
+        fn()
+        runs.append((time.perf_counter() - t0) * 1000)
+    return {"median_ms": statistics.median(runs), "min_ms": min(runs), "runs": len(runs)}
+
+
+def peak_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def bench_size(n: int, gui: bool) -> dict:
+    """Se ejecuta en el proceso hijo: todas las medidas de un tamaño"""
+    from pixellauncher.core import GamesManager
+
+    games = common.make_library(n)
+    results = {"save_games": measure(lambda: GamesManager.save_games(games)),
+               "load_games": measure(GamesManager.load_games)}
+    if gui:
+        from pixellauncher.gui import MainWindow
+        from pixellauncher.sorting import MODES
+
+        windows = []
+
+        def open_window():
+            win = MainWindow()
+            win.show_all()
+            common.wait_loaded(win)
+            windows.append(win)
+
+        results["window_load"] = measure(open_window, setup=lambda: [w.destroy() for w in windows])
+        win = windows[-1]
+        rnd = random.Random(n)
+        results["refresh_list"] = measure(lambda: (win.refresh_list(), common.pump_events()))
+        modes = itertools.cycle(MODES)
+        results["set_sort_mode"] = measure(lambda: (win.set_sort_mode(next(modes)), common.pump_events()))
+        results["show_game_details"] = measure(
+            lambda: (win.show_game_details(rnd.choice(list(win.library.values()))), common.pump_events()))
+
+        def new_game():
+            game = common.make_game(n + rnd.randrange(10 ** 6), rnd)
+            game.id = None    # lo asigna el almacenamiento
+            return game
+
+        results["add_game"] = measure(lambda: (win.add_game(new_game()), common.pump_events()))
+        results["remove_game"] = measure(lambda: (win.remove_game(next(reversed(win.library.values()))), common.pump_events()),
+                                         setup=lambda: win.add_game(new_game()))
+    results["peak_rss"] = {"mb": peak_rss_mb()}
+    return results
+
+
+def run_worker(n: int, gui: bool) -> dict:
+    """Cada tamaño en su propio proceso, para que el pico de RSS sea el suyo"""
+    cmd = [sys.executable, os.path.abspath(__file__), "--worker", str(n)] + ([] if gui else ["--skip-gui"])
+    out = subprocess.run(cmd, capture_output=True, text=True, check=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def machine_notes() -> dict:
+    """Lo que hace falta para saber si dos resultados se pueden comparar"""
+    cpu = platform.processor()
+    try:
+        with open("/proc/cpuinfo", encoding="utf-8") as f:
+            cpu = next((line.split(":", 1)[1].strip() for line in f if line.startswith("model name")), cpu)
+    except OSError:
+        pass
+    return {"cpu": cpu, "cpus": os.cpu_count(), "arch": platform.machine(),
+            "system": f"{platform.system()} {platform.release()}", "python": platform.python_version()}
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=common.ROOT,
+                              capture_output=True, text=True).stdout.strip()
+    except OSError:
+        return ""
+
+
+def flatten(results: dict) -> dict:
+    """{"10000": {"load_games": {"median_ms": x}}} -> {"load_games/10000": (x, "ms")}"""
+    flat = {}
+    for size, cases in results.items():
+        for case, values in cases.items():
+            if "median_ms" in values:
+                flat[f"{case}/{size}"] = (values["median_ms"], "ms")
+            else:
+                flat[f"{case}/{size}"] = (values["mb"], "MB")
+    return flat
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> int:
+    """Imprime la comparación y devuelve el número de regresiones"""
+    now, before = flatten(current["results"]), flatten(baseline["results"])
+    regressions = 0
+    print(f"\nComparación con {baseline.get('commit') or 'la base'} (umbral {threshold:.0%})")
+    if baseline.get("machine") != current["machine"]:
+        print(f"aviso: la base es de otra máquina: {baseline.get('machine')}")
+    print(f"{'medida':<28} {'base':>12} {'ahora':>12} {'cambio':>8}")
+    for key in sorted(now.keys() & before.keys()):
+        value, unit = now[key]
+        base = before[key][0]
+        ratio = value / base - 1 if base else 0.0
+        worse = ratio > threshold and (unit != "ms" or value - base > NOISE_MS)
+        regressions += worse
+        print(f"{key:<28} {base:>9.2f} {unit:<2} {value:>9.2f} {unit:<2} {ratio:>+7.1%}"
+              f"{'  ← REGRESIÓN' if worse else ''}")
+    return regressions
+
+
+def main(argv) -> int:
+    parser = argparse.ArgumentParser(description="Suite de escalabilidad de Pixel Launcher")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--output", help="fichero JSON de resultados (por defecto, solo se imprime)")
+    parser.add_argument("--baseline", help="JSON de una ejecución anterior con el que comparar")
+    parser.add_argument("--threshold", type=float, default=0.20, help="empeoramiento tolerado (0.20 = 20%%)")
+    parser.add_argument("--backend", choices=("xvfb", "broadway"), default=None)
+    parser.add_argument("--skip-gui", action="store_true", help="solo GamesManager, sin GTK")
+    parser.add_argument("--notes", default="", help="comentario que se guarda con los resultados")
+    parser.add_argument("--worker", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker is not None:
+        try:
+            print(json.dumps(bench_size(args.worker, not args.skip_gui)))
+        finally:
+            common.cleanup()
+        return 0
+
+    display = None if args.skip_gui else common.ensure_display(args.backend)
+    try:
+        results = {}
+        for n in args.sizes:
+            results[str(n)] = run_worker(n, not args.skip_gui)
+            print(f"{n:>8} juegos: " + ", ".join(f"{case} {v['median_ms']:.2f} ms" if "median_ms" in v
+                                                 else f"{case} {v['mb']:.0f} MB"
+                                                 for case, v in results[str(n)].items()), flush=True)
+    finally:
+        common.cleanup()
+        if display:
+            display.terminate()
+
+    report = {
+        "commit": git_commit(),
+        "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "machine": machine_notes(),
+        "backend": None if args.skip_gui else (args.backend or os.environ.get("PIXEL_BENCH_BACKEND", "xvfb")),
+        "storage": os.environ.get("PIXEL_LAUNCHER_STORAGE", "sqlite"),
+        "notes": args.notes,
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=4, ensure_ascii=False)
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            return 1 if compare(report, json.load(f), args.threshold) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
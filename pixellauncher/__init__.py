@@ -0,0 +1 @@
+"""Módulos de soporte de Pixel Launcher (sin dependencias de GTK salvo que se indique)."""
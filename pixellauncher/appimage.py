@@ -0,0 +1,411 @@
+"""Metadatos de AppImage (tipo 2) sin ejecutarlas ni montarlas.
+
+Una AppImage es un runtime ELF seguido de una imagen squashfs. El squashfs
+empieza justo donde acaba la tabla de secciones del ELF (e_shoff +
+e_shentsize * e_shnum). De ahí se leen directamente el .desktop de la raíz
+(nombre, comentario, categorías, icono) y el icono, con un lector mínimo de
+squashfs 4.0 que solo entiende lo necesario: directorios, ficheros (con
+fragmentos) y enlaces simbólicos. Compresión gzip, lzma y xz con la
+biblioteca estándar; zstd solo si está instalado el módulo zstandard.
+
+MetadataCache guarda el resultado por (ruta, tamaño, mtime): abrir de nuevo
+la misma AppImage no vuelve a leerla.
+"""
+import hashlib
+import json
+import lzma
+import os
+import posixpath
+import struct
+import threading
+import zlib
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from pixellauncher.model import Game
+from pixellauncher.scanner import ELF_MAGIC, game_name
+from pixellauncher.storage import write_json_atomic
+from pixellauncher.trace import span
+
+SQUASHFS_MAGIC = b"hsqs"
+NO_FRAGMENT = 0xFFFFFFFF
+METADATA_SIZE = 8192
+MAX_DESKTOP_BYTES = 64 * 1024
+MAX_ICON_BYTES = 4 * 1024 * 1024
+ICON_SIZES = ("256x256", "512x512", "128x128", "scalable")
+
+# Subcategorías de juegos de freedesktop -> categorías del launcher
+CATEGORIES = {
+    "ActionGame": "Acción",
+    "AdventureGame": "Aventura",
+    "ArcadeGame": "Arcade",
+    "BoardGame": "Mesa",
+    "BlocksGame": "Puzle",
+    "CardGame": "Cartas",
+    "KidsGame": "Infantil",
+    "LogicGame": "Puzle",
+    "RolePlaying": "RPG",
+    "Shooter": "Shooter",
+    "Simulation": "Simulación",
+    "SportsGame": "Deportes",
+    "StrategyGame": "Estrategia",
+    "Emulator": "Emulador",
+}
+
+_Dir = namedtuple("_Dir", "block_index block_offset size")
+_File = namedtuple("_File", "start size fragment frag_offset block_sizes")
+_Link = namedtuple("_Link", "target")
+
+
+class AppImageError(Exception):
+    pass
+
+
+def squashfs_offset(f) -> Optional[int]:
+    """Posición del squashfs dentro de la AppImage, o None si no es de tipo 2"""
+    f.seek(0)
+    header = f.read(64)
+    if len(header) < 52 or header[:4] != ELF_MAGIC:
+        return None
+    endian = "<" if header[5] == 1 else ">"
+    if header[4] == 2:
+        shoff, = struct.unpack_from(endian + "Q", header, 40)
+        shentsize, shnum = struct.unpack_from(endian + "HH", header, 58)
+    else:
+        shoff, = struct.unpack_from(endian + "I", header, 32)
+        shentsize, shnum = struct.unpack_from(endian + "HH", header, 46)
+    offset = shoff + shentsize * shnum
+    f.seek(offset)
+    return offset if f.read(4) == SQUASHFS_MAGIC else None
+
+
+def _decompressor(compression: int, block_size: int):
+    if compression == 1:
+        return zlib.decompress
+    if compression in (2, 4):
+        return lzma.decompress      # FORMAT_AUTO: lzma "alone" y xz
+    if compression == 6:
+        try:
+            import zstandard
+        except ImportError:
+            raise AppImageError("compresión zstd (falta el módulo zstandard)")
+        dctx = zstandard.ZstdDecompressor()
+
+        def decompress(data: bytes) -> bytes:
+            # Bloque truncado o corrupto: mismo error que el resto del lector
+            try:
+                return dctx.decompress(data, max_output_size=max(block_size, METADATA_SIZE))
+            except zstandard.ZstdError as e:
+                raise AppImageError(f"zstd: {e}") from None
+        return decompress
+    raise AppImageError(f"compresión {compression} no soportada")
+
+
+class _Cursor:
+    """Lectura secuencial de una tabla de metadatos (bloques de 8 KiB)"""
+    def __init__(self, fs: "SquashFS", pos: int, offset: int):
+        self.fs, self.pos, self.offset = fs, pos, offset
+
+    def read(self, n: int) -> bytes:
+        out = []
+        while n > 0:
+            data, following = self.fs._metadata_block(self.pos)
+            if self.offset >= len(data):
+                if not data:
+                    raise AppImageError("bloque de metadatos vacío")
+                self.pos, self.offset = following, self.offset - len(data)
+                continue
+            piece = data[self.offset:self.offset + n]
+            out.append(piece)
+            self.offset += len(piece)
+            n -= len(piece)
+        return b"".join(out)
+
+
+class SquashFS:
+    """Lector de solo lectura de un squashfs 4.0 que empieza en offset dentro de f"""
+
+    def __init__(self, f, offset: int = 0):
+        self.f = f
+        self.offset = offset
+        (magic, _inodes, _mtime, self.block_size, _fragments, compression, _block_log, _flags,
+         _ids, major, _minor, self.root_ref, _bytes_used, _id_table, _xattr_table,
+         self.inode_table, self.dir_table, self.fragment_table,
+         _export_table) = struct.unpack("<4sIIIIHHHHHHQQQQQQQQ", self._read(0, 96))
+        if magic != SQUASHFS_MAGIC or major != 4:
+            raise AppImageError("no es un squashfs 4.0")
+        self.decompress = _decompressor(compression, self.block_size)
+        self._metadata: Dict[int, tuple] = {}
+        self._fragments: Dict[int, bytes] = {}
+
+    def _read(self, pos: int, size: int) -> bytes:
+        self.f.seek(self.offset + pos)
+        data = self.f.read(size)
+        if len(data) != size:
+            raise AppImageError("imagen truncada")
+        return data
+
+    def _metadata_block(self, pos: int):
+        """(datos, posición del bloque siguiente) del bloque de metadatos en pos"""
+        cached = self._metadata.get(pos)
+        if cached is None:
+            header, = struct.unpack("<H", self._read(pos, 2))
+            size = header & 0x7FFF
+            data = self._read(pos + 2, size)
+            if not header & 0x8000:
+                data = self.decompress(data)
+            cached = self._metadata[pos] = (data, pos + 2 + size)
+        return cached
+
+    def inode(self, ref: int):
+        c = _Cursor(self, self.inode_table + (ref >> 16), ref & 0xFFFF)
+        itype, = struct.unpack("<H14x", c.read(16))
+        if itype == 1:
+            block_index, _links, size, block_offset, _parent = struct.unpack("<IIHHI", c.read(16))
+            return _Dir(block_index, block_offset, size)
+        if itype == 8:
+            _links, size, block_index, _parent, _index_count, block_offset, _xattr = \
+                struct.unpack("<IIIIHHI", c.read(24))
+            return _Dir(block_index, block_offset, size)
+        if itype in (2, 9):
+            if itype == 2:
+                start, fragment, frag_offset, size = struct.unpack("<IIII", c.read(16))
+            else:
+                start, size, _sparse, _links, fragment, frag_offset, _xattr = \
+                    struct.unpack("<QQQIIII", c.read(40))
+            if fragment == NO_FRAGMENT:
+                blocks = -(-size // self.block_size)
+            else:
+                blocks = size // self.block_size
+            return _File(start, size, fragment, frag_offset, struct.unpack(f"<{blocks}I", c.read(4 * blocks)))
+        if itype in (3, 10):
+            _links, target_size = struct.unpack("<II", c.read(8))
+            return _Link(c.read(target_size).decode("utf-8", "replace"))
+        return None     # Dispositivos, FIFOs y sockets no interesan
+
+    def listdir(self, directory: _Dir) -> Dict[str, int]:
+        """nombre -> referencia del inodo"""
+        entries = {}
+        remaining = directory.size - 3     # El tamaño cuenta "." y ".."
+        c = _Cursor(self, self.dir_table + directory.block_index, directory.block_offset)
+        while remaining > 0:
+            count, start, _base = struct.unpack("<III", c.read(12))
+            remaining -= 12
+            for _ in range(count + 1):
+                offset, _delta, _type, name_size = struct.unpack("<HhHH", c.read(8))
+                name = c.read(name_size + 1).decode("utf-8", "replace")
+                remaining -= 8 + name_size + 1
+                entries[name] = (start << 16) | offset
+        return entries
+
+    def lookup(self, path: str, depth: int = 0):
+        """Inodo de la ruta (relativa a la raíz de la imagen), siguiendo enlaces"""
+        node = self.inode(self.root_ref)
+        parts = [p for p in path.split("/") if p not in ("", ".")]
+        for i, part in enumerate(parts):
+            if not isinstance(node, _Dir):
+                return None
+            ref = self.listdir(node).get(part)
+            if ref is None:
+                return None
+            node = self.inode(ref)
+            if isinstance(node, _Link):
+                if depth >= 8:
+                    return None
+                base = "/" if node.target.startswith("/") else "/" + "/".join(parts[:i])
+                target = posixpath.normpath(posixpath.join(base, node.target))
+                node = self.lookup(posixpath.join(target, *parts[i + 1:]), depth + 1)
+                break
+        return node
+
+    def _fragment(self, index: int) -> bytes:
+        block = self._fragments.get(index)
+        if block is None:
+            table, = struct.unpack("<Q", self._read(self.fragment_table + 8 * (index // 512), 8))
+            start, size, _unused = struct.unpack("<QII", _Cursor(self, table, 16 * (index % 512)).read(16))
+            block = self._read(start, size & 0xFFFFFF)
+            if not size & 0x1000000:
+                block = self.decompress(block)
+            self._fragments[index] = block
+        return block
+
+    def read_file(self, node: _File) -> bytes:
+        out = []
+        pos = node.start
+        for size in node.block_sizes:
+            on_disk = size & 0xFFFFFF
+            if on_disk == 0:
+                out.append(bytes(self.block_size))     # Bloque disperso
+                continue
+            data = self._read(pos, on_disk)
+            pos += on_disk
+            out.append(data if size & 0x1000000 else self.decompress(data))
+        if node.fragment != NO_FRAGMENT:
+            tail = node.size % self.block_size
+            out.append(self._fragment(node.fragment)[node.frag_offset:node.frag_offset + tail])
+        return b"".join(out)[:node.size]
+
+
+def parse_desktop(text: str) -> Dict[str, str]:
+    """Claves del grupo [Desktop Entry] de un fichero .desktop"""
+    entry, section = {}, None
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if line.startswith("["):
+            section = line
+        elif section == "[Desktop Entry]" and "=" in line:
+            key, value = line.split("=", 1)
+            entry.setdefault(key.strip(), value.strip())
+    return entry
+
+
+def localized(entry: Dict[str, str], key: str) -> str:
+    """Valor en el idioma del sistema (Name[es_ES], Name[es]) o el genérico"""
+    lang = (os.environ.get("LC_ALL") or os.environ.get("LC_MESSAGES") or os.environ.get("LANG") or "")
+    lang = lang.split(".")[0].split("@")[0]
+    for variant in (lang, lang.split("_")[0]):
+        if variant and f"{key}[{variant}]" in entry:
+            return entry[f"{key}[{variant}]"]
+    return entry.get(key, "")
+
+
+def categoria(categories: str) -> str:
+    for name in categories.split(";"):
+        if name in CATEGORIES:
+            return CATEGORIES[name]
+    return ""
+
+
+def _read_icon(fs: SquashFS, icon: str) -> Optional[bytes]:
+    candidates = []
+    if icon:
+        if "." in posixpath.basename(icon):
+            candidates.append(icon)
+        candidates += [f"{icon}.png", f"{icon}.svg"]
+        for size in ICON_SIZES:
+            ext = "svg" if size == "scalable" else "png"
+            candidates.append(f"usr/share/icons/hicolor/{size}/apps/{icon}.{ext}")
+    candidates.append(".DirIcon")
+    for path in candidates:
+        node = fs.lookup(path)
+        if isinstance(node, _File) and 0 < node.size <= MAX_ICON_BYTES:
+            return fs.read_file(node)
+    return None
+
+
+def read_metadata(path: str, icon_dir: Optional[Path] = None) -> Optional[Dict]:
+    """Campos de juego (nombre, descripcion, categoria, cover) leídos de la AppImage.
+
+    Con icon_dir, el icono se guarda allí (nombre = hash del contenido) y su
+    ruta va en "cover". Devuelve None si no es una AppImage de tipo 2 o no
+    tiene un .desktop en la raíz.
+    """
+    with open(path, 'rb') as f:
+        offset = squashfs_offset(f)
+        if offset is None:
+            return None
+        with span("appimage: leer .desktop", "appimage"):
+            fs = SquashFS(f, offset)
+            root = fs.inode(fs.root_ref)
+            if not isinstance(root, _Dir):
+                raise AppImageError("la raíz no es un directorio")
+            desktop = next((name for name in sorted(fs.listdir(root)) if name.endswith(".desktop")), None)
+            node = fs.lookup(desktop) if desktop else None
+            if not isinstance(node, _File) or node.size > MAX_DESKTOP_BYTES:
+                return None
+            entry = parse_desktop(fs.read_file(node).decode("utf-8", "replace"))
+        meta = {
+            "nombre": localized(entry, "Name"),
+            "descripcion": localized(entry, "Comment"),
+            "categoria": categoria(entry.get("Categories", "")),
+            "cover": "",
+        }
+        if icon_dir is not None:
+            with span("appimage: leer icono", "appimage"):
+                data = _read_icon(fs, entry.get("Icon", ""))
+            if data:
+                ext = ".svg" if data.lstrip()[:1] == b"<" else ".png"
+                icon_path = icon_dir / (hashlib.sha1(data).hexdigest() + ext)
+                if not icon_path.exists():
+                    icon_dir.mkdir(parents=True, exist_ok=True)
+                    tmp = icon_path.with_name(f".{icon_path.name}.{threading.get_ident()}.tmp")
+                    tmp.write_bytes(data)
+                    os.replace(tmp, icon_path)
+                meta["cover"] = str(icon_path)
+        return meta
+
+
+def fill_game(game: Game, meta: Dict) -> bool:
+    """Completa los campos vacíos del juego (y el nombre deducido del fichero).
+
+    Devuelve True si ha cambiado algo. Lo que el usuario escribió no se toca.
+    """
+    changed = False
+    auto_name = game_name(game.ruta_ejecutable, "appimage")
+    for key in ("nombre", "descripcion", "categoria", "cover"):
+        value = meta.get(key)
+        current = getattr(game, key)
+        if value and value != current and (not current or (key == "nombre" and current == auto_name)):
+            game.set(key, value)
+            changed = True
+    return changed
+
+
+class MetadataCache:
+    def __init__(self, cache_path: Path, icon_dir: Path, workers: int = None):
+        self.cache_path = cache_path
+        self.icon_dir = icon_dir
+        self.workers = workers or min(8, os.cpu_count() or 2)
+        self._lock = threading.Lock()
+        self._dirty = False
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f)     # ruta -> [tamaño, mtime_ns, metadatos o None]
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def get(self, path: str) -> Optional[Dict]:
+        """Metadatos de la AppImage, leídos solo si cambió desde la última vez"""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        with self._lock:
+            cached = self.entries.get(path)
+        if cached is not None and cached[0] == st.st_size and cached[1] == st.st_mtime_ns:
+            meta = cached[2]
+            if meta is None or not meta["cover"] or os.path.exists(meta["cover"]):
+                return meta
+        try:
+            meta = read_metadata(path, self.icon_dir)
+        except (OSError, ValueError, AppImageError, struct.error, zlib.error, lzma.LZMAError) as e:
+            print(f"No se pudieron leer los datos de {path}: {e}")
+            meta = None
+        with self._lock:
+            self.entries[path] = [st.st_size, st.st_mtime_ns, meta]
+            self._dirty = True
+        return meta
+
+    def get_many(self, paths: Iterable[str]) -> Dict[str, Optional[Dict]]:
+        """Lee muchas AppImages en paralelo y guarda la caché al terminar"""
+        paths: List[str] = list(dict.fromkeys(paths))
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            result = dict(zip(paths, pool.map(self.get, paths)))
+        self.save()
+        return result
+
+    def save(self):
+        with self._lock:
+            if not self._dirty:
+                return
+            self._dirty = False
+            data = dict(self.entries)
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            write_json_atomic(self.cache_path, data)
+        except OSError as e:
+            print(f"Error guardando caché de AppImages: {e}")
@@ -0,0 +1,174 @@
+"""Índice de disponibilidad de los ejecutables (requiere GLib/Gio).
+
+Cada ruta se comprueba una sola vez, por lotes y en un hilo aparte; el
+resultado queda en caché. A partir de ahí la caché se mantiene con eventos:
+un Gio.FileMonitor por carpeta contenedora y el Gio.VolumeMonitor para los
+discos que se montan o desmontan. Una biblioteca que no cambia no vuelve a
+hacer ningún stat().
+
+Los monitores gastan vigilancias de inotify, que son pocas y compartidas
+con el resto del sistema: como mucho MAX_MONITORS. Las carpetas que pasan
+de ahí (o que no se pueden vigilar) se revisan cada POLL_SECONDS con un
+stat() de la propia carpeta, en un hilo: si cambió (altas, bajas,
+renombrados), se vuelven a comprobar sus rutas.
+"""
+import os
+import queue
+import stat
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Set
+
+from gi.repository import Gio, GLib
+
+BATCH_SIZE = 500
+MAX_MONITORS = 256      # Carpetas vigiladas con inotify; el resto se revisa cada POLL_SECONDS
+POLL_SECONDS = 30
+
+
+def is_available(path: str) -> bool:
+    """El ejecutable existe, es un fichero regular y se puede ejecutar"""
+    try:
+        return stat.S_ISREG(os.stat(path).st_mode) and os.access(path, os.X_OK)
+    except OSError:
+        return False
+
+
+def dir_signature(directory: str) -> Optional[tuple]:
+    """Cambia si se añade, elimina o renombra algo dentro (None si no existe)"""
+    try:
+        st = os.stat(directory)
+    except OSError:
+        return None
+    return st.st_dev, st.st_ino, st.st_mtime_ns
+
+
+class AvailabilityIndex:
+    def __init__(self, on_changed: Callable[[List[str]], None], batch_size: int = BATCH_SIZE):
+        """on_changed(rutas) se llama en el bucle de GTK cuando cambia el estado de rutas"""
+        self.on_changed = on_changed
+        self.batch_size = batch_size
+        self.status: Dict[str, bool] = {}
+        self.paths_by_dir: Dict[str, Set[str]] = {}
+        self.monitors: Dict[str, Gio.FileMonitor] = {}
+        self.polled: Dict[str, Optional[tuple]] = {}   # Carpetas sin monitor -> última firma
+        self._poll_timer = None
+        self._poller = None
+        self._queued: Set[str] = set()
+        self._queue: "queue.Queue[str]" = queue.Queue()
+        self._worker = None
+        self.volumes = Gio.VolumeMonitor.get()
+        self.volumes.connect("mount-added", self._on_mount_changed)
+        self.volumes.connect("mount-removed", self._on_mount_changed)
+
+    def get(self, path: str) -> Optional[bool]:
+        """True/False si ya se comprobó, None si está pendiente"""
+        return self.status.get(path)
+
+    def check(self, paths: Iterable[str]):
+        """Encola las rutas que aún no están en caché (se puede llamar con toda la biblioteca)"""
+        for path in paths:
+            if path in self.status or path in self._queued:
+                continue
+            self._queued.add(path)
+            self._queue.put(path)
+        if self._worker is None and self._queued:
+            self._worker = threading.Thread(target=self._run, daemon=True)
+            self._worker.start()
+
+    def recheck(self, paths: Iterable[str]):
+        """Invalida rutas concretas y las vuelve a comprobar"""
+        for path in paths:
+            self.status.pop(path, None)
+        self.check(paths)
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            results = {path: is_available(path) for path in batch}
+            GLib.idle_add(self._apply, results)
+
+    def _apply(self, results: Dict[str, bool]):
+        changed = []
+        for path, available in results.items():
+            self._queued.discard(path)
+            if self.status.get(path) != available:
+                changed.append(path)
+            self.status[path] = available
+            self._watch(path)
+        if changed:
+            self.on_changed(changed)
+        return False
+
+    def _watch(self, path: str):
+        directory = os.path.dirname(path)
+        paths = self.paths_by_dir.get(directory)
+        if paths is None:
+            paths = self.paths_by_dir[directory] = set()
+            if not self._monitor(directory):
+                self.polled[directory] = dir_signature(directory)
+                if self._poll_timer is None:
+                    self._poll_timer = GLib.timeout_add_seconds(POLL_SECONDS, self._poll)
+        paths.add(path)
+
+    def _monitor(self, directory: str) -> bool:
+        if len(self.monitors) >= MAX_MONITORS:
+            return False
+        try:
+            monitor = Gio.File.new_for_path(directory).monitor_directory(Gio.FileMonitorFlags.WATCH_MOVES, None)
+        except GLib.Error as e:
+            print(f"No se puede vigilar {directory}: {e.message}")
+            return False
+        monitor.connect("changed", self._on_file_changed, directory)
+        self.monitors[directory] = monitor
+        return True
+
+    def _poll(self):
+        if not self.polled:
+            self._poll_timer = None
+            return False
+        # Una carpeta en un disco dormido o de red puede tardar: fuera del bucle
+        if self._poller is None:
+            self._poller = threading.Thread(target=self._poll_run, args=(list(self.polled),), daemon=True)
+            self._poller.start()
+        return True
+
+    def _poll_run(self, directories: List[str]):
+        GLib.idle_add(self._apply_poll, {d: dir_signature(d) for d in directories})
+
+    def _apply_poll(self, signatures: Dict[str, Optional[tuple]]):
+        self._poller = None
+        for directory, signature in signatures.items():
+            if directory in self.polled and self.polled[directory] != signature:
+                self.polled[directory] = signature
+                self.recheck(list(self.paths_by_dir.get(directory, ())))
+        return False
+
+    def _on_file_changed(self, monitor, file, other_file, event, directory):
+        if event in (Gio.FileMonitorEvent.CHANGES_DONE_HINT, Gio.FileMonitorEvent.CHANGED):
+            return
+        paths = self.paths_by_dir.get(directory, ())
+        touched = {f.get_path() for f in (file, other_file) if f is not None}
+        if directory in touched:
+            # La propia carpeta desapareció (o se desmontó): todas sus rutas
+            self.recheck(list(paths))
+        else:
+            self.recheck([p for p in touched if p in paths])
+
+    def _on_mount_changed(self, volume_monitor, mount):
+        root = mount.get_root().get_path()
+        if not root:
+            return
+        prefix = root.rstrip(os.sep) + os.sep
+        affected = [d for d in self.paths_by_dir if d == root or d.startswith(prefix)]
+        for directory in affected:
+            # Los monitores de un disco desmontado quedan muertos: se recrean
+            monitor = self.monitors.pop(directory, None)
+            if monitor is not None:
+                monitor.cancel()
+            self.polled.pop(directory, None)
+            self.recheck(list(self.paths_by_dir.pop(directory)))
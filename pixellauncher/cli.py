@@ -0,0 +1,130 @@
+"""Modo línea de comandos: gestiona la biblioteca sin interfaz y sin importar GTK.
+
+    gamelauncher --list [--json]
+    gamelauncher --launch NOMBRE
+    gamelauncher --add RUTA [--nombre N] [--categoria C] [--descripcion D] [--tipo T] [--emoji E]
+    gamelauncher --export [FICHERO]
+    gamelauncher --import {steam,lutris,heroic,desktop,todo} [--desde RUTA]
+"""
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+from typing import List
+
+from pixellauncher.core import APP_NAME, APP_VERSION, CACHE_DIR, GamesManager, find_game
+from pixellauncher.model import Game
+from pixellauncher.storage import write_json_games
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="gamelauncher", description=f"{APP_NAME} (modo sin interfaz)")
+    parser.add_argument("--version", action="version", version=f"{APP_NAME} {APP_VERSION}")
+    action = parser.add_mutually_exclusive_group(required=True)
+    action.add_argument("--list", action="store_true", help="lista los juegos de la biblioteca")
+    action.add_argument("--launch", metavar="NOMBRE", help="lanza un juego por su nombre")
+    action.add_argument("--add", metavar="RUTA", help="añade un ejecutable a la biblioteca")
+    action.add_argument("--export", metavar="FICHERO", nargs="?", const="-",
+                        help="exporta la biblioteca en JSON (por defecto a la salida estándar)")
+    action.add_argument("--import", dest="import_from", metavar="FUENTE",
+                        choices=("steam", "lutris", "heroic", "desktop", "todo"),
+                        help="importa los juegos de otro launcher: steam, lutris, heroic, desktop o todo")
+    parser.add_argument("--json", action="store_true", help="con --list, salida en JSON")
+    parser.add_argument("--nombre", help="con --add, nombre del juego (por defecto, el del fichero)")
+    parser.add_argument("--categoria", default="", help="con --add, categoría")
+    parser.add_argument("--descripcion", default="", help="con --add, descripción")
+    parser.add_argument("--tipo", choices=("appimage", "binario"), help="con --add (por defecto, se detecta)")
+    parser.add_argument("--emoji", default="🎮", help="con --add, icono")
+    parser.add_argument("--desde", metavar="RUTA",
+                        help="con --import, carpeta o fichero de origen (por defecto, las ubicaciones habituales)")
+    return parser
+
+
+def cmd_list(as_json: bool) -> int:
+    games = GamesManager.load_games()
+    if as_json:
+        json.dump([game.to_dict() for game in games], sys.stdout, indent=4, ensure_ascii=False)
+        print()
+        return 0
+    for game in games:
+        categoria = f"  [{game.categoria}]" if game.categoria else ""
+        print(f"{game.icono_emoji} {game.nombre}{categoria}  ({game.ruta_ejecutable})")
+    return 0
+
+
+def cmd_launch(name: str) -> int:
+    game = find_game(GamesManager.load_games(), name)
+    if game is None:
+        print(f"No hay ningún juego (o hay varios) que coincida con: {name}", file=sys.stderr)
+        return 1
+    if not GamesManager.launch_game(game):
+        print(f"No se pudo encontrar o ejecutar:\n{game.ruta_ejecutable}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def cmd_add(args) -> int:
+    # Solo aquí: arrastran concurrent.futures, lzma y zlib
+    from pixellauncher.appimage import MetadataCache, fill_game
+    from pixellauncher.importers import path_key
+    from pixellauncher.scanner import classify, game_name
+
+    ruta = os.path.abspath(args.add)
+    # La misma comprobación que los importadores: una ruta, un juego
+    key = path_key(ruta)
+    existing = next((g for g in GamesManager.load_games() if path_key(g.ruta_ejecutable) == key), None)
+    if existing is not None:
+        print(f"Ya está en la biblioteca: {existing.nombre} (id {existing.id})")
+        return 0
+    tipo = args.tipo or classify(ruta) or "binario"
+    game = Game(nombre=args.nombre or game_name(ruta, tipo), ruta_ejecutable=ruta,
+                descripcion=args.descripcion, categoria=args.categoria, tipo=tipo, icono_emoji=args.emoji)
+    if tipo == "appimage":
+        # Lo que no se pasó por argumento sale del .desktop de la AppImage
+        cache = MetadataCache(CACHE_DIR / "appimage-meta.json", CACHE_DIR / "appimage-icons")
+        meta = cache.get(ruta)
+        cache.save()
+        if meta is not None:
+            fill_game(game, meta)
+    if not GamesManager.add_game(game):
+        return 1
+    print(f"Añadido: {game.nombre} (id {game.id})")
+    return 0
+
+
+def cmd_import(source: str, path: str) -> int:
+    from pixellauncher.importers import SOURCES, BulkImporter
+
+    sources = [(s, None) for s in SOURCES] if source == "todo" else [(source, path)]
+    importer = BulkImporter(game.ruta_ejecutable for game in GamesManager.load_games())
+    games = importer.run(sources)
+    if games and not GamesManager.add_games(games):
+        return 1
+    stats = importer.stats
+    print(f"Importados {len(games)} juegos ({stats['duplicates']} ya estaban, {stats['skipped']} omitidos)")
+    return 0
+
+
+def cmd_export(target: str) -> int:
+    games = GamesManager.load_games()
+    if target == "-":
+        json.dump([game.to_dict() for game in games], sys.stdout, indent=4, ensure_ascii=False)
+        print()
+        return 0
+    write_json_games(Path(target), games)
+    print(f"Exportados {len(games)} juegos a {target}")
+    return 0
+
+
+def run(argv: List[str]) -> int:
+    args = build_parser().parse_args(argv)
+    if args.list:
+        return cmd_list(args.json)
+    if args.launch is not None:
+        return cmd_launch(args.launch)
+    if args.add is not None:
+        return cmd_add(args)
+    if args.import_from is not None:
+        return cmd_import(args.import_from, args.desde)
+    return cmd_export(args.export)
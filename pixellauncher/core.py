@@ -0,0 +1,174 @@
+"""Configuración y lógica de la biblioteca, sin dependencias de GTK.
+
+Lo importan tanto la interfaz (pixellauncher.gui) como la línea de comandos
+(pixellauncher.cli); importarlo no carga gi ni crea directorios.
+"""
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, List, Optional
+
+from pixellauncher.launch import build_command, build_env, executable, spawn
+from pixellauncher.model import Game
+from pixellauncher.search import fold
+from pixellauncher.storage import Storage, open_storage
+from pixellauncher.trace import traced
+
+if TYPE_CHECKING:
+    from pixellauncher.supervisor import ProcessSupervisor
+
+# ============================================================================
+# CONFIGURACIÓN Y CONSTANTES ;)
+# ============================================================================
+APP_NAME = "Pixel Launcher Pro"
+APP_ID = "io.github.retired64.PixelLauncher"   # Nombre en el bus de sesión (instancia única)
+APP_VERSION = "3.0"
+CONFIG_DIR = Path.home() / ".local" / "share" / "pixel-launcher"
+GAMES_JSON = CONFIG_DIR / "games.json"
+SETTINGS_JSON = CONFIG_DIR / "settings.json"
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "pixel-launcher"
+STORAGE_BACKEND = os.environ.get("PIXEL_LAUNCHER_STORAGE", "sqlite")  # "sqlite" o "json"
+STARTUP_TIMING = os.environ.get("PIXEL_LAUNCHER_TIMING", "")   # "1" informa, "exit" informa y sale
+SYNC_DEBOUNCE_MS = 300       # Espera tras el último cambio externo antes de releer
+FIRST_BATCH = 50             # Juegos del primer lote (primera pantalla)
+LOAD_BATCH = 1000            # Juegos por lote en el resto de la carga
+
+
+def find_game(games: Iterable[Game], name: str) -> Optional[Game]:
+    """Coincidencia exacta (sin tildes ni mayúsculas) o, si no, prefijo único"""
+    wanted = fold(name)
+    folded = [(fold(g.nombre), g) for g in games]
+    exact = [g for nombre, g in folded if nombre == wanted]
+    if exact:
+        return exact[0]
+    prefix = [g for nombre, g in folded if nombre.startswith(wanted)]
+    return prefix[0] if len(prefix) == 1 else None
+
+
+def ensure_config_dir():
+    """Crea el directorio de datos si no existe (solo cuando hace falta)"""
+    CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+
+
+# ============================================================================
+# LÓGICA DE NEGOCIO (MODEL)
+# ============================================================================
+class GamesManager:
+    _storage: Optional[Storage] = None
+
+    @classmethod
+    def storage(cls) -> Storage:
+        if cls._storage is None:
+            ensure_config_dir()
+            cls._storage = open_storage(CONFIG_DIR, STORAGE_BACKEND)
+        return cls._storage
+
+    @classmethod
+    @traced
+    def load_games(cls) -> List[Game]:
+        try:
+            return cls.storage().load()
+        except Exception as e:
+            print(f"Error cargando biblioteca: {e}")
+            return []
+
+    @classmethod
+    def iter_games(cls, batch_size: int = LOAD_BATCH):
+        """Carga la biblioteca por lotes (se puede usar desde un hilo)"""
+        try:
+            yield from cls.storage().iter_batches(batch_size)
+        except Exception as e:
+            print(f"Error cargando biblioteca: {e}")
+
+    @classmethod
+    @traced
+    def save_games(cls, games: List[Game]) -> bool:
+        """Reescribe la biblioteca completa (compatibilidad; preferir add/remove)"""
+        try:
+            cls.storage().save(games)
+            return True
+        except Exception as e:
+            print(f"Error guardando biblioteca: {e}")
+            return False
+
+    @classmethod
+    @traced
+    def add_game(cls, game: Game) -> bool:
+        try:
+            cls.storage().add(game)
+            return True
+        except Exception as e:
+            print(f"Error guardando juego: {e}")
+            return False
+
+    @classmethod
+    @traced
+    def add_games(cls, games: List[Game]) -> bool:
+        """Guarda un lote de juegos nuevos en una sola escritura"""
+        try:
+            cls.storage().add_many(games)
+            return True
+        except Exception as e:
+            print(f"Error guardando juegos: {e}")
+            return False
+
+    @classmethod
+    @traced
+    def update_game(cls, game: Game) -> bool:
+        try:
+            cls.storage().update(game)
+            return True
+        except Exception as e:
+            print(f"Error guardando juego: {e}")
+            return False
+
+    @classmethod
+    @traced
+    def remove_game(cls, game: Game) -> bool:
+        try:
+            cls.storage().remove(game)
+            return True
+        except Exception as e:
+            print(f"Error eliminando juego: {e}")
+            return False
+
+    @classmethod
+    def watch_paths(cls) -> List[Path]:
+        return cls.storage().watch_paths()
+
+    @classmethod
+    def has_external_changes(cls) -> bool:
+        try:
+            return cls.storage().has_external_changes()
+        except Exception as e:
+            print(f"Error consultando biblioteca: {e}")
+            return False
+
+    @classmethod
+    @traced
+    def reload_games(cls) -> Optional[List[Game]]:
+        """Relee la biblioteca del disco (None si falla: no es lo mismo que vacía)"""
+        try:
+            return cls.storage().reload()
+        except Exception as e:
+            print(f"Error recargando biblioteca: {e}")
+            return None
+
+    @staticmethod
+    @traced
+    def launch_game(game: Game, supervisor: Optional["ProcessSupervisor"] = None) -> bool:
+        """Lanza el juego; con supervisor, este se queda con el proceso y lo recoge al terminar"""
+        if not os.path.exists(executable(game)):
+            return False
+            
+        argv, cwd = build_command(game)
+        env = build_env(game)
+        try:
+            if supervisor is not None:
+                if not supervisor.is_running(game.id):
+                    supervisor.launch(game.id, argv, cwd, env, game.perfil)
+            else:
+                spawn(argv, cwd, env, game.perfil)
+            return True
+        except Exception as e:
+            print(f"Error launch: {e}")
+            return False
@@ -0,0 +1,197 @@
+"""Portadas de los juegos (requiere GdkPixbuf/GLib).
+
+Las imágenes se decodifican y reducen en hilos aparte, nunca en el bucle de
+GTK. Cada miniatura se guarda en disco (CACHE_DIR/covers) con el hash del
+contenido de la imagen original y el tamaño como nombre, así que dos juegos
+con la misma portada comparten miniatura y una portada modificada genera
+otra. Un índice (ruta, tamaño, mtime) -> hash evita releer las originales
+que no han cambiado.
+
+En memoria se guarda un LRU de pixbufs limitado en bytes. Las peticiones se
+atienden en orden inverso (LIFO): al desplazarse rápido por la lista se
+cargan primero las filas que se acaban de hacer visibles.
+"""
+import hashlib
+import json
+import os
+import queue
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+import gi
+gi.require_version('GdkPixbuf', '2.0')
+from gi.repository import GdkPixbuf, GLib
+
+from pixellauncher.storage import write_json_atomic
+from pixellauncher import trace
+from pixellauncher.trace import span
+
+DEFAULT_CACHE_BYTES = 64 * 1024 * 1024
+WORKERS = 2
+
+Key = Tuple[str, int]
+Callback = Callable[[str, int, Optional[GdkPixbuf.Pixbuf]], None]
+
+
+def file_digest(path: str) -> str:
+    h = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class CoverCache:
+    def __init__(self, cache_dir: Path, max_bytes: int = DEFAULT_CACHE_BYTES, workers: int = WORKERS):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.memory: "OrderedDict[Key, GdkPixbuf.Pixbuf]" = OrderedDict()
+        self.pending: Dict[Key, List[Callback]] = {}
+        self.failed = set()          # Portadas que no se pudieron leer: no se reintentan
+        self.stats = {"hits": 0, "disk": 0, "decoded": 0, "failed": 0}
+        self._queue: "queue.LifoQueue[Key]" = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()   # Un solo hilo escribe el índice a la vez
+        self._index_path = cache_dir / "index.json"
+        self._index_dirty = False
+        self._index = self._load_index()   # ruta -> [tamaño, mtime_ns, hash]
+        for _ in range(workers):
+            threading.Thread(target=self._run, daemon=True).start()
+
+    def _load_index(self) -> Dict[str, list]:
+        try:
+            with open(self._index_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_index(self):
+        with self._save_lock:
+            with self._lock:
+                if not self._index_dirty:
+                    return
+                self._index_dirty = False
+                data = dict(self._index)
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                write_json_atomic(self._index_path, data)
+            except OSError as e:
+                print(f"Error guardando índice de portadas: {e}")
+
+    def get(self, path: str, size: int) -> Optional[GdkPixbuf.Pixbuf]:
+        """La miniatura si ya está en memoria (solo desde el bucle de GTK)"""
+        pixbuf = self.memory.get((path, size))
+        if pixbuf is not None:
+            self.memory.move_to_end((path, size))
+            self.stats["hits"] += 1
+        return pixbuf
+
+    def request(self, path: str, size: int, callback: Callback) -> Optional[GdkPixbuf.Pixbuf]:
+        """Devuelve la miniatura si está en memoria; si no, la pide y devuelve None.
+
+        callback(ruta, tamaño, pixbuf o None) se llama en el bucle de GTK
+        cuando está lista. Las peticiones repetidas se agrupan.
+        """
+        pixbuf = self.get(path, size)
+        if pixbuf is not None:
+            return pixbuf
+        key = (path, size)
+        if key in self.failed:
+            return None
+        callbacks = self.pending.get(key)
+        if callbacks is None:
+            self.pending[key] = [callback]
+            self._queue.put(key)
+        else:
+            callbacks.append(callback)
+        return None
+
+    def set_max_bytes(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._evict()
+
+    def _evict(self):
+        while self.bytes > self.max_bytes and len(self.memory) > 1:
+            _, old = self.memory.popitem(last=False)
+            self.bytes -= old.get_byte_length()
+
+    def _run(self):
+        while True:
+            key = self._queue.get()
+            try:
+                pixbuf = self._load(*key)
+            except (OSError, GLib.Error) as e:
+                print(f"No se pudo cargar la portada {key[0]}: {e}")
+                pixbuf = None
+                self._count("failed")
+            GLib.idle_add(self._deliver, key, pixbuf)
+            if self._queue.empty():
+                self._save_index()
+
+    def _count(self, key: str):
+        with self._lock:
+            self.stats[key] += 1
+
+    def _digest(self, path: str) -> str:
+        st = os.stat(path)
+        with self._lock:
+            entry = self._index.get(path)
+        if entry is not None and entry[0] == st.st_size and entry[1] == st.st_mtime_ns:
+            return entry[2]
+        # Rutas calientes: con la traza apagada, ni siquiera el with vacío
+        if trace.ENABLED:
+            with span("portada: hash", "covers"):
+                digest = file_digest(path)
+        else:
+            digest = file_digest(path)
+        with self._lock:
+            self._index[path] = [st.st_size, st.st_mtime_ns, digest]
+            self._index_dirty = True
+        return digest
+
+    def _load(self, path: str, size: int) -> GdkPixbuf.Pixbuf:
+        """En un hilo: miniatura de disco o, si no existe, decodificar y guardarla"""
+        thumb = self.cache_dir / f"{self._digest(path)}-{size}.png"
+        try:
+            if trace.ENABLED:
+                with span("portada: leer miniatura", "covers"):
+                    pixbuf = GdkPixbuf.Pixbuf.new_from_file(str(thumb))
+            else:
+                pixbuf = GdkPixbuf.Pixbuf.new_from_file(str(thumb))
+            self._count("disk")
+            return pixbuf
+        except GLib.Error:
+            pass
+        # new_from_file_at_scale reduce mientras decodifica (JPEG a 1/2, 1/4, 1/8)
+        if trace.ENABLED:
+            with span("portada: decodificar", "covers"):
+                pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(path, size, size, True)
+        else:
+            pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(path, size, size, True)
+        self._count("decoded")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp = thumb.with_suffix(f".{threading.get_ident()}.tmp")
+            if trace.ENABLED:
+                with span("portada: guardar miniatura", "covers"):
+                    pixbuf.savev(str(tmp), "png", [], [])
+            else:
+                pixbuf.savev(str(tmp), "png", [], [])
+            os.replace(tmp, thumb)
+        except (OSError, GLib.Error) as e:
+            print(f"Error guardando miniatura: {e}")
+        return pixbuf
+
+    def _deliver(self, key: Key, pixbuf: Optional[GdkPixbuf.Pixbuf]):
+        if pixbuf is None:
+            self.failed.add(key)
+        elif key not in self.memory:
+            self.memory[key] = pixbuf
+            self.bytes += pixbuf.get_byte_length()
+            self._evict()
+        for callback in self.pending.pop(key, ()):
+            callback(key[0], key[1], pixbuf)
+        return False
@@ -0,0 +1,1565 @@
+"""Interfaz GTK de Pixel Launcher: estilos, barra lateral, tarjeta, diálogos y ventana."""
+import gi
+import itertools
+import os
+import shlex
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import List, Dict, Optional, Tuple
+
+from pixellauncher.appimage import MetadataCache, fill_game
+from pixellauncher.availability import AvailabilityIndex
+from pixellauncher.core import (APP_ID, APP_NAME, CACHE_DIR, CONFIG_DIR, FIRST_BATCH, SETTINGS_JSON,
+                                STARTUP_TIMING, SYNC_DEBOUNCE_MS, GamesManager, find_game)
+from pixellauncher.covers import CoverCache
+from pixellauncher.importers import BulkImporter, path_key
+from pixellauncher.instance import acquire_lock, remote_launch_name
+from pixellauncher.launch import CLIENTS, executable, prewarm
+from pixellauncher.model import Game
+from pixellauncher.profiles import (IO_DEFAULT_LEVEL, LaunchProfile, format_cpus, format_env, parse_cpus,
+                                    parse_env, parse_nice)
+from pixellauncher.scanner import LibraryScanner, classify
+from pixellauncher.search import SearchIndex
+from pixellauncher.settings import load_settings, save_settings
+from pixellauncher.sorting import MODES, STATS_MODES, SortIndex, group_of
+from pixellauncher.stats import GameStats, StatsStore
+from pixellauncher.supervisor import ProcessSupervisor, Session
+from pixellauncher.sync import LibraryDiff, diff_library, same_game
+from pixellauncher.timing import process_uptime
+from pixellauncher.trace import span, start_watchdog, traced
+
+gi.require_version('Gtk', '3.0')
+from gi.repository import Gtk, Gdk, GdkPixbuf, Gio, GLib, GObject, Pango
+gi.repository.GLib.set_prgname('pixellauncher')
+
+ROW_HEIGHT = 56            # Alto fijo de las filas de la barra lateral
+ROW_COVER = 40             # Lado máximo de la portada en la barra lateral
+CARD_COVER = 240           # Lado máximo de la portada en la tarjeta de detalles
+
+# Temas: pixel.css (base) y encima el modo de renderizado (normal.css o rendimiento.css).
+# THEME_BUNDLE es el paquete precompilado de themes.gresource.xml; si no está
+# (p. ej. desde el código fuente sin compilarlo) se leen los .css de THEMES_DIR.
+THEMES_DIR = Path(__file__).resolve().parent / "themes"
+THEME_BUNDLE = THEMES_DIR / "themes.gresource"
+THEME_PREFIX = "/io/github/retired64/PixelLauncher/themes/"
+RENDER_MODES = {
+    "normal": "Completos",                 # Sombras, degradados y transiciones
+    "rendimiento": "Rendimiento",          # Colores planos: menos coste al repintar
+}
+
+# ============================================================================
+# GESTOR DE ESTILOS CSS (THEMING)
+# ============================================================================
+class StyleManager:
+    bundle = None          # None: sin mirar aún; True/False: THEME_BUNDLE registrado o no
+    mode = None
+    _providers = {}        # Hoja -> Gtk.CssProvider ya cargado (cambiar de modo no vuelve a leerla)
+    _animations = None     # gtk-enable-animations del escritorio, para el modo normal
+
+    @classmethod
+    @traced
+    def load_css(cls):
+        """Tema base; el modo lo fija la ventana con set_mode() según las preferencias"""
+        Gtk.StyleContext.add_provider_for_screen(
+            Gdk.Screen.get_default(),
+            cls._provider("pixel.css"),
+            Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
+        )
+
+    @classmethod
+    @traced
+    def set_mode(cls, mode: str):
+        if mode not in RENDER_MODES:
+            mode = "normal"
+        if mode == cls.mode:
+            return
+        screen = Gdk.Screen.get_default()
+        if cls.mode is not None:
+            Gtk.StyleContext.remove_provider_for_screen(screen, cls._provider(f"{cls.mode}.css"))
+        # Por encima del tema base y del de GTK: en GTK 3 gana la prioridad, no la especificidad
+        Gtk.StyleContext.add_provider_for_screen(
+            screen,
+            cls._provider(f"{mode}.css"),
+            Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION + 1
+        )
+        # Sin animaciones GTK no ejecuta ninguna transición (tampoco las de sus widgets)
+        settings = Gtk.Settings.get_default()
+        if cls._animations is None:
+            cls._animations = settings.props.gtk_enable_animations
+        settings.props.gtk_enable_animations = cls._animations and mode == "normal"
+        cls.mode = mode
+
+    @classmethod
+    def _provider(cls, name: str) -> Gtk.CssProvider:
+        provider = cls._providers.get(name)
+        if provider is not None:
+            return provider
+        provider = cls._providers[name] = Gtk.CssProvider()
+        try:
+            if cls._register():
+                provider.load_from_resource(THEME_PREFIX + name)
+            else:
+                provider.load_from_path(str(THEMES_DIR / name))
+        except GLib.Error as e:
+            print(f"Error cargando el tema {name}: {e.message}")
+        return provider
+
+    @classmethod
+    def _register(cls) -> bool:
+        if cls.bundle is None:
+            cls.bundle = False
+            if THEME_BUNDLE.exists():
+                try:
+                    Gio.resources_register(Gio.Resource.load(str(THEME_BUNDLE)))
+                    cls.bundle = True
+                except GLib.Error as e:
+                    print(f"Error cargando {THEME_BUNDLE.name}: {e.message}")
+        return cls.bundle
+
+# ============================================================================
+# TARJETA DE DETALLES (VIEW)
+# ============================================================================
+class DetailCard(Gtk.Box):
+    """Tarjeta con los datos del juego seleccionado.
+
+    Se construye una vez; cambiar de juego solo actualiza los textos.
+    """
+    def __init__(self, on_launch, on_delete, on_stop, on_edit):
+        super().__init__(orientation=Gtk.Orientation.VERTICAL, spacing=20)
+        self.get_style_context().add_class("card")
+        self.set_size_request(500, -1) # Ancho mínimo
+        
+        # 1. Icono Gigante (el tamaño va en atributos: no se re-parsea markup)
+        icon_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
+        icon_box.set_size_request(-1, 150)
+        icon_attrs = Pango.AttrList()
+        icon_attrs.insert(Pango.attr_size_new(80000))
+        self.lbl_icon = Gtk.Label()
+        self.lbl_icon.set_attributes(icon_attrs)
+        self.lbl_icon.get_style_context().add_class("emoji-icon")
+        icon_box.pack_start(self.lbl_icon, True, True, 0)
+        self.img_cover = Gtk.Image()
+        self.img_cover.set_no_show_all(True)
+        icon_box.pack_start(self.img_cover, True, True, 0)
+        self.pack_start(icon_box, False, False, 0)
+        
+        # 2. Título y Metadata
+        title_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=5)
+        self.lbl_title = Gtk.Label()
+        self.lbl_title.get_style_context().add_class("game-title")
+        
+        self.lbl_desc = Gtk.Label()
+        self.lbl_desc.set_max_width_chars(40)
+        self.lbl_desc.set_line_wrap(True)
+        self.lbl_desc.set_justify(Gtk.Justification.CENTER)
+        self.lbl_desc.get_style_context().add_class("game-subtitle")
+        
+        title_box.pack_start(self.lbl_title, False, False, 0)
+        title_box.pack_start(self.lbl_desc, False, False, 0)
+        self.pack_start(title_box, False, False, 10)
+        
+        # Separador visual
+        sep = Gtk.Separator(orientation=Gtk.Orientation.HORIZONTAL)
+        self.pack_start(sep, False, False, 10)
+        
+        # 3. Información Técnica
+        self.grid_info = Gtk.Grid(column_spacing=20, row_spacing=10)
+        self.grid_info.set_halign(Gtk.Align.CENTER)
+        self.lbl_categoria = self.add_info_row("Categoría:", 0)
+        self.lbl_tipo = self.add_info_row("Tipo:", 1)
+        self.lbl_ruta = self.add_info_row("Ruta:", 2)
+        self.lbl_estado = self.add_info_row("Estado:", 3)
+        self.lbl_perfil = self.add_info_row("Perfil:", 4)
+        self.lbl_jugado = self.add_info_row("Tiempo jugado:", 5)
+        self.lbl_ultima = self.add_info_row("Última vez:", 6)
+        self.pack_start(self.grid_info, False, False, 10)
+        
+        # 4. Botones de Acción
+        action_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=15)
+        action_box.set_halign(Gtk.Align.CENTER)
+        action_box.set_margin_top(20)
+        
+        self.btn_launch = btn_launch = Gtk.Button(label="LANZAR JUEGO")
+        btn_launch.get_style_context().add_class("suggested-action")
+        btn_launch.set_size_request(200, 50)
+        btn_launch.connect("clicked", lambda x: on_launch())
+        
+        self.btn_stop = Gtk.Button(label="⏹ Detener")
+        self.btn_stop.connect("clicked", lambda x: on_stop())
+        self.btn_stop.set_no_show_all(True)
+        
+        btn_edit = Gtk.Button(label="✏ Editar")
+        btn_edit.connect("clicked", lambda x: on_edit())
+
+        btn_del = Gtk.Button(label="🗑 Eliminar")
+        btn_del.get_style_context().add_class("destructive-action")
+        btn_del.connect("clicked", lambda x: on_delete())
+        
+        action_box.pack_start(btn_launch, False, False, 0)
+        action_box.pack_start(self.btn_stop, False, False, 0)
+        action_box.pack_start(btn_edit, False, False, 0)
+        action_box.pack_start(btn_del, False, False, 0)
+        
+        self.pack_start(action_box, False, False, 0)
+
+    def add_info_row(self, label, row_idx) -> Gtk.Label:
+        l = Gtk.Label(label=label, xalign=1)
+        l.get_style_context().add_class("dim-label")
+        v = Gtk.Label(xalign=0)
+        v.set_ellipsize(Pango.EllipsizeMode.MIDDLE)
+        v.set_max_width_chars(30)
+        self.grid_info.attach(l, 0, row_idx, 1, 1)
+        self.grid_info.attach(v, 1, row_idx, 1, 1)
+        return v
+
+    def set_game(self, game: Game):
+        self.lbl_icon.set_text(game.icono_emoji)
+        self.lbl_title.set_text(game.nombre)
+        self.lbl_desc.set_text(game.descripcion or "Sin descripción")
+        self.lbl_categoria.set_text(game.categoria or "-")
+        self.lbl_tipo.set_text(game.tipo.capitalize())
+        self.lbl_ruta.set_text(game.ruta_ejecutable)
+        self.lbl_perfil.set_text(game.perfil.summary() if game.perfil else "-")
+
+    def set_stats(self, stats: Optional[GameStats]):
+        if stats is None or not stats.launches:
+            self.lbl_jugado.set_text("-")
+            self.lbl_ultima.set_text("Nunca")
+            return
+        minutes = int(stats.playtime // 60)
+        played = f"{minutes // 60} h {minutes % 60} min" if minutes >= 60 else f"{minutes} min"
+        self.lbl_jugado.set_text(f"{played} ({stats.launches} {'partida' if stats.launches == 1 else 'partidas'})")
+        self.lbl_ultima.set_text(time.strftime("%d/%m/%Y %H:%M", time.localtime(stats.last_played)))
+
+    def set_cover(self, pixbuf: Optional[GdkPixbuf.Pixbuf]):
+        """Portada en lugar del emoji (None: vuelve el emoji)"""
+        self.img_cover.set_from_pixbuf(pixbuf)
+        self.img_cover.set_visible(pixbuf is not None)
+        self.lbl_icon.set_visible(pixbuf is None)
+
+    def set_running(self, running: bool):
+        """Mientras el juego está abierto no se puede lanzar otra vez"""
+        self.btn_launch.set_label("EN EJECUCIÓN" if running else "LANZAR JUEGO")
+        self.btn_launch.set_sensitive(not running)
+        self.btn_stop.set_visible(running)
+
+    def set_available(self, available: Optional[bool]):
+        if available is None:
+            self.lbl_estado.set_text("Comprobando…")
+        else:
+            self.lbl_estado.set_text("✔ Disponible" if available else "⚠ Ejecutable no encontrado")
+
+# ============================================================================
+# DIÁLOGO AGREGAR / EDITAR JUEGO (VIEW)
+# ============================================================================
+class GameDialog(Gtk.Dialog):
+    def __init__(self, parent, metadata: Optional[MetadataCache] = None, game: Optional[Game] = None):
+        """Con game, edita ese juego (get_data conserva su ID)"""
+        super().__init__(title="Editar Juego" if game else "Agregar Nuevo Juego", transient_for=parent, flags=0)
+        self.metadata = metadata
+        self.game = game
+        self.set_default_size(500, 450)
+        self.set_modal(True)
+        
+        # HeaderBar personalizada para el diálogo
+        header = Gtk.HeaderBar(title="Editar Juego" if game else "Agregar Juego")
+        header.set_show_close_button(False)
+        self.set_titlebar(header)
+        
+        # Botones de acción
+        btn_cancel = Gtk.Button(label="Cancelar")
+        btn_cancel.connect("clicked", lambda x: self.response(Gtk.ResponseType.CANCEL))
+        header.pack_start(btn_cancel)
+        
+        btn_add = Gtk.Button(label="Guardar")
+        btn_add.get_style_context().add_class("suggested-action")
+        btn_add.connect("clicked", lambda x: self.validate() and self.response(Gtk.ResponseType.OK))
+        header.pack_end(btn_add)
+
+        # Contenido
+        content_area = self.get_content_area()
+        content_area.set_spacing(0)
+        
+        # Grid layout para formulario
+        grid = Gtk.Grid(column_spacing=15, row_spacing=15)
+        grid.set_margin_top(20)
+        grid.set_margin_bottom(20)
+        grid.set_margin_start(20)
+        grid.set_margin_end(20)
+        
+        # Helpers para crear campos
+        row = 0
+        self.entries = {}
+        
+        def add_field(label_text, key, placeholder="", is_combo=False):
+            nonlocal row
+            lbl = Gtk.Label(label=label_text, xalign=0)
+            lbl.get_style_context().add_class("dim-label")
+            grid.attach(lbl, 0, row, 1, 1)
+            
+            if is_combo:
+                widget = Gtk.ComboBoxText()
+                widget.append("appimage", "AppImage (Portable)")
+                widget.append("binario", "Binario (Carpeta Local)")
+                # Importados de otros launchers: la ruta es un URI que abre su cliente
+                for client in CLIENTS:
+                    widget.append(client, f"{client.capitalize()} (lo abre su cliente)")
+                widget.set_active(0)
+                self.entries[key] = widget
+            else:
+                widget = Gtk.Entry()
+                widget.set_placeholder_text(placeholder)
+                self.entries[key] = widget
+                
+            grid.attach(widget, 1, row, 1, 1)
+            row += 1
+
+        add_field("Nombre:", "nombre", "Ej: Cyberpunk 2077")
+        add_field("Categoría:", "categoria", "Ej: RPG, Acción")
+        add_field("Descripción:", "descripcion", "Breve descripción...")
+        add_field("Emoji/Icono:", "icono_emoji", "🎮")
+        self.entries["icono_emoji"].set_max_length(2)
+        add_field("Tipo:", "tipo", is_combo=True)
+        
+        # Selector de archivo especial
+        lbl_ruta = Gtk.Label(label="Ejecutable:", xalign=0)
+        grid.attach(lbl_ruta, 0, row, 1, 1)
+        
+        ruta_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=5)
+        self.entries["ruta_ejecutable"] = Gtk.Entry()
+        self.entries["ruta_ejecutable"].set_placeholder_text("/ruta/al/juego")
+        ruta_box.pack_start(self.entries["ruta_ejecutable"], True, True, 0)
+        
+        btn_file = Gtk.Button(label="📂")
+        btn_file.connect("clicked", self.on_file_clicked)
+        ruta_box.pack_start(btn_file, False, False, 0)
+        
+        grid.attach(ruta_box, 1, row, 1, 1)
+        row += 1
+
+        # Portada (opcional)
+        lbl_cover = Gtk.Label(label="Portada:", xalign=0)
+        lbl_cover.get_style_context().add_class("dim-label")
+        grid.attach(lbl_cover, 0, row, 1, 1)
+
+        cover_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=5)
+        self.entries["cover"] = Gtk.Entry()
+        self.entries["cover"].set_placeholder_text("Imagen PNG/JPEG (opcional)")
+        cover_box.pack_start(self.entries["cover"], True, True, 0)
+
+        btn_cover = Gtk.Button(label="🖼")
+        btn_cover.connect("clicked", self.on_cover_clicked)
+        cover_box.pack_start(btn_cover, False, False, 0)
+
+        grid.attach(cover_box, 1, row, 1, 1)
+        row += 1
+
+        # Perfil de lanzamiento (opcional, plegado)
+        expander = Gtk.Expander(label="Perfil de lanzamiento")
+        profile_grid = Gtk.Grid(column_spacing=15, row_spacing=10)
+        profile_grid.set_margin_top(10)
+        profile_row = 0
+
+        def add_profile_field(label_text, key, placeholder, tooltip):
+            nonlocal profile_row
+            lbl = Gtk.Label(label=label_text, xalign=0)
+            lbl.get_style_context().add_class("dim-label")
+            profile_grid.attach(lbl, 0, profile_row, 1, 1)
+            widget = self.entries[key] = Gtk.Entry(hexpand=True)
+            widget.set_placeholder_text(placeholder)
+            widget.set_tooltip_text(tooltip)
+            widget.connect("changed", lambda w: w.get_style_context().remove_class("error"))
+            profile_grid.attach(widget, 1, profile_row, 1, 1)
+            profile_row += 1
+
+        add_profile_field("CPUs:", "cpus", "Todas (ej: 2-5,8)", "Núcleos en los que puede correr el juego")
+        add_profile_field("Nice:", "nice", "Sin cambios (-20 a 19)", "Prioridad de CPU: más alto, menos prioridad")
+
+        lbl_io = Gtk.Label(label="E/S de disco:", xalign=0)
+        lbl_io.get_style_context().add_class("dim-label")
+        profile_grid.attach(lbl_io, 0, profile_row, 1, 1)
+        io_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=5)
+        self.entries["io_clase"] = Gtk.ComboBoxText()
+        self.entries["io_clase"].append("", "Sin cambios")
+        self.entries["io_clase"].append("best-effort", "Normal (best-effort)")
+        self.entries["io_clase"].append("idle", "Solo en reposo (idle)")
+        self.entries["io_clase"].append("realtime", "Tiempo real (requiere privilegios)")
+        self.entries["io_clase"].set_active_id("")
+        io_box.pack_start(self.entries["io_clase"], True, True, 0)
+        self.entries["io_nivel"] = Gtk.SpinButton.new_with_range(0, 7, 1)
+        self.entries["io_nivel"].set_value(IO_DEFAULT_LEVEL)
+        self.entries["io_nivel"].set_tooltip_text("Nivel dentro de la clase: 0 más prioridad, 7 menos")
+        self.entries["io_clase"].connect("changed", lambda w: self.entries["io_nivel"].set_sensitive(
+            w.get_active_id() in ("best-effort", "realtime")))
+        self.entries["io_nivel"].set_sensitive(False)
+        io_box.pack_start(self.entries["io_nivel"], False, False, 0)
+        profile_grid.attach(io_box, 1, profile_row, 1, 1)
+        profile_row += 1
+
+        add_profile_field("Entorno:", "entorno", "VARIABLE=valor …", "Variables que se añaden al entorno del juego")
+        add_profile_field("Envoltorio:", "envoltorio", "Ej: gamemoderun mangohud",
+                          "Órdenes que arrancan el juego (sin shell)")
+        expander.add(profile_grid)
+        grid.attach(expander, 0, row, 2, 1)
+        row += 1
+
+        # Qué falta o qué no se entiende al pulsar Guardar
+        self.lbl_error = Gtk.Label(xalign=0)
+        self.lbl_error.get_style_context().add_class("error")
+        self.lbl_error.set_no_show_all(True)
+        grid.attach(self.lbl_error, 0, row, 2, 1)
+        for key in ("nombre", "ruta_ejecutable"):
+            self.entries[key].connect("changed", lambda w: w.get_style_context().remove_class("error"))
+
+        if game is not None:
+            self.fill(game)
+            expander.set_expanded(bool(game.perfil))
+        
+        content_area.pack_start(grid, True, True, 0)
+        self.show_all()
+
+    def fill(self, game: Game):
+        for key in ("nombre", "categoria", "descripcion", "icono_emoji", "ruta_ejecutable", "cover"):
+            self.entries[key].set_text(getattr(game, key))
+        if not self.entries["tipo"].set_active_id(game.tipo):
+            # Un tipo que el diálogo no conoce se conserva tal cual al guardar
+            self.entries["tipo"].append(game.tipo, game.tipo)
+            self.entries["tipo"].set_active_id(game.tipo)
+        profile = game.perfil or LaunchProfile()
+        self.entries["cpus"].set_text(format_cpus(profile.cpus))
+        self.entries["nice"].set_text("" if profile.nice is None else str(profile.nice))
+        self.entries["io_clase"].set_active_id(profile.io_class)
+        if profile.io_level is not None:
+            self.entries["io_nivel"].set_value(profile.io_level)
+        self.entries["entorno"].set_text(format_env(profile.env))
+        self.entries["envoltorio"].set_text(profile.wrapper)
+
+    def read_profile(self) -> Optional[LaunchProfile]:
+        """El perfil de los campos (ValueError con la clave del campo no válido)"""
+        profile = LaunchProfile(io_class=self.entries["io_clase"].get_active_id() or "",
+                                wrapper=self.entries["envoltorio"].get_text().strip())
+        if profile.io_class in ("best-effort", "realtime"):
+            profile.io_level = self.entries["io_nivel"].get_value_as_int()
+        for key, attr, parse in (("cpus", "cpus", parse_cpus), ("nice", "nice", parse_nice),
+                                 ("entorno", "env", parse_env), ("envoltorio", "wrapper", shlex.split)):
+            text = self.entries[key].get_text().strip()
+            try:
+                value = parse(text) if text else None
+            except ValueError:
+                raise ValueError(key)
+            if value is not None and key != "envoltorio":
+                setattr(profile, attr, value)
+        return profile or None
+
+    def validate(self) -> bool:
+        """Marca el campo que falta o que no se entiende y deja el diálogo abierto"""
+        key, message = None, ""
+        for required, label in (("nombre", "el nombre"), ("ruta_ejecutable", "el ejecutable")):
+            if not self.entries[required].get_text().strip():
+                key, message = required, f"Falta {label}"
+                break
+        else:
+            try:
+                self.read_profile()
+                return True
+            except ValueError as e:
+                key, message = str(e), "Perfil de lanzamiento: revisa el campo marcado"
+        entry = self.entries[key]
+        entry.get_style_context().add_class("error")
+        entry.grab_focus()
+        self.lbl_error.set_text(message)
+        self.lbl_error.show()
+        return False
+
+    def on_file_clicked(self, widget):
+        fc = Gtk.FileChooserDialog(
+            title="Seleccionar Ejecutable",
+            parent=self,
+            action=Gtk.FileChooserAction.OPEN
+        )
+        fc.add_buttons(Gtk.STOCK_CANCEL, Gtk.ResponseType.CANCEL, Gtk.STOCK_OPEN, Gtk.ResponseType.OK)
+        if fc.run() == Gtk.ResponseType.OK:
+            path = fc.get_filename()
+            self.entries["ruta_ejecutable"].set_text(path)
+            if self.metadata is not None:
+                threading.Thread(target=self.read_metadata, args=(path,), daemon=True).start()
+        fc.destroy()
+
+    def read_metadata(self, path: str):
+        """Hilo: lee el .desktop y el icono de la AppImage sin ejecutarla"""
+        if classify(path) == "appimage":
+            meta = self.metadata.get(path)
+            self.metadata.save()
+            if meta is not None:
+                GLib.idle_add(self.autofill, path, meta)
+
+    def autofill(self, path: str, meta: Dict):
+        # Solo si sigue elegida la misma AppImage; lo ya escrito no se toca
+        if self.entries["ruta_ejecutable"].get_text() != path:
+            return False
+        self.entries["tipo"].set_active_id("appimage")
+        for key in ("nombre", "descripcion", "categoria", "cover"):
+            if meta[key] and not self.entries[key].get_text():
+                self.entries[key].set_text(meta[key])
+        return False
+
+    def on_cover_clicked(self, widget):
+        fc = Gtk.FileChooserDialog(
+            title="Seleccionar Portada",
+            parent=self,
+            action=Gtk.FileChooserAction.OPEN
+        )
+        fc.add_buttons(Gtk.STOCK_CANCEL, Gtk.ResponseType.CANCEL, Gtk.STOCK_OPEN, Gtk.ResponseType.OK)
+        images = Gtk.FileFilter()
+        images.set_name("Imágenes")
+        images.add_pixbuf_formats()
+        fc.add_filter(images)
+        if fc.run() == Gtk.ResponseType.OK:
+            self.entries["cover"].set_text(fc.get_filename())
+        fc.destroy()
+
+    def get_data(self) -> Game:
+        return Game(
+            nombre=self.entries["nombre"].get_text(),
+            descripcion=self.entries["descripcion"].get_text(),
+            categoria=self.entries["categoria"].get_text(),
+            tipo=self.entries["tipo"].get_active_id(),
+            ruta_ejecutable=self.entries["ruta_ejecutable"].get_text(),
+            icono_emoji=self.entries["icono_emoji"].get_text() or "🎮",
+            cover=self.entries["cover"].get_text(),
+            id=self.game.id if self.game else None,
+            perfil=self.read_profile(),
+            extra=self.game.extra if self.game else None
+        )
+
+# ============================================================================
+# MODELO DE LA BARRA LATERAL
+# ============================================================================
+class GameItem(GObject.Object):
+    """Elemento del Gio.ListStore: envuelve el Game"""
+    def __init__(self, game: Game):
+        super().__init__()
+        self.game = game
+
+
+class GameRow(Gtk.ListBoxRow):
+    """Fila de la barra lateral.
+
+    El contenido se construye la primera vez que la fila se dibuja, así que
+    solo se realizan las filas que llegan a ser visibles. Las filas se
+    reutilizan con bind() cuando el modelo cambia de elemento en su posición.
+    La portada también se pide al dibujarse: solo cargan las filas visibles.
+    """
+    def __init__(self, item: GameItem, badge_for, covers: CoverCache):
+        super().__init__()
+        self.item = item
+        self.badge_for = badge_for   # badge_for(game) -> (texto, tooltip)
+        self.covers = covers
+        self._cover_handler = None
+        self.img_cover = None
+        self.lbl_emoji = None
+        self.lbl_name = None
+        self.lbl_cat = None
+        self.lbl_badge = None
+        self.set_size_request(-1, ROW_HEIGHT)
+        self._draw_handler = self.connect("draw", self._on_draw)
+        self.show()
+
+    def bind(self, item: GameItem):
+        self.item = item
+        if self.lbl_emoji is not None:
+            self._update()
+
+    def _on_draw(self, widget, cr):
+        # Solo se dibujan las filas dentro del área visible del scroll
+        self.disconnect(self._draw_handler)
+        GLib.idle_add(self._build, priority=GLib.PRIORITY_HIGH_IDLE)
+        return False
+
+    @traced
+    def _build(self):
+        row_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10)
+
+        # Portada (si la hay) o emoji
+        self.img_cover = Gtk.Image()
+        self.img_cover.set_size_request(ROW_COVER, ROW_COVER)
+        row_box.pack_start(self.img_cover, False, False, 0)
+        self.lbl_emoji = Gtk.Label()
+        row_box.pack_start(self.lbl_emoji, False, False, 0)
+
+        # Textos
+        vbox = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=2)
+        self.lbl_name = Gtk.Label(xalign=0)
+        self.lbl_cat = Gtk.Label(xalign=0)
+        vbox.pack_start(self.lbl_name, True, True, 0)
+        vbox.pack_start(self.lbl_cat, True, True, 0)
+        row_box.pack_start(vbox, True, True, 0)
+
+        # Estado: en ejecución / ejecutable no encontrado
+        self.lbl_badge = Gtk.Label()
+        row_box.pack_end(self.lbl_badge, False, False, 0)
+
+        self.add(row_box)
+        row_box.show_all()
+        self._update()
+        return False
+
+    def _update(self):
+        game = self.item.game
+        self.lbl_emoji.set_text(game.icono_emoji)
+        self.lbl_name.set_text(game.nombre)
+        categoria = GLib.markup_escape_text(game.categoria)
+        self.lbl_cat.set_markup(f"<span size='small' foreground='#888'>{categoria}</span>")
+        self.update_badge()
+        self.show_cover()
+
+    def show_cover(self):
+        cover = self.item.game.cover
+        pixbuf = self.covers.get(cover, ROW_COVER) if cover else None
+        self.img_cover.set_from_pixbuf(pixbuf)
+        self.img_cover.set_visible(pixbuf is not None)
+        self.lbl_emoji.set_visible(pixbuf is None)
+        if cover and pixbuf is None and self._cover_handler is None:
+            self._cover_handler = self.connect("draw", self._on_cover_draw)
+
+    def _on_cover_draw(self, widget, cr):
+        self.disconnect(self._cover_handler)
+        self._cover_handler = None
+        cover = self.item.game.cover
+        if cover and self.covers.request(cover, ROW_COVER, self._on_cover_loaded) is not None:
+            self.show_cover()
+        return False
+
+    def _on_cover_loaded(self, path: str, size: int, pixbuf):
+        # La fila puede haberse reutilizado para otro juego mientras tanto
+        if pixbuf is not None and self.item.game.cover == path:
+            self.show_cover()
+
+    def update_badge(self):
+        if self.lbl_badge is None:
+            return
+        text, tooltip = self.badge_for(self.item.game)
+        self.lbl_badge.set_text(text)
+        self.set_tooltip_text(tooltip)
+
+
+class GroupItem(GObject.Object):
+    """Elemento del Gio.ListStore: cabecera de un grupo (una categoría)"""
+    def __init__(self, group: str):
+        super().__init__()
+        self.group = group
+
+
+class GroupRow(Gtk.ListBoxRow):
+    """Cabecera plegable de un grupo: no se selecciona, se activa con un clic"""
+    def __init__(self, item: GroupItem):
+        super().__init__()
+        self.item = item
+        self.set_selectable(False)
+        self.get_style_context().add_class("group-header")
+        self.label = Gtk.Label(xalign=0)
+        self.add(self.label)
+        self.show_all()
+
+    def bind(self, item: GroupItem):
+        self.item = item
+
+    def update(self, count: int, collapsed: bool):
+        arrow = "▸" if collapsed else "▾"
+        group = GLib.markup_escape_text(self.item.group)
+        self.label.set_markup(f"{arrow} {group}  <span size='small' foreground='#888'>{count}</span>")
+
+# ============================================================================
+# VENTANA PRINCIPAL
+# ============================================================================
+class MainWindow(Gtk.ApplicationWindow):
+    def __init__(self, application: Optional[Gtk.Application] = None):
+        super().__init__(title=APP_NAME, application=application)
+        self.set_icon_name("pixellauncher")
+        self.set_default_size(1100, 700)
+        self.set_position(Gtk.WindowPosition.CENTER)
+        
+        self.library: Dict[int, Game] = {}   # ID -> juego, en el orden de la lista
+        self.current_id = None
+        self.loading = True
+        self.search_index = SearchIndex()
+        self.search_matches = None   # None = sin filtro; si no, IDs visibles
+        self.rows_by_id = {}
+        self.group_rows = {}         # grupo -> GroupRow (solo en el modo por categoría)
+        self.ids_by_path = {}        # ejecutable -> IDs (para los avisos de disponibilidad)
+        self.availability = AvailabilityIndex(self.on_availability_changed)
+        self.supervisor = ProcessSupervisor(self.on_session_changed)
+        self.settings = load_settings(SETTINGS_JSON)
+        self.appimage_meta = MetadataCache(CACHE_DIR / "appimage-meta.json", CACHE_DIR / "appimage-icons")
+        self.covers = CoverCache(CACHE_DIR / "covers", self.settings["cover_cache_mb"] * 1024 * 1024)
+        self.prewarmed = set()
+        self.stats = StatsStore(CONFIG_DIR)   # Se carga en el hilo de carga, antes que los juegos
+        self.sort_mode = self.settings["sort_mode"] if self.settings["sort_mode"] in MODES else "nombre"
+        self.sort_index = SortIndex(self.stats.playtime)
+        self.collapsed = set(self.settings["collapsed_groups"])
+        StyleManager.set_mode(self.settings["render_mode"])
+        self.pending_launches = []   # (nombre, línea de órdenes remota) recibidos durante la carga
+        self.sync_monitor = None     # Vigila la biblioteca en disco (cambios de otros procesos)
+        self.sync_source = None      # Temporizador pendiente tras el último cambio
+        self.syncing = False         # Hay una relectura en curso
+        self.sync_again = False      # Y llegaron más cambios mientras tanto
+        
+        # 1. HeaderBar (Modern Title Bar)
+        header = self.header = Gtk.HeaderBar()
+        header.set_show_close_button(True)
+        header.props.title = APP_NAME
+        header.props.subtitle = "Game Library Manager"
+        self.set_titlebar(header)
+        
+        # Botón Agregar en el Header
+        add_btn = Gtk.Button()
+        add_icon = Gtk.Image.new_from_icon_name("list-add-symbolic", Gtk.IconSize.BUTTON)
+        add_btn.add(add_icon)
+        add_btn.get_style_context().add_class("suggested-action")
+        add_btn.set_tooltip_text("Agregar nuevo juego")
+        add_btn.connect("clicked", self.on_add_game)
+        header.pack_start(add_btn)
+
+        # Botón Escanear carpetas
+        self.scan_btn = Gtk.Button()
+        self.scan_btn.add(Gtk.Image.new_from_icon_name("folder-saved-search-symbolic", Gtk.IconSize.BUTTON))
+        self.scan_btn.set_tooltip_text("Buscar juegos en las carpetas configuradas")
+        self.scan_btn.connect("clicked", self.on_scan)
+        header.pack_start(self.scan_btn)
+
+        # Búsqueda instantánea (filtra la lista con el índice, sin reconstruir filas)
+        self.search_entry = Gtk.SearchEntry()
+        self.search_entry.set_placeholder_text("Buscar juego…")
+        self.search_entry.connect("search-changed", self.on_search_changed)
+        header.pack_end(self.search_entry)
+
+        # Menú de preferencias
+        menu_btn = Gtk.MenuButton()
+        menu_btn.add(Gtk.Image.new_from_icon_name("open-menu-symbolic", Gtk.IconSize.BUTTON))
+        menu_btn.set_popover(self.build_preferences())
+        header.pack_end(menu_btn)
+
+        # 2. Layout Principal (Paned: Sidebar Izq | Contenido Der)
+        self.paned = Gtk.Paned(orientation=Gtk.Orientation.HORIZONTAL)
+        self.paned.set_position(300) # Ancho inicial sidebar
+        self.add(self.paned)
+
+        # --- Sidebar (Lista de juegos) ---
+        sidebar_scroll = Gtk.ScrolledWindow()
+        sidebar_scroll.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
+        sidebar_scroll.get_style_context().add_class("sidebar")
+        
+        self.listbox = Gtk.ListBox()
+        self.listbox.set_selection_mode(Gtk.SelectionMode.SINGLE)
+        self.listbox.connect("row-selected", self.on_row_selected)
+        self.listbox.connect("row-activated", self.on_row_activated)
+        self.listbox.set_filter_func(self.filter_row)
+
+        # Modelo: las filas se sincronizan con él de forma incremental.
+        # Contiene GameItem y, en el modo por categoría, GroupItem
+        self.store = Gio.ListStore.new(GObject.Object)
+        self.store.connect("items-changed", self.on_items_changed)
+        sidebar_scroll.add(self.listbox)
+        
+        self.paned.pack1(sidebar_scroll, resize=False, shrink=False)
+
+        # --- Área de Detalles (Derecha) ---
+        self.details_container = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
+        self.details_container.set_valign(Gtk.Align.CENTER)
+        self.details_container.set_halign(Gtk.Align.CENTER)
+        
+        # La tarjeta y el estado vacío se construyen una sola vez y se reutilizan
+        self.detail_card = DetailCard(on_launch=self.launch_current, on_delete=self.delete_current,
+                                      on_stop=self.stop_current, on_edit=self.edit_current)
+        self.details_stack = Gtk.Stack()
+        self.details_stack.set_hhomogeneous(False)
+        self.details_stack.set_vhomogeneous(False)
+        self.details_stack.add_named(Gtk.Box(), "loading")
+        self.details_stack.add_named(self.build_empty_state(), "empty")
+        self.details_stack.add_named(self.detail_card, "card")
+        self.details_container.pack_start(self.details_stack, False, False, 0)
+        self.pending_game = None
+        self.details_scheduled = False
+        
+        # Envolvemos el área de detalles en un scroll por si la ventana es pequeña
+        details_scroll = Gtk.ScrolledWindow()
+        details_scroll.add(self.details_container)
+        self.paned.pack2(details_scroll, resize=True, shrink=False)
+
+        # 3. Estado Inicial: la ventana se muestra ya y la biblioteca llega por lotes
+        header.props.subtitle = "Cargando biblioteca…"
+        if STARTUP_TIMING:
+            self.connect_after("draw", self.on_first_draw)
+        threading.Thread(target=self.load_library, daemon=True).start()
+
+    def load_library(self):
+        """Hilo de carga: lee la biblioteca por lotes y los entrega al bucle de GTK"""
+        with span("estadísticas: cargar", "gui"):
+            self.stats.load()
+        first = True
+        for batch in GamesManager.iter_games():
+            # El primer lote es pequeño para que la primera pantalla aparezca cuanto antes
+            if first:
+                first = False
+                with span("lote: índices", "gui"):
+                    self.search_index.add_many(batch[:FIRST_BATCH])
+                    self.sort_index.prepare(batch[:FIRST_BATCH])
+                GLib.idle_add(self.on_batch_loaded, batch[:FIRST_BATCH])
+                batch = batch[FIRST_BATCH:]
+            if batch:
+                with span("lote: índices", "gui"):
+                    self.search_index.add_many(batch)
+                    self.sort_index.prepare(batch)
+                GLib.idle_add(self.on_batch_loaded, batch)
+        GLib.idle_add(self.on_library_loaded)
+
+    @traced
+    def on_batch_loaded(self, batch: List[Game]):
+        start = len(self.library)
+        self.library.update((game.id, game) for game in batch)
+        with span("lote: disponibilidad", "gui"):
+            self.track_paths(batch)
+        with span("lote: ordenar", "gui"):
+            changes = self.sort_index.insert(batch, self.sort_mode)
+        with span("lote: filas", "gui"):
+            self.apply_insertions(changes)
+        if start == 0:
+            self.select_near(0)
+            self.report_timing("primera pantalla")
+        self.header.props.subtitle = f"Cargando biblioteca… {len(self.library)}"
+        return False
+
+    def on_library_loaded(self):
+        self.loading = False
+        self.header.props.subtitle = "Game Library Manager"
+        if not self.library:
+            self.show_empty_state()
+        self.watch_library()
+        self.report_timing(f"biblioteca completa ({len(self.library)} juegos)")
+        pending, self.pending_launches = self.pending_launches, []
+        for name, command_line in pending:
+            self.launch_by_name(name, command_line)
+        if STARTUP_TIMING == "exit":
+            self.destroy()
+        return False
+
+    def on_first_draw(self, widget, cr):
+        self.disconnect_by_func(self.on_first_draw)
+        self.report_timing("primer frame")
+        return False
+
+    def report_timing(self, stage: str):
+        if STARTUP_TIMING:
+            print(f"[arranque] {stage}: {process_uptime() * 1000:.0f} ms", flush=True)
+
+    def build_preferences(self) -> Gtk.Popover:
+        popover = Gtk.Popover()
+        box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=10)
+        box.set_margin_top(10)
+        box.set_margin_bottom(10)
+        box.set_margin_start(10)
+        box.set_margin_end(10)
+
+        sort_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10)
+        sort_box.pack_start(Gtk.Label(label="Ordenar por"), False, False, 0)
+        combo_sort = Gtk.ComboBoxText()
+        for mode, label in MODES.items():
+            combo_sort.append(mode, label)
+        combo_sort.set_active_id(self.sort_mode)
+        combo_sort.connect("changed", lambda w: self.set_sort_mode(w.get_active_id()))
+        sort_box.pack_start(combo_sort, True, True, 0)
+        box.pack_start(sort_box, False, False, 0)
+
+        render_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10)
+        render_box.pack_start(Gtk.Label(label="Efectos visuales"), False, False, 0)
+        combo_render = Gtk.ComboBoxText()
+        for mode, label in RENDER_MODES.items():
+            combo_render.append(mode, label)
+        combo_render.set_active_id(StyleManager.mode)
+        combo_render.set_tooltip_text("Rendimiento quita sombras, degradados y transiciones: "
+                                      "listas grandes y pantallas sin aceleración se repintan antes")
+        combo_render.connect("changed", lambda w: self.set_render_mode(w.get_active_id()))
+        render_box.pack_start(combo_render, True, True, 0)
+        box.pack_start(render_box, False, False, 0)
+
+        chk_prewarm = Gtk.CheckButton(label="Precargar el juego seleccionado en memoria")
+        chk_prewarm.set_tooltip_text("Lee el juego del disco mientras miras su ficha, para que arranque antes")
+        chk_prewarm.set_active(self.settings["prewarm"])
+        chk_prewarm.connect("toggled", lambda w: self.set_setting("prewarm", w.get_active()))
+        box.pack_start(chk_prewarm, False, False, 0)
+
+        self.btn_fill = Gtk.ModelButton(label="Completar datos desde las AppImages")
+        self.btn_fill.set_tooltip_text("Nombre, descripción, categoría e icono de cada AppImage de la biblioteca")
+        self.btn_fill.connect("clicked", self.on_fill_metadata)
+        box.pack_start(self.btn_fill, False, False, 0)
+
+        self.import_buttons = []
+        btn_launchers = Gtk.ModelButton(label="Importar de Steam, Lutris y Heroic")
+        btn_launchers.set_tooltip_text("Lee sus bibliotecas locales; lo que ya está en la tuya no se repite")
+        btn_launchers.connect("clicked", lambda w: self.start_import([(s, None) for s in ("steam", "lutris", "heroic")]))
+        btn_desktop = Gtk.ModelButton(label="Importar accesos .desktop…")
+        btn_desktop.connect("clicked", self.on_import_desktop)
+        for btn in (btn_launchers, btn_desktop):
+            self.import_buttons.append(btn)
+            box.pack_start(btn, False, False, 0)
+
+        box.show_all()
+        popover.add(box)
+        return popover
+
+    def set_setting(self, key: str, value):
+        self.settings[key] = value
+        save_settings(SETTINGS_JSON, self.settings)
+
+    def set_render_mode(self, mode: str):
+        StyleManager.set_mode(mode)
+        self.set_setting("render_mode", StyleManager.mode)
+
+    def build_empty_state(self) -> Gtk.Widget:
+        """Mensaje que se muestra si no hay juegos"""
+        box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=20)
+        box.set_halign(Gtk.Align.CENTER)
+        box.set_valign(Gtk.Align.CENTER)
+        
+        icon = Gtk.Label()
+        icon.set_markup("<span size='50000'>👾</span>")
+        
+        lbl = Gtk.Label(label="Tu biblioteca está vacía")
+        lbl.get_style_context().add_class("game-title")
+        
+        sub = Gtk.Label(label="Haz clic en '+' arriba a la izquierda para empezar.")
+        
+        box.pack_start(icon, False, False, 0)
+        box.pack_start(lbl, False, False, 0)
+        box.pack_start(sub, False, False, 0)
+        return box
+
+    @traced
+    def refresh_list(self):
+        """Recarga la lista lateral completa en el orden del modo actual.
+
+        El orden ya está calculado en sort_index y las filas se reutilizan:
+        cambiar de modo no ordena nada ni crea widgets nuevos.
+        """
+        with span("refresh_list: elementos", "gui"):
+            items = [self.rows_by_id[entry].item if isinstance(entry, int) and entry in self.rows_by_id
+                     else self.make_item(entry) for entry in self.sort_index.order(self.sort_mode)]
+        with span("refresh_list: splice", "gui"):
+            self.store.splice(0, self.store.get_n_items(), items)
+        row = self.rows_by_id.get(self.current_id)
+        if row is not None:
+            # La fila seleccionada ahora muestra otro juego: se vuelve a la del actual
+            self.listbox.select_row(row)
+
+    def make_item(self, entry) -> GObject.Object:
+        return GroupItem(entry) if isinstance(entry, str) else GameItem(self.library[entry])
+
+    def set_sort_mode(self, mode: str):
+        if mode == self.sort_mode:
+            return
+        self.sort_mode = mode
+        self.set_setting("sort_mode", mode)
+        self.refresh_list()
+
+    def apply_insertions(self, changes):
+        """Inserta en el modelo las entradas (posición, id o grupo) de sort_index.
+
+        Las posiciones consecutivas van en un solo splice.
+        """
+        i = 0
+        while i < len(changes):
+            j = i + 1
+            while j < len(changes) and changes[j][0] == changes[j - 1][0] + 1:
+                j += 1
+            self.store.splice(changes[i][0], 0, [self.make_item(entry) for _, entry in changes[i:j]])
+            i = j
+        if self.group_rows:
+            for group in {group_of(self.library[entry]) for _, entry in changes if isinstance(entry, int)}:
+                self.update_group_row(group)
+
+    def apply_removals(self, positions: List[int], group: str):
+        """Quita del modelo las posiciones de sort_index.delete (group: el del juego quitado)"""
+        for position in positions:
+            self.store.remove(position)
+        self.update_group_row(group)
+
+    def reposition(self, game: Game):
+        """Recoloca un juego tras cambiar su nombre, categoría o tiempo de juego"""
+        old_group = self.sort_index.keys[game.id][1]
+        removals, insertions = self.sort_index.update(game, self.sort_mode)
+        self.apply_removals(removals, old_group)
+        self.apply_insertions(insertions)
+        if self.current_id == game.id:
+            self.listbox.select_row(self.rows_by_id[game.id])
+
+    @traced
+    def on_items_changed(self, store, position, removed, added):
+        """Aplica un cambio del modelo a la lista: reutiliza las filas
+        existentes y solo crea o destruye la diferencia"""
+        reused = min(removed, added)
+        for i in range(reused):
+            row = self.listbox.get_row_at_index(position + i)
+            item = store.get_item(position + i)
+            self.forget_row(row)
+            if isinstance(row, GameRow) and isinstance(item, GameItem):
+                row.bind(item)
+                self.rows_by_id[item.game.id] = row
+                if row.get_child_visible() != self.filter_row(row):
+                    row.changed()
+            else:
+                self.listbox.remove(row)
+                self.listbox.insert(self.make_row(item), position + i)
+        for _ in range(removed - reused):
+            row = self.listbox.get_row_at_index(position + reused)
+            self.forget_row(row)
+            self.listbox.remove(row)
+        for i in range(reused, added):
+            self.listbox.insert(self.make_row(store.get_item(position + i)), position + i)
+
+    def make_row(self, item) -> Gtk.ListBoxRow:
+        if isinstance(item, GroupItem):
+            row = self.group_rows[item.group] = GroupRow(item)
+            self.update_group_row(item.group)
+            return row
+        row = self.rows_by_id[item.game.id] = GameRow(item, self.badge_for, self.covers)
+        return row
+
+    def forget_row(self, row: Gtk.ListBoxRow):
+        if isinstance(row, GroupRow):
+            if self.group_rows.get(row.item.group) is row:
+                del self.group_rows[row.item.group]
+            return
+        game_id = row.item.game.id
+        if self.rows_by_id.get(game_id) is row:
+            del self.rows_by_id[game_id]
+
+    def update_group_row(self, group: str):
+        row = self.group_rows.get(group)
+        if row is not None:
+            row.update(len(self.sort_index.groups.get(group, ())), group in self.collapsed)
+
+    def on_row_activated(self, box, row):
+        if isinstance(row, GroupRow):
+            self.toggle_group(row.item.group)
+
+    def toggle_group(self, group: str):
+        """Pliega o despliega un grupo: solo se reevalúan sus filas"""
+        if group in self.collapsed:
+            self.collapsed.discard(group)
+        else:
+            self.collapsed.add(group)
+        self.set_setting("collapsed_groups", sorted(self.collapsed))
+        self.update_group_row(group)
+        for game_id in self.sort_index.group_ids(group):
+            row = self.rows_by_id.get(game_id)
+            if row is not None:
+                row.changed()
+
+    def select_near(self, index: int):
+        """Selecciona el juego en index o, si es una cabecera o no existe, el más cercano"""
+        n = self.store.get_n_items()
+        for i in itertools.chain(range(min(index, n - 1), -1, -1), range(index + 1, n)):
+            row = self.listbox.get_row_at_index(i)
+            if isinstance(row, GameRow) and row.get_child_visible():
+                self.listbox.select_row(row)
+                return
+
+    def track_paths(self, games: List[Game]):
+        """Registra las rutas de los juegos y encola su comprobación en segundo plano"""
+        for game in games:
+            self.ids_by_path.setdefault(executable(game), set()).add(game.id)
+        self.availability.check(executable(game) for game in games)
+
+    def untrack_path(self, game: Game):
+        ids = self.ids_by_path.get(executable(game))
+        if ids is not None:
+            ids.discard(game.id)
+            if not ids:
+                del self.ids_by_path[executable(game)]
+
+    def on_availability_changed(self, paths: List[str]):
+        for path in paths:
+            for game_id in self.ids_by_path.get(path, ()):
+                row = self.rows_by_id.get(game_id)
+                if row is not None:
+                    row.update_badge()
+        current = self.current_game()
+        if current is not None and executable(current) in paths:
+            self.detail_card.set_available(self.availability.get(executable(current)))
+
+    def badge_for(self, game: Game):
+        if self.supervisor.is_running(game.id):
+            return "▶", "En ejecución"
+        if self.availability.get(executable(game)) is False:
+            return "⚠", "Ejecutable no encontrado"
+        return "", None
+
+    def on_session_changed(self, session: Session):
+        row = self.rows_by_id.get(session.game_id)
+        if row is not None:
+            row.update_badge()
+        if self.current_id == session.game_id:
+            self.detail_card.set_running(session.running)
+        game = self.library.get(session.game_id)
+        if session.running:
+            self.stats.record_launch(session.game_id, session.started)
+        else:
+            self.stats.record_exit(session.game_id, session.ended, session.ended - session.started,
+                                   session.exit_code)
+            if game is not None and self.sort_mode in STATS_MODES:
+                self.reposition(game)
+            elif game is not None:
+                # El orden a la vista no depende del tiempo de juego: solo el índice
+                self.sort_index.refresh_playtime(game.id)
+        if self.current_id == session.game_id:
+            self.detail_card.set_stats(self.stats.get(session.game_id))
+        if session.crashed:
+            nombre = game.nombre if game else "El juego"
+            msg = Gtk.MessageDialog(transient_for=self, message_type=Gtk.MessageType.WARNING,
+                                    buttons=Gtk.ButtonsType.OK, text="El juego se cerró al arrancar")
+            msg.format_secondary_text(f"{nombre} terminó con código {session.exit_code} "
+                                      f"a los {session.ended - session.started:.1f} s.")
+            msg.connect("response", lambda d, r: d.destroy())
+            msg.show()
+
+    def show_storage_error(self, text: str, what: str):
+        """Aviso de que la biblioteca en disco no cambió (el detalle va a la consola)"""
+        msg = Gtk.MessageDialog(transient_for=self, message_type=Gtk.MessageType.ERROR,
+                                buttons=Gtk.ButtonsType.OK, text=text)
+        msg.format_secondary_text(f"{what}: la biblioteca en disco no ha cambiado.")
+        msg.connect("response", lambda d, r: d.destroy())
+        msg.show()
+
+    def current_game(self) -> Optional[Game]:
+        return self.library.get(self.current_id)
+
+    def filter_row(self, row: Gtk.ListBoxRow) -> bool:
+        # Al buscar, la lista es plana: sin cabeceras y sin grupos plegados
+        if isinstance(row, GroupRow):
+            return self.search_matches is None
+        if self.search_matches is not None:
+            return row.item.game.id in self.search_matches
+        return self.sort_mode != "categoria" or group_of(row.item.game) not in self.collapsed
+
+    @traced
+    def on_search_changed(self, entry):
+        old, new = self.search_matches, self.search_index.search(entry.get_text())
+        self.search_matches = new
+        if old is None or new is None:
+            self.listbox.invalidate_filter()
+            return
+        # Solo se reevalúan las filas cuyo estado cambia
+        for game_id in old ^ new:
+            row = self.rows_by_id.get(game_id)
+            if row is not None:
+                row.changed()
+
+    def show_empty_state(self):
+        """Muestra mensaje si no hay juegos"""
+        self.pending_game = None
+        self.details_stack.set_visible_child_name("empty")
+
+    @traced
+    def on_row_selected(self, box, row):
+        if row is not None:
+            game = row.item.game
+            self.current_id = game.id
+            # Al mantener pulsada una flecha llegan muchas selecciones seguidas:
+            # solo se pinta la última
+            self.pending_game = game
+            if not self.details_scheduled:
+                self.details_scheduled = True
+                GLib.idle_add(self.render_pending_details)
+
+    @traced
+    def render_pending_details(self):
+        self.details_scheduled = False
+        if self.pending_game is not None:
+            self.show_game_details(self.pending_game)
+            self.pending_game = None
+        return False
+
+    @traced
+    def show_game_details(self, game):
+        self.detail_card.set_game(game)
+        self.detail_card.set_available(self.availability.get(executable(game)))
+        self.detail_card.set_running(self.supervisor.is_running(game.id))
+        self.detail_card.set_stats(self.stats.get(game.id))
+        cover = game.cover
+        self.detail_card.set_cover(self.covers.request(cover, CARD_COVER, self.on_card_cover_loaded)
+                                   if cover else None)
+        if self.settings["prewarm"] and game.id not in self.prewarmed:
+            self.prewarmed.add(game.id)
+            threading.Thread(target=prewarm, args=(game,), daemon=True).start()
+        self.details_stack.set_visible_child_name("card")
+
+    def on_card_cover_loaded(self, path: str, size: int, pixbuf):
+        current = self.current_game()
+        if pixbuf is not None and current is not None and current.cover == path:
+            self.detail_card.set_cover(pixbuf)
+
+    @traced
+    def on_add_game(self, widget):
+        dialog = GameDialog(self, self.appimage_meta)
+        response = dialog.run()
+        
+        if response == Gtk.ResponseType.OK:
+            data = dialog.get_data()
+            if data.nombre and data.ruta_ejecutable:
+                self.add_game(data)
+        
+        dialog.destroy()
+
+    @traced
+    def add_game(self, game: Game):
+        if not GamesManager.add_game(game):
+            self.show_storage_error("No se pudo guardar el juego", game.nombre)
+            return
+        self.insert_games([game])
+        # Seleccionar el nuevo (desplegando su grupo si hace falta)
+        if self.sort_mode == "categoria" and group_of(game) in self.collapsed:
+            self.toggle_group(group_of(game))
+        self.listbox.select_row(self.rows_by_id[game.id])
+
+    @traced
+    def add_games(self, games: List[Game]):
+        """Añade un lote: una escritura, un solo cambio en el modelo"""
+        if not games:
+            return
+        if not GamesManager.add_games(games):
+            self.show_storage_error("No se pudieron guardar los juegos", f"{len(games)} juegos")
+            return
+        start = len(self.library)
+        self.insert_games(games)
+        if start == 0:
+            self.select_near(0)
+
+    def insert_games(self, games: List[Game]):
+        """Muestra juegos ya guardados (índices, disponibilidad y lista lateral)"""
+        self.search_index.add_many(games)
+        if self.search_matches is not None:
+            self.search_matches = self.search_index.search(self.search_entry.get_text())
+        self.library.update((game.id, game) for game in games)
+        self.track_paths(games)
+        self.apply_insertions(self.sort_index.insert(games, self.sort_mode))
+
+    def on_scan(self, widget):
+        settings = self.settings
+        roots = [r for r in settings["scan_roots"] if os.path.isdir(os.path.expanduser(r))]
+        if not roots:
+            # Ninguna carpeta configurada existe: se pide una y se recuerda
+            fc = Gtk.FileChooserDialog(title="Carpeta de juegos", parent=self,
+                                       action=Gtk.FileChooserAction.SELECT_FOLDER)
+            fc.add_buttons(Gtk.STOCK_CANCEL, Gtk.ResponseType.CANCEL, Gtk.STOCK_OPEN, Gtk.ResponseType.OK)
+            if fc.run() == Gtk.ResponseType.OK:
+                roots = [fc.get_filename()]
+                self.set_setting("scan_roots", settings["scan_roots"] + roots)
+            fc.destroy()
+            if not roots:
+                return
+        self.scan_btn.set_sensitive(False)
+        threading.Thread(target=self.scan_library, args=(roots,), daemon=True).start()
+
+    def scan_library(self, roots: List[str]):
+        """Hilo del escáner: el bucle de GTK solo recibe el progreso y el resultado"""
+        scanner = LibraryScanner(CACHE_DIR / "scan-cache.json")
+        progress = lambda dirs, found: GLib.idle_add(self.on_scan_progress, dirs, found)
+        found = scanner.scan(roots, progress)
+        appimages = [game for game in found if game.tipo == "appimage"]
+        metas = self.appimage_meta.get_many(game.ruta_ejecutable for game in appimages)
+        for game in appimages:
+            if metas.get(game.ruta_ejecutable):
+                fill_game(game, metas[game.ruta_ejecutable])
+        GLib.idle_add(self.on_scan_finished, found)
+
+    def on_scan_progress(self, dirs: int, found: int):
+        self.header.props.subtitle = f"Escaneando… {dirs} carpetas, {found} juegos"
+        return False
+
+    @traced
+    def on_scan_finished(self, found: List[Game]):
+        known = {game.ruta_ejecutable for game in self.library.values()}
+        new_games = [game for game in found if game.ruta_ejecutable not in known]
+        self.add_games(new_games)
+        self.header.props.subtitle = f"Escaneo completo: {len(new_games)} juegos nuevos"
+        self.scan_btn.set_sensitive(True)
+        return False
+
+    def on_import_desktop(self, widget):
+        fc = Gtk.FileChooserDialog(title="Carpeta con accesos .desktop", parent=self,
+                                   action=Gtk.FileChooserAction.SELECT_FOLDER)
+        fc.add_buttons(Gtk.STOCK_CANCEL, Gtk.ResponseType.CANCEL, Gtk.STOCK_OPEN, Gtk.ResponseType.OK)
+        if fc.run() == Gtk.ResponseType.OK:
+            self.start_import([("desktop", fc.get_filename())])
+        fc.destroy()
+
+    def start_import(self, sources: List[Tuple[str, Optional[str]]]):
+        for btn in self.import_buttons:
+            btn.set_sensitive(False)
+        self.header.props.subtitle = "Importando…"
+        known = [game.ruta_ejecutable for game in self.library.values()]
+        threading.Thread(target=self.import_library, args=(sources, known), daemon=True).start()
+
+    def import_library(self, sources: List[Tuple[str, Optional[str]]], known: List[str]):
+        """Hilo del importador: el bucle de GTK solo recibe el progreso y el lote final"""
+        importer = BulkImporter(known)
+        progress = lambda source, read: GLib.idle_add(self.on_import_progress, source, read)
+        games = importer.run(sources, progress)
+        GLib.idle_add(self.on_import_finished, games, importer.stats)
+
+    def on_import_progress(self, source: str, read: int):
+        if source:
+            self.header.props.subtitle = f"Importando de {source}… {read} entradas"
+        return False
+
+    @traced
+    def on_import_finished(self, games: List[Game], stats: Dict[str, int]):
+        # La biblioteca pudo cambiar mientras tanto
+        known = {path_key(game.ruta_ejecutable) for game in self.library.values()}
+        new_games = [game for game in games if path_key(game.ruta_ejecutable) not in known]
+        self.add_games(new_games)
+        duplicates = stats["duplicates"] + len(games) - len(new_games)
+        self.header.props.subtitle = (f"Importados {len(new_games)} juegos "
+                                      f"({duplicates} ya estaban, {stats['skipped']} omitidos)")
+        for btn in self.import_buttons:
+            btn.set_sensitive(True)
+        return False
+
+    def on_fill_metadata(self, widget):
+        paths = [game.ruta_ejecutable for game in self.library.values() if game.tipo == "appimage"]
+        if not paths:
+            return
+        self.btn_fill.set_sensitive(False)
+        self.header.props.subtitle = f"Leyendo {len(paths)} AppImages…"
+        threading.Thread(target=lambda: GLib.idle_add(self.on_metadata_loaded, self.appimage_meta.get_many(paths)),
+                         daemon=True).start()
+
+    @traced
+    def on_metadata_loaded(self, metas: Dict[str, Optional[Dict]]):
+        changed = []
+        for game in self.library.values():
+            meta = metas.get(game.ruta_ejecutable)
+            if meta and fill_game(game, meta):
+                changed.append(game)
+                GamesManager.update_game(game)
+                self.search_index.add(game.id, game)
+                self.reposition(game)
+        current = self.current_game()
+        if current is not None and current in changed:
+            self.show_game_details(current)
+        self.header.props.subtitle = f"Datos completados en {len(changed)} juegos"
+        self.btn_fill.set_sensitive(True)
+        return False
+
+    @traced
+    def launch_current(self):
+        game = self.current_game()
+        if game is not None:
+            success = GamesManager.launch_game(game, self.supervisor)
+            if not success:
+                self.availability.recheck([executable(game)])
+                msg = Gtk.MessageDialog(transient_for=self, message_type=Gtk.MessageType.ERROR,
+                                      buttons=Gtk.ButtonsType.OK, text="Error al lanzar")
+                msg.format_secondary_text(f"No se pudo encontrar o ejecutar:\n{game.ruta_ejecutable}")
+                msg.run()
+                msg.destroy()
+
+    def launch_by_name(self, name: str, command_line: Optional[Gio.ApplicationCommandLine] = None):
+        """Lanza un juego pedido desde otra invocación (gamelauncher --launch NOMBRE).
+
+        Mientras se conserva command_line, el proceso remoto sigue esperando
+        su código de salida; si la biblioteca aún carga, se atiende al final.
+        """
+        if self.loading:
+            self.pending_launches.append((name, command_line))
+            return
+        game = find_game(self.library.values(), name)
+        if game is None:
+            error = f"No hay ningún juego (o hay varios) que coincida con: {name}\n"
+        elif not GamesManager.launch_game(game, self.supervisor):
+            self.availability.recheck([executable(game)])
+            error = f"No se pudo encontrar o ejecutar:\n{game.ruta_ejecutable}\n"
+        else:
+            error = None
+            row = self.rows_by_id.get(game.id)
+            if row is not None:
+                self.listbox.select_row(row)
+        if command_line is not None:
+            if error:
+                command_line.printerr_literal(error)
+            command_line.set_exit_status(1 if error else 0)
+
+    def stop_current(self):
+        game = self.current_game()
+        if game is not None:
+            self.supervisor.terminate(game.id)
+
+    @traced
+    def edit_current(self):
+        game = self.current_game()
+        if game is None:
+            return
+        dialog = GameDialog(self, self.appimage_meta, game)
+        # Solo se sale con OK si validate() dio el visto bueno
+        edited = dialog.get_data() if dialog.run() == Gtk.ResponseType.OK else None
+        dialog.destroy()
+        if edited is None:
+            return
+        if not GamesManager.update_game(edited):
+            self.show_storage_error("No se pudo guardar el juego", edited.nombre)
+            return
+        self.replace_game(edited)
+
+    @traced
+    def delete_current(self):
+        game = self.current_game()
+        if game is not None:
+            dialog = Gtk.MessageDialog(
+                transient_for=self,
+                message_type=Gtk.MessageType.QUESTION,
+                buttons=Gtk.ButtonsType.YES_NO,
+                text="¿Eliminar juego?"
+            )
+            dialog.format_secondary_text("Esta acción eliminará el juego de la lista (no del disco).")
+            if dialog.run() == Gtk.ResponseType.YES:
+                self.remove_game(game)
+            dialog.destroy()
+
+    @traced
+    def remove_game(self, game: Game):
+        if not GamesManager.remove_game(game):
+            # La fila se queda: la interfaz sigue igual que el disco
+            self.show_storage_error("No se pudo eliminar el juego", game.nombre)
+            return
+        index = self.rows_by_id[game.id].get_index()
+        self.drop_game(game)
+        if not self.library:
+            self.show_empty_state()
+        else:
+            # Seleccionar el anterior o el primero
+            self.select_near(max(0, index - 1))
+
+    def drop_game(self, game: Game):
+        """Quita un juego de la interfaz (no del almacenamiento)"""
+        del self.library[game.id]
+        self.stats.forget(game.id)
+        self.search_index.remove(game.id)
+        self.untrack_path(game)
+        self.apply_removals(self.sort_index.delete(game.id, self.sort_mode), group_of(game))
+
+    def replace_game(self, game: Game):
+        """Sustituye un juego por su versión nueva (mismo ID) y lo recoloca"""
+        old = self.library[game.id]
+        self.library[game.id] = game
+        self.search_index.add(game.id, game)
+        if executable(old) != executable(game):
+            self.untrack_path(old)
+            self.track_paths([game])
+        self.reposition(game)
+        if self.current_id == game.id:
+            self.show_game_details(game)
+
+    # --- Cambios hechos por otros procesos (otra instancia, la CLI, un script) ---
+    def watch_library(self):
+        self.sync_names = {path.name for path in GamesManager.watch_paths()}
+        try:
+            self.sync_monitor = Gio.File.new_for_path(str(CONFIG_DIR)).monitor_directory(
+                Gio.FileMonitorFlags.WATCH_MOVES, None)
+            self.sync_monitor.connect("changed", self.on_store_changed)
+        except GLib.Error as e:
+            print(f"No se puede vigilar {CONFIG_DIR}: {e.message}")
+        # Lo que cambiara mientras se cargaba
+        self.schedule_sync()
+
+    def on_store_changed(self, monitor, file, other_file, event):
+        if any(f is not None and f.get_basename() in self.sync_names for f in (file, other_file)):
+            self.schedule_sync()
+
+    def schedule_sync(self):
+        # Una escritura son varios eventos y un script puede hacer muchas
+        # seguidas: se relee una vez, SYNC_DEBOUNCE_MS después del último
+        if self.sync_source is not None:
+            GLib.source_remove(self.sync_source)
+        self.sync_source = GLib.timeout_add(SYNC_DEBOUNCE_MS, self.start_sync)
+
+    def start_sync(self):
+        self.sync_source = None
+        if self.syncing:
+            self.sync_again = True
+        elif GamesManager.has_external_changes():   # Descarta las escrituras propias
+            self.syncing = True
+            snapshot = dict(self.library)
+            threading.Thread(target=self.load_changes, args=(snapshot,), daemon=True).start()
+        return False
+
+    def load_changes(self, snapshot: Dict[int, Game]):
+        """Hilo: relee la biblioteca y la compara con snapshot"""
+        fresh = GamesManager.reload_games()
+        with span("sincronizar: comparar", "gui"):
+            diff = diff_library(snapshot, fresh) if fresh is not None else LibraryDiff([], [], [])
+        GLib.idle_add(self.apply_sync, diff)
+
+    @traced
+    def apply_sync(self, diff: LibraryDiff):
+        """Aplica solo las filas que cambiaron, conservando la selección"""
+        self.syncing = False
+        # Lo hecho aquí mientras se releía ya está en self.library
+        added = [game for game in diff.added if game.id not in self.library]
+        changed = [game for game in diff.added + diff.changed
+                   if game.id in self.library and not same_game(self.library[game.id], game)]
+        removed = [self.library[game_id] for game_id in diff.removed if game_id in self.library]
+        if added or changed or removed:
+            row = self.rows_by_id.get(self.current_id)
+            index = row.get_index() if row is not None else 0
+            with span("sincronizar: aplicar", "gui"):
+                for game in removed:
+                    self.drop_game(game)
+                for game in changed:
+                    self.replace_game(game)
+                if added:
+                    self.insert_games(added)
+            if not self.library:
+                self.show_empty_state()
+            elif self.current_id not in self.library:
+                self.select_near(max(0, index - 1))
+            self.header.props.subtitle = (f"Biblioteca actualizada: {len(added)} nuevos, "
+                                          f"{len(changed)} editados, {len(removed)} eliminados")
+        if self.sync_again:
+            self.sync_again = False
+            self.schedule_sync()
+        return False
+
+# ============================================================================
+# MAIN
+# ============================================================================
+class LauncherApp(Gtk.Application):
+    """Instancia única: otra invocación reenvía aquí sus argumentos y termina"""
+
+    def __init__(self):
+        super().__init__(application_id=APP_ID, flags=Gio.ApplicationFlags.HANDLES_COMMAND_LINE)
+        self.window = None
+        self.lock_fd = None
+
+    def do_startup(self):
+        Gtk.Application.do_startup(self)
+        StyleManager.load_css()
+        start_watchdog()
+        # Solo la instancia principal pasa por aquí
+        self.lock_fd = acquire_lock()
+
+    def do_command_line(self, command_line):
+        if self.window is None:
+            self.window = MainWindow(application=self)
+            self.window.show_all()
+        else:
+            self.window.present()
+        name = remote_launch_name(command_line.get_arguments()[1:])
+        if name is not None:
+            self.window.launch_by_name(name, command_line)
+        return command_line.get_exit_status()
+
+
+def run(argv: List[str]) -> int:
+    return LauncherApp().run([sys.argv[0]] + list(argv))
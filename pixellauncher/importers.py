@@ -0,0 +1,337 @@
+"""Importación en bloque desde otros launchers, sin abrirlos.
+
+Fuentes (se leen sus ficheros locales, entrada a entrada):
+
+- desktop: una carpeta de accesos .desktop. Exec debe ser un solo ejecutable
+  (o un URI de Steam/Lutris/Heroic); las órdenes con argumentos se omiten.
+- steam: libraryfolders.vdf y los appmanifest_*.acf de cada biblioteca.
+- lutris: la base de datos pga.db (solo lectura).
+- heroic: los installed.json de Legendary y GOG y las apps añadidas a mano.
+
+Los juegos de Steam, Lutris y Heroic se guardan con su URI como
+ruta_ejecutable y su cliente como tipo (ver launch.CLIENTS). BulkImporter
+descarta lo que ya está en la biblioteca (misma ruta) y devuelve el lote,
+que se guarda con GamesManager.add_games en una sola escritura.
+"""
+import json
+import os
+import re
+import shlex
+import shutil
+import sqlite3
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from pixellauncher.appimage import categoria, localized, parse_desktop
+from pixellauncher.model import Game
+from pixellauncher.scanner import PROGRESS_INTERVAL, classify
+
+SOURCES = ("desktop", "steam", "lutris", "heroic")
+FIELD_CODE = re.compile(r"%[fFuUdDnNickvm%]")
+STEAM_URI = re.compile(r"^steam://(?:rungameid|run)/(\d+)")
+LUTRIS_URI = re.compile(r"^lutris:(?:rungameid|rungame)/\S+")
+HEROIC_URI = re.compile(r"^heroic://launch\S*")
+# Herramientas que Steam instala como si fueran juegos
+STEAM_TOOLS = ("Proton", "Steam Linux Runtime", "Steamworks Common")
+STEAM_INSTALLED = 4   # Bit de StateFlags: instalado por completo
+
+_home = Path.home()
+DEFAULT_PATHS = {
+    "desktop": [_home / ".local" / "share" / "applications"],
+    "steam": [_home / ".steam" / "steam", _home / ".local" / "share" / "Steam",
+              _home / ".var" / "app" / "com.valvesoftware.Steam" / ".local" / "share" / "Steam"],
+    "lutris": [_home / ".local" / "share" / "lutris" / "pga.db",
+               _home / ".var" / "app" / "net.lutris.Lutris" / "data" / "lutris" / "pga.db"],
+    "heroic": [_home / ".config" / "heroic",
+               _home / ".var" / "app" / "com.heroicgameslauncher.hgl" / "config" / "heroic"],
+}
+
+
+def path_key(ruta: str) -> str:
+    """Clave para detectar duplicados: la ruta normalizada (los URIs tal cual)"""
+    if ruta.startswith("/") or ruta.startswith("~"):
+        return os.path.normpath(os.path.expanduser(ruta))
+    return ruta
+
+
+# ============================================================================
+# ACCESOS .desktop
+# ============================================================================
+def exec_target(exec_line: str) -> Optional[Tuple[str, str]]:
+    """(ruta o URI, tipo) de una línea Exec, o None si no se puede lanzar sin argumentos"""
+    try:
+        args = [FIELD_CODE.sub(lambda m: "%" if m.group() == "%%" else "", a)
+                for a in shlex.split(exec_line)]
+    except ValueError:
+        return None
+    args = [a for a in args if a]
+    for arg in args:
+        steam = STEAM_URI.match(arg)
+        if steam:
+            return f"steam://rungameid/{steam.group(1)}", "steam"
+        if LUTRIS_URI.match(arg):
+            return arg, "lutris"
+        if HEROIC_URI.match(arg):
+            return arg, "heroic"
+    if len(args) != 1:
+        return None
+    ruta = args[0] if os.path.isabs(args[0]) else shutil.which(args[0])
+    if ruta is None:
+        return None
+    tipo = classify(ruta) or ("appimage" if ruta.lower().endswith(".appimage") else "binario")
+    return ruta, tipo
+
+
+def read_desktop_dir(path: Path, games_only: bool = False) -> Iterator[Optional[Game]]:
+    with os.scandir(path) as it:
+        for entry in it:
+            if not entry.name.endswith(".desktop") or not entry.is_file():
+                continue
+            try:
+                with open(entry.path, 'r', encoding='utf-8', errors='replace') as f:
+                    desktop = parse_desktop(f.read())
+            except OSError:
+                continue
+            if (desktop.get("Type", "Application") != "Application"
+                    or desktop.get("NoDisplay") == "true" or desktop.get("Hidden") == "true"):
+                continue
+            categories = desktop.get("Categories", "")
+            if games_only and "Game" not in categories.split(";"):
+                continue
+            target = exec_target(desktop.get("Exec", ""))
+            if target is None:
+                yield None    # Omitido: orden con argumentos o ejecutable inexistente
+                continue
+            ruta, tipo = target
+            icon = desktop.get("Icon", "")
+            yield Game(nombre=localized(desktop, "Name") or entry.name[:-len(".desktop")],
+                       ruta_ejecutable=ruta, tipo=tipo,
+                       descripcion=localized(desktop, "Comment"), categoria=categoria(categories),
+                       cover=icon if os.path.isabs(icon) and os.path.isfile(icon) else "")
+
+
+# ============================================================================
+# STEAM
+# ============================================================================
+VDF_TOKEN = re.compile(r'"((?:[^"\\]|\\.)*)"|([{}])')
+
+
+def parse_vdf(lines: Iterable[str]) -> Dict:
+    """KeyValues de Valve (formato texto de .vdf y .acf), línea a línea"""
+    root = {}
+    stack, key = [root], None
+    for line in lines:
+        for quoted, brace in VDF_TOKEN.findall(line):
+            if brace == "{":
+                child = {}
+                stack[-1][key if key is not None else ""] = child
+                stack.append(child)
+                key = None
+            elif brace == "}":
+                if len(stack) > 1:
+                    stack.pop()
+                key = None
+            elif key is None:
+                key = quoted.replace('\\"', '"').replace("\\\\", "\\")
+            else:
+                stack[-1][key] = quoted.replace('\\"', '"').replace("\\\\", "\\")
+                key = None
+    return root
+
+
+def read_vdf(path: Path) -> Dict:
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        return parse_vdf(f)
+
+
+def steam_libraries(root: Path) -> List[Path]:
+    """Bibliotecas de Steam: la principal y las de libraryfolders.vdf"""
+    libraries = [root]
+    try:
+        folders = read_vdf(root / "steamapps" / "libraryfolders.vdf")
+    except OSError:
+        return libraries
+    folders = folders.get("libraryfolders") or folders.get("LibraryFolders") or {}
+    for key, value in folders.items():
+        if not key.isdigit():
+            continue
+        # Formato actual: {"path": ...}; el antiguo: la ruta directamente
+        library = value.get("path") if isinstance(value, dict) else value
+        if library:
+            libraries.append(Path(library))
+    return libraries
+
+
+def steam_cover(root: Path, appid: str) -> str:
+    cache = root / "appcache" / "librarycache"
+    for candidate in (cache / appid / "library_600x900.jpg", cache / f"{appid}_library_600x900.jpg"):
+        if candidate.is_file():
+            return str(candidate)
+    return ""
+
+
+def read_steam(root: Path) -> Iterator[Optional[Game]]:
+    seen = set()
+    for library in steam_libraries(root):
+        steamapps = library / "steamapps"
+        try:
+            real = os.path.realpath(steamapps)
+            if real in seen:
+                continue
+            seen.add(real)
+            manifests = [e.path for e in os.scandir(steamapps)
+                         if e.name.startswith("appmanifest_") and e.name.endswith(".acf")]
+        except OSError:
+            continue
+        for manifest in sorted(manifests):
+            try:
+                app = read_vdf(Path(manifest)).get("AppState", {})
+            except OSError:
+                continue
+            appid, name = app.get("appid", ""), app.get("name", "")
+            flags = app.get("StateFlags", "")
+            if (not appid.isdigit() or not name or name.startswith(STEAM_TOOLS)
+                    or (flags.isdigit() and not int(flags) & STEAM_INSTALLED)):
+                yield None
+                continue
+            yield Game(nombre=name, ruta_ejecutable=f"steam://rungameid/{appid}", tipo="steam",
+                       cover=steam_cover(root, appid))
+
+
+# ============================================================================
+# LUTRIS
+# ============================================================================
+def read_lutris(db_path: Path) -> Iterator[Optional[Game]]:
+    if not db_path.is_file():
+        return
+    data_dir = db_path.parent
+    cover_dirs = [data_dir / "coverart", _home / ".cache" / "lutris" / "coverart"]
+    db = sqlite3.connect(f"{db_path.as_uri()}?mode=ro", uri=True)
+    try:
+        # El cursor entrega las filas según se leen, sin cargar la tabla entera
+        for game_id, name, slug, installed in db.execute(
+                "SELECT id, name, slug, installed FROM games ORDER BY id"):
+            if not installed or not name:
+                yield None
+                continue
+            cover = next((str(d / f"{slug}.jpg") for d in cover_dirs if (d / f"{slug}.jpg").is_file()), "")
+            yield Game(nombre=name, ruta_ejecutable=f"lutris:rungameid/{game_id}", tipo="lutris", cover=cover)
+    finally:
+        db.close()
+
+
+# ============================================================================
+# HEROIC
+# ============================================================================
+def _read_json(path: Path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        if not isinstance(e, FileNotFoundError):
+            print(f"Error leyendo {path}: {e}")
+        return None
+
+
+def heroic_game(runner: str, app_name: str, title: str) -> Game:
+    return Game(nombre=title, ruta_ejecutable=f"heroic://launch/{runner}/{app_name}", tipo="heroic")
+
+
+def read_heroic(config: Path) -> Iterator[Optional[Game]]:
+    # Epic (Legendary): {appName: {"title", "is_dlc", ...}}
+    legendary = _read_json(config / "legendaryConfig" / "legendary" / "installed.json") or {}
+    for app_name, app in legendary.items():
+        if not isinstance(app, dict) or app.get("is_dlc"):
+            yield None
+            continue
+        yield heroic_game("legendary", app_name, app.get("title") or app_name)
+
+    # GOG: installed.json solo trae la ruta; el título está en la biblioteca
+    installed = (_read_json(config / "gog_store" / "installed.json") or {}).get("installed", [])
+    if installed:
+        library = (_read_json(config / "gog_store" / "library.json") or {}).get("games", [])
+        titles = {g.get("app_name"): g.get("title") for g in library if isinstance(g, dict)}
+        for app in installed:
+            app_name = str(app.get("appName", "")) if isinstance(app, dict) else ""
+            if not app_name or app.get("is_dlc"):
+                yield None
+                continue
+            title = titles.get(app_name) or os.path.basename(app.get("install_path", "").rstrip("/")) or app_name
+            yield heroic_game("gog", app_name, title)
+
+    # Apps y juegos añadidos a mano en Heroic
+    sideload = (_read_json(config / "sideload_apps" / "library.json") or {}).get("games", [])
+    for app in sideload:
+        if not isinstance(app, dict) or not app.get("app_name") or not app.get("is_installed", True):
+            yield None
+            continue
+        yield heroic_game("sideload", app["app_name"], app.get("title") or app["app_name"])
+
+
+# ============================================================================
+# IMPORTADOR
+# ============================================================================
+def read_source(source: str, path: Optional[str] = None) -> Iterator[Optional[Game]]:
+    """Juegos de una fuente (None por cada entrada omitida).
+
+    Sin path se usan las ubicaciones habituales (también las de Flatpak);
+    de la carpeta de aplicaciones del usuario solo se toman los juegos.
+    """
+    paths = [Path(os.path.expanduser(path))] if path else DEFAULT_PATHS[source]
+    seen = set()
+    for p in paths:
+        # ~/.steam/steam suele ser un enlace a ~/.local/share/Steam
+        real = os.path.realpath(p)
+        if real in seen:
+            continue
+        seen.add(real)
+        if source == "desktop":
+            if p.is_dir():
+                yield from read_desktop_dir(p, games_only=path is None)
+        elif source == "steam":
+            if (p / "steamapps").is_dir():
+                yield from read_steam(p)
+        elif source == "lutris":
+            yield from read_lutris(p)
+        elif source == "heroic":
+            if p.is_dir():
+                yield from read_heroic(p)
+
+
+class BulkImporter:
+    def __init__(self, known_paths: Iterable[str] = ()):
+        """known_paths: rutas que ya están en la biblioteca (no se vuelven a importar)"""
+        self.known = {path_key(p) for p in known_paths}
+        self.stats = {"imported": 0, "duplicates": 0, "skipped": 0}
+
+    def run(self, sources: Iterable[Tuple[str, Optional[str]]],
+            progress: Optional[Callable[[str, int], None]] = None) -> List[Game]:
+        """Lee las fuentes [(fuente, ruta o None)] y devuelve los juegos nuevos (sin ID).
+
+        progress(fuente, entradas_leídas) se llama desde el hilo que ejecuta
+        run(), como mucho cada PROGRESS_INTERVAL segundos; no toca GTK.
+        """
+        games = []
+        read = 0
+        last_report = time.monotonic()
+        for source, path in sources:
+            try:
+                for game in read_source(source, path):
+                    read += 1
+                    if game is None:
+                        self.stats["skipped"] += 1
+                    elif path_key(game.ruta_ejecutable) in self.known:
+                        self.stats["duplicates"] += 1
+                    else:
+                        self.known.add(path_key(game.ruta_ejecutable))
+                        games.append(game)
+                    if progress is not None and time.monotonic() - last_report >= PROGRESS_INTERVAL:
+                        last_report = time.monotonic()
+                        progress(source, read)
+            except (OSError, sqlite3.Error) as e:
+                print(f"Error importando desde {source}: {e}")
+        if progress is not None:
+            progress("", read)
+        self.stats["imported"] = len(games)
+        return games
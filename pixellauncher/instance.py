@@ -0,0 +1,88 @@
+"""Instancia única de la interfaz.
+
+La interfaz es una Gtk.Application con APP_ID: GApplication registra el
+nombre en el bus de sesión y, si ya hay una instancia abierta, le reenvía la
+línea de órdenes (do_command_line) en vez de abrir otra ventana.
+
+Para que una segunda invocación no pague la importación de GTK, la
+instancia principal mantiene además un flock sobre LOCK_PATH. main.py lo
+consulta sin importar gi y, si está cogido, reenvía los argumentos con un
+Gio.Application remoto, que solo necesita Gio.
+"""
+import fcntl
+import os
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+from pixellauncher.core import APP_ID, CACHE_DIR
+
+RUNTIME_DIR = Path(os.environ.get("XDG_RUNTIME_DIR") or CACHE_DIR)
+LOCK_PATH = RUNTIME_DIR / f"{APP_ID}.lock"
+
+
+def acquire_lock() -> Optional[int]:
+    """La instancia principal toma el cerrojo y lo mantiene hasta salir.
+
+    Devuelve el descriptor (que no hay que cerrar) o None si no se pudo.
+    """
+    try:
+        LOCK_PATH.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(LOCK_PATH, os.O_RDWR | os.O_CREAT | os.O_CLOEXEC, 0o600)
+    except OSError as e:
+        print(f"No se pudo crear {LOCK_PATH}: {e}")
+        return None
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return fd
+    except OSError:
+        os.close(fd)
+        return None
+
+
+def is_running() -> bool:
+    """Hay una instancia principal abierta (sin tocar D-Bus ni importar gi)"""
+    try:
+        fd = os.open(LOCK_PATH, os.O_RDONLY | os.O_CLOEXEC)
+    except OSError:
+        return False
+    try:
+        fcntl.flock(fd, fcntl.LOCK_SH | fcntl.LOCK_NB)
+        return False
+    except BlockingIOError:
+        return True
+    except OSError:
+        return False
+    finally:
+        os.close(fd)
+
+
+def remote_launch_name(argv: List[str]) -> Optional[str]:
+    """Nombre pasado con --launch NOMBRE o --launch=NOMBRE, si lo hay"""
+    for i, arg in enumerate(argv):
+        if arg == "--launch" and i + 1 < len(argv):
+            return argv[i + 1]
+        if arg.startswith("--launch="):
+            return arg.split("=", 1)[1]
+    return None
+
+
+def forward(argv: List[str]) -> Optional[int]:
+    """Envía argv a la instancia principal y devuelve su código de salida.
+
+    None si al final no había instancia (se cerró entre medias): el llamador
+    sigue por el camino normal.
+    """
+    from gi.repository import Gio
+
+    app = Gio.Application(application_id=APP_ID, flags=Gio.ApplicationFlags.HANDLES_COMMAND_LINE)
+    try:
+        app.register(None)
+    except Exception as e:
+        print(f"No se pudo contactar con la instancia abierta: {e}")
+        return None
+    if not app.get_is_remote():
+        # Soltamos el nombre para que lo registre la Gtk.Application de este proceso
+        del app
+        return None
+    return app.run([sys.argv[0]] + list(argv))
@@ -0,0 +1,158 @@
+"""Motor de lanzamiento: ejecución directa del juego, sin shell.
+
+El ejecutable se lanza por su ruta absoluta con su carpeta como directorio
+de trabajo. subprocess toma su camino rápido (vfork/posix_spawn + exec) al
+no haber preexec_fn, y con close_fds solo heredan el juego stdin (/dev/null),
+stdout y stderr.
+
+Los juegos importados de Steam, Lutris o Heroic guardan en ruta_ejecutable
+el URI del juego (steam://rungameid/440) y se lanzan con su cliente.
+
+Con un perfil de lanzamiento (profiles.LaunchProfile) el envoltorio va por
+delante en argv, las variables se añaden al entorno y la afinidad, el nice
+y la clase de E/S se fijan en el hilo que crea el proceso (ver profiles).
+
+prewarm() lee por adelantado el ejecutable y los ficheros de su carpeta a la
+caché de páginas (posix_fadvise WILLNEED) para que el arranque no espere
+al disco.
+"""
+import functools
+import os
+import shutil
+import subprocess
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from pixellauncher.model import Game
+from pixellauncher.profiles import LaunchProfile, apply_to_current_thread
+
+PREWARM_MAX_BYTES = 512 * 1024 * 1024   # No se precarga más que esto por juego
+PREWARM_MAX_FILES = 256
+
+# tipo -> cliente que abre sus URIs
+CLIENTS = {"steam": "steam", "lutris": "lutris", "heroic": "heroic"}
+
+
+@functools.lru_cache(maxsize=None)
+def client_path(client: str) -> str:
+    # Si no está instalado, una ruta absoluta igualmente: así sale como no disponible
+    return shutil.which(client) or os.path.join("/usr/bin", client)
+
+
+def executable(game: Game) -> str:
+    """Fichero que tiene que existir para lanzar el juego"""
+    client = CLIENTS.get(game.tipo)
+    return client_path(client) if client is not None else game.ruta_ejecutable
+
+
+def build_command(game: Game) -> Tuple[List[str], Optional[str]]:
+    """(argv, cwd) para el juego: AppImage tal cual, binario desde su carpeta"""
+    argv, cwd = _base_command(game)
+    if game.perfil:
+        argv = game.perfil.command(argv)
+    return argv, cwd
+
+
+def _base_command(game: Game) -> Tuple[List[str], Optional[str]]:
+    client = CLIENTS.get(game.tipo)
+    if client is not None:
+        return [client_path(client), game.ruta_ejecutable], None
+    ruta = os.path.abspath(game.ruta_ejecutable)
+    if game.tipo == "appimage":
+        return [ruta], None
+    return [ruta], os.path.dirname(ruta)
+
+
+def build_env(game: Game) -> Optional[Dict[str, str]]:
+    """Entorno del juego (None: el del launcher)"""
+    return game.perfil.environment() if game.perfil else None
+
+
+def spawn(argv: List[str], cwd: Optional[str] = None, env: Optional[Dict[str, str]] = None,
+          profile: Optional[LaunchProfile] = None) -> subprocess.Popen:
+    """Lanza argv directamente (sin /bin/sh) en una sesión de procesos propia"""
+    if profile is None or not profile.schedules():
+        return _popen(argv, cwd, env)
+    # El hijo hereda la afinidad, el nice y la E/S del hilo que lo crea:
+    # se fijan en un hilo desechable y se lanza desde él
+    result = {}
+
+    def run():
+        for warning in apply_to_current_thread(profile):
+            print(f"Perfil de lanzamiento: {warning}")
+        try:
+            result["process"] = _popen(argv, cwd, env)
+        except Exception as e:
+            result["error"] = e
+
+    thread = threading.Thread(target=run, name="pixel-launch", daemon=True)
+    thread.start()
+    thread.join()
+    if "error" in result:
+        raise result["error"]
+    return result["process"]
+
+
+def _popen(argv: List[str], cwd: Optional[str], env: Optional[Dict[str, str]]) -> subprocess.Popen:
+    return subprocess.Popen(argv, cwd=cwd, env=env, shell=False, close_fds=True,
+                            stdin=subprocess.DEVNULL, start_new_session=True)
+
+
+def prewarm_files(game: Game) -> List[str]:
+    """Ficheros a precargar: el ejecutable y, para binarios, los de su carpeta"""
+    if game.tipo in CLIENTS:
+        return []   # Lo arranca su cliente: no sabemos qué ficheros leerá
+    ruta = os.path.abspath(game.ruta_ejecutable)
+    files = [ruta]
+    if game.tipo != "appimage":
+        budget = PREWARM_MAX_BYTES
+        try:
+            with os.scandir(os.path.dirname(ruta)) as it:
+                for entry in it:
+                    if len(files) >= PREWARM_MAX_FILES:
+                        break
+                    if entry.path != ruta and entry.is_file():
+                        size = entry.stat().st_size
+                        if size <= budget:
+                            files.append(entry.path)
+                            budget -= size
+        except OSError:
+            pass
+    return files
+
+
+def prewarm(game: Game) -> int:
+    """Pide al kernel que lea los ficheros del juego a la caché de páginas.
+
+    No bloquea esperando al disco (la lectura la hace el kernel en segundo
+    plano). Devuelve los bytes solicitados.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return 0
+    requested = 0
+    for path in prewarm_files(game):
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            requested += os.fstat(fd).st_size
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+    return requested
+
+
+def evict(game: Game):
+    """Saca los ficheros del juego de la caché de páginas (para medir en frío)"""
+    for path in prewarm_files(game):
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
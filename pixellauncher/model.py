@@ -0,0 +1,83 @@
+"""Modelo de juego: un registro compacto con ID estable.
+
+Game usa __slots__ (sin __dict__ por instancia) e interna categoria, tipo e
+icono_emoji, que se repiten en miles de juegos. El formato de games.json no
+cambia: to_dict()/from_dict() traducen, y los campos que este modelo no
+conoce se conservan en `extra` para no perderlos al volver a guardar.
+El perfil de lanzamiento (profiles.LaunchProfile) es opcional: None en la
+mayoría de juegos.
+"""
+import sys
+from typing import Dict, Optional
+
+from pixellauncher.profiles import LaunchProfile
+
+FIELDS = ("nombre", "descripcion", "categoria", "tipo", "ruta_ejecutable", "icono_emoji", "cover")
+INTERNED = ("categoria", "tipo", "icono_emoji")
+_KNOWN = frozenset(FIELDS + ("id", "perfil"))
+
+
+class Game:
+    __slots__ = ("id",) + FIELDS + ("perfil", "extra")
+
+    def __init__(self, nombre: str, ruta_ejecutable: str, descripcion: str = "", categoria: str = "",
+                 tipo: str = "appimage", icono_emoji: str = "🎮", cover: str = "",
+                 id: Optional[int] = None, perfil: Optional[LaunchProfile] = None, extra: Optional[Dict] = None):
+        self.id = id                 # Lo asigna el almacenamiento; no cambia nunca
+        self.nombre = nombre
+        self.descripcion = descripcion
+        self.categoria = sys.intern(categoria)
+        self.tipo = sys.intern(tipo)
+        self.ruta_ejecutable = ruta_ejecutable
+        self.icono_emoji = sys.intern(icono_emoji)
+        self.cover = cover
+        self.perfil = perfil         # Afinidad, prioridad, entorno... (None: ninguno)
+        self.extra = extra           # Campos desconocidos del JSON (None si no hay)
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Game":
+        """Desde el formato de games.json (tolera claves ausentes o de más)"""
+        extra = None
+        if not _KNOWN.issuperset(data):
+            extra = {k: v for k, v in data.items() if k not in _KNOWN}
+        game_id = data.get("id")
+        perfil = data.get("perfil")
+        return cls(
+            nombre=str(data.get("nombre") or ""),
+            ruta_ejecutable=str(data.get("ruta_ejecutable") or ""),
+            descripcion=str(data.get("descripcion") or ""),
+            categoria=str(data.get("categoria") or ""),
+            tipo=str(data.get("tipo") or "appimage"),
+            icono_emoji=str(data.get("icono_emoji") or "🎮"),
+            cover=str(data.get("cover") or ""),
+            id=game_id if isinstance(game_id, int) else None,
+            perfil=LaunchProfile.from_dict(perfil) if isinstance(perfil, dict) else None,
+            extra=extra,
+        )
+
+    def to_dict(self, with_id: bool = True) -> Dict:
+        """Al formato de games.json (mismas claves y orden que antes)"""
+        data = {
+            "nombre": self.nombre,
+            "descripcion": self.descripcion,
+            "categoria": self.categoria,
+            "tipo": self.tipo,
+            "ruta_ejecutable": self.ruta_ejecutable,
+            "icono_emoji": self.icono_emoji,
+        }
+        if self.cover:
+            data["cover"] = self.cover
+        if self.perfil:
+            data["perfil"] = self.perfil.to_dict()
+        if self.extra:
+            data.update(self.extra)
+        if with_id and self.id is not None:
+            data["id"] = self.id
+        return data
+
+    def set(self, field: str, value: str):
+        """Cambia un campo de texto respetando el internado"""
+        setattr(self, field, sys.intern(value) if field in INTERNED else value)
+
+    def __repr__(self):
+        return f"Game(id={self.id!r}, nombre={self.nombre!r})"
@@ -0,0 +1,218 @@
+"""Perfiles de lanzamiento: afinidad de CPU, nice, clase de E/S, entorno y envoltorio.
+
+Cada juego puede llevar un perfil (clave "perfil" en games.json):
+
+    "perfil": {"cpus": "2-5", "nice": 5, "io_clase": "idle",
+               "entorno": {"DXVK_HUD": "fps"}, "envoltorio": "gamemoderun mangohud"}
+
+En Linux la afinidad, el nice y la prioridad de E/S son atributos de cada
+hilo, y un proceso hijo hereda los del hilo que lo crea. launch.spawn los
+fija en un hilo desechable y lanza el juego desde él: el juego arranca ya
+con ellos, sin preexec_fn (subprocess sigue usando vfork) y sin shell ni
+programas intermedios (taskset, nice, ionice). El hilo no se reutiliza:
+volver a subir su prioridad pediría privilegios.
+"""
+import errno
+import os
+import shlex
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+# Clases de E/S del kernel (ioprio): nombre en games.json -> número
+IO_CLASSES = {"realtime": 1, "best-effort": 2, "idle": 3}
+IO_DEFAULT_LEVEL = 4             # 0 (más prioridad) .. 7 (menos)
+_IOPRIO_CLASS_SHIFT = 13
+_IOPRIO_WHO_PROCESS = 1
+# Números de ioprio_set / ioprio_get por arquitectura (no hay envoltorio en os)
+_SYSCALLS = {
+    "x86_64": (251, 252), "i686": (289, 290), "i386": (289, 290), "aarch64": (30, 31),
+    "riscv64": (30, 31), "armv7l": (314, 315), "ppc64le": (273, 274), "s390x": (282, 283),
+}
+_libc = None
+
+
+def parse_cpus(text: str) -> FrozenSet[int]:
+    """Lista de CPUs al estilo de taskset -c: "0-3,6" (ValueError si no es válida)"""
+    cpus = set()
+    for part in text.replace(" ", "").split(","):
+        if not part:
+            continue
+        first, _, last = part.partition("-")
+        start, end = int(first), int(last or first)
+        if start < 0 or end < start:
+            raise ValueError(f"rango de CPUs no válido: {part}")
+        cpus.update(range(start, end + 1))
+    return frozenset(cpus)
+
+
+def format_cpus(cpus: Iterable[int]) -> str:
+    """Al revés que parse_cpus: {0, 1, 2, 3, 6} -> "0-3,6" """
+    parts, run = [], []
+    for cpu in sorted(cpus):
+        if run and cpu != run[-1] + 1:
+            parts.append(str(run[0]) if len(run) == 1 else f"{run[0]}-{run[-1]}")
+            run = []
+        run.append(cpu)
+    if run:
+        parts.append(str(run[0]) if len(run) == 1 else f"{run[0]}-{run[-1]}")
+    return ",".join(parts)
+
+
+def parse_nice(text: str) -> int:
+    nice = int(text)
+    if not -20 <= nice <= 19:
+        raise ValueError(f"nice fuera de rango (-20 a 19): {nice}")
+    return nice
+
+
+def parse_env(text: str) -> Dict[str, str]:
+    """"VAR=valor OTRA='con espacios'" -> dict (ValueError si falta el =)"""
+    env = {}
+    for item in shlex.split(text):
+        name, sep, value = item.partition("=")
+        if not sep or not name:
+            raise ValueError(f"se esperaba VARIABLE=valor: {item}")
+        env[name] = value
+    return env
+
+
+def format_env(env: Dict[str, str]) -> str:
+    return " ".join(f"{name}={shlex.quote(value)}" for name, value in env.items())
+
+
+def _syscall(index: int, *args) -> int:
+    global _libc
+    numbers = _SYSCALLS.get(os.uname().machine)
+    if numbers is None:
+        raise OSError(errno.ENOSYS, "ioprio no disponible en esta arquitectura")
+    if _libc is None:
+        import ctypes   # Solo si algún juego cambia su clase de E/S
+        _libc = ctypes.CDLL(None, use_errno=True)
+    result = _libc.syscall(numbers[index], *args)
+    if result < 0:
+        import ctypes
+        err = ctypes.get_errno()
+        raise OSError(err, os.strerror(err))
+    return result
+
+
+def set_io_priority(io_class: str, level: Optional[int] = None, pid: int = 0):
+    """ioprio_set para pid (0: el hilo actual)"""
+    data = 0 if io_class == "idle" else (IO_DEFAULT_LEVEL if level is None else level)
+    _syscall(0, _IOPRIO_WHO_PROCESS, pid, IO_CLASSES[io_class] << _IOPRIO_CLASS_SHIFT | data)
+
+
+def io_priority(pid: int = 0) -> Tuple[str, int]:
+    """(clase, nivel) de pid (0: el hilo actual); clase "" si no tiene una fijada"""
+    value = _syscall(1, _IOPRIO_WHO_PROCESS, pid)
+    names = {number: name for name, number in IO_CLASSES.items()}
+    return names.get(value >> _IOPRIO_CLASS_SHIFT, ""), value & ((1 << _IOPRIO_CLASS_SHIFT) - 1)
+
+
+class LaunchProfile:
+    __slots__ = ("cpus", "nice", "io_class", "io_level", "env", "wrapper")
+
+    def __init__(self, cpus: Iterable[int] = (), nice: Optional[int] = None, io_class: str = "",
+                 io_level: Optional[int] = None, env: Optional[Dict[str, str]] = None, wrapper: str = ""):
+        self.cpus = frozenset(cpus)      # Vacío: las que elija el kernel
+        self.nice = nice                 # None: el mismo que el launcher
+        self.io_class = io_class         # "" (sin cambios) o una clave de IO_CLASSES
+        self.io_level = io_level         # Para realtime y best-effort; None: IO_DEFAULT_LEVEL
+        self.env = env or {}             # Variables que se añaden al entorno del launcher
+        self.wrapper = wrapper           # Órdenes que envuelven al juego, encadenadas: "gamemoderun mangohud"
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> Optional["LaunchProfile"]:
+        """Desde games.json. Lo que no sea válido se ignora; None si no queda nada"""
+        profile = cls()
+        try:
+            profile.cpus = parse_cpus(str(data.get("cpus") or ""))
+        except ValueError as e:
+            print(f"Perfil de lanzamiento: {e}")
+        nice = data.get("nice")
+        if isinstance(nice, int):
+            profile.nice = max(-20, min(19, nice))
+        if data.get("io_clase") in IO_CLASSES:
+            profile.io_class = data["io_clase"]
+            level = data.get("io_nivel")
+            profile.io_level = max(0, min(7, level)) if isinstance(level, int) else None
+        env = data.get("entorno")
+        if isinstance(env, dict):
+            profile.env = {str(k): str(v) for k, v in env.items()}
+        profile.wrapper = str(data.get("envoltorio") or "")
+        return profile if profile else None
+
+    def to_dict(self) -> Dict:
+        data = {}
+        if self.cpus:
+            data["cpus"] = format_cpus(self.cpus)
+        if self.nice is not None:
+            data["nice"] = self.nice
+        if self.io_class:
+            data["io_clase"] = self.io_class
+            if self.io_level is not None:
+                data["io_nivel"] = self.io_level
+        if self.env:
+            data["entorno"] = dict(self.env)
+        if self.wrapper:
+            data["envoltorio"] = self.wrapper
+        return data
+
+    def __bool__(self):
+        return bool(self.cpus or self.nice is not None or self.io_class or self.env or self.wrapper)
+
+    def __eq__(self, other):
+        return isinstance(other, LaunchProfile) and self.to_dict() == other.to_dict()
+
+    __hash__ = None
+
+    def schedules(self) -> bool:
+        """Cambia algo que hay que fijar al crear el proceso (afinidad, nice, E/S)"""
+        return bool(self.cpus or self.nice is not None or self.io_class)
+
+    def command(self, argv: List[str]) -> List[str]:
+        return shlex.split(self.wrapper) + argv if self.wrapper else argv
+
+    def environment(self) -> Optional[Dict[str, str]]:
+        """Entorno completo del juego, o None para heredar el del launcher tal cual"""
+        return {**os.environ, **self.env} if self.env else None
+
+    def summary(self) -> str:
+        """Resumen para la tarjeta de detalles"""
+        parts = []
+        if self.cpus:
+            parts.append(f"CPUs {format_cpus(self.cpus)}")
+        if self.nice is not None:
+            parts.append(f"nice {self.nice}")
+        if self.io_class:
+            parts.append(f"E/S {self.io_class}" + (f" {self.io_level}" if self.io_level is not None else ""))
+        if self.env:
+            parts.append(f"{len(self.env)} variables")
+        if self.wrapper:
+            parts.append(self.wrapper)
+        return " · ".join(parts)
+
+
+def apply_to_current_thread(profile: LaunchProfile) -> List[str]:
+    """Fija en el hilo actual la afinidad, el nice y la E/S del perfil.
+
+    Sigue aunque algo falle (p. ej. nice negativo sin privilegios) y
+    devuelve los avisos.
+    """
+    warnings = []
+    if profile.cpus:
+        try:
+            os.sched_setaffinity(0, profile.cpus)
+        except OSError as e:
+            warnings.append(f"afinidad {format_cpus(profile.cpus)}: {e.strerror}")
+    if profile.nice is not None:
+        try:
+            # En Linux, setpriority(PRIO_PROCESS, 0) solo afecta al hilo que llama
+            os.setpriority(os.PRIO_PROCESS, 0, profile.nice)
+        except OSError as e:
+            warnings.append(f"nice {profile.nice}: {e.strerror}")
+    if profile.io_class:
+        try:
+            set_io_priority(profile.io_class, profile.io_level)
+        except OSError as e:
+            warnings.append(f"E/S {profile.io_class}: {e.strerror}")
+    return warnings
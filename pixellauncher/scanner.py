@@ -0,0 +1,227 @@
+"""Escáner de carpetas de juegos.
+
+Recorre las carpetas raíz en paralelo (un pool de hilos sobre os.scandir) y
+reconoce los ejecutables por su cabecera, no por la extensión:
+
+- AppImage: ELF con la firma "AI" en e_ident[8:10].
+- Binario nativo: ELF ejecutable (ET_EXEC, o ET_DYN con intérprete PT_INTERP,
+  lo que descarta las bibliotecas .so) con permiso de ejecución. De cada
+  carpeta se toma el mayor, que suele ser el juego.
+
+Guarda una caché en disco: por carpeta su mtime y su listado, y por fichero
+(tamaño, mtime, modo, tipo). El mtime de una carpeta solo cambia con altas,
+bajas y renombrados: si no cambió, no se vuelve a listar, pero cada fichero
+se mira igual con stat, porque reescribirlo o quitarle el permiso de
+ejecución no toca la carpeta. Los ficheros con el mismo (tamaño, mtime,
+modo) no se vuelven a leer.
+"""
+import json
+import os
+import re
+import stat
+import struct
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from pixellauncher.model import Game
+from pixellauncher.storage import write_json_atomic
+
+ELF_MAGIC = b"\x7fELF"
+ET_EXEC, ET_DYN = 2, 3
+PT_INTERP = 3
+MIN_SIZE = 64
+CACHE_VERSION = 2
+PROGRESS_INTERVAL = 0.1      # Segundos mínimos entre avisos de progreso
+ARCH_SUFFIX = re.compile(r"[-_. ]*(x86[-_]64|amd64|x64|i[36]86|aarch64|arm64|linux)\b.*$", re.IGNORECASE)
+VERSION_SUFFIX = re.compile(r"[-_ ]v?\d+(\.\d+)+.*$", re.IGNORECASE)
+
+
+def classify(path: str) -> Optional[str]:
+    """Devuelve "appimage", "binario" o None según la cabecera del fichero"""
+    try:
+        with open(path, 'rb') as f:
+            header = f.read(64)
+            if len(header) < 52 or header[:4] != ELF_MAGIC:
+                return None
+            if header[8:10] == b"AI" and header[10] in (1, 2):
+                return "appimage"
+            is64 = header[4] == 2
+            endian = "<" if header[5] == 1 else ">"
+            e_type = struct.unpack_from(endian + "H", header, 16)[0]
+            if e_type == ET_EXEC:
+                return "binario"
+            if e_type != ET_DYN:
+                return None
+            # ET_DYN: ejecutable PIE si declara intérprete; si no, es una biblioteca
+            if is64:
+                phoff, = struct.unpack_from(endian + "Q", header, 32)
+                phentsize, phnum = struct.unpack_from(endian + "HH", header, 54)
+            else:
+                phoff, = struct.unpack_from(endian + "I", header, 28)
+                phentsize, phnum = struct.unpack_from(endian + "HH", header, 42)
+            f.seek(phoff)
+            table = f.read(phentsize * min(phnum, 64))
+            for i in range(0, len(table) - 3, phentsize):
+                if struct.unpack_from(endian + "I", table, i)[0] == PT_INTERP:
+                    return "binario"
+    except (OSError, struct.error):
+        pass
+    return None
+
+
+def game_name(path: str, tipo: str, from_folder: bool = False) -> str:
+    """Nombre legible a partir del fichero (o de su carpeta, para binarios)"""
+    p = Path(path)
+    raw = p.parent.name if from_folder else p.name
+    if raw.lower().endswith(".appimage"):
+        raw = raw[:-len(".appimage")]
+    raw = ARCH_SUFFIX.sub("", raw) or raw
+    raw = VERSION_SUFFIX.sub("", raw) or raw
+    return re.sub(r"[_\-.]+", " ", raw).strip() or p.name
+
+
+def to_game(path: str, tipo: str, from_folder: bool = False) -> Game:
+    return Game(nombre=game_name(path, tipo, from_folder), ruta_ejecutable=path, tipo=tipo)
+
+
+class LibraryScanner:
+    def __init__(self, cache_path: Optional[Path] = None, workers: int = None):
+        self.cache_path = cache_path
+        self.workers = workers or min(16, (os.cpu_count() or 2) * 2)
+        # carpeta -> {"mtime", "subdirs", "files": {nombre: [tamaño, mtime, modo, tipo]}, "found"}
+        self.dirs: Dict[str, dict] = {}
+        self.stats = {"listed": 0, "read": 0}
+        self._lock = threading.Lock()
+        if cache_path is not None:
+            self._load_cache()
+
+    def _load_cache(self):
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            # Las de versiones anteriores no guardaban el modo: se empieza de cero
+            self.dirs = data["dirs"] if data.get("version") == CACHE_VERSION else {}
+        except (OSError, ValueError, KeyError, AttributeError):
+            self.dirs = {}
+
+    def _save_cache(self):
+        if self.cache_path is None:
+            return
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            write_json_atomic(self.cache_path, {"version": CACHE_VERSION, "dirs": self.dirs})
+        except OSError as e:
+            print(f"Error guardando caché del escáner: {e}")
+
+    def _count(self, key: str):
+        with self._lock:
+            self.stats[key] += 1
+
+    def _list(self, path: str) -> Optional[Tuple[List[str], List[tuple]]]:
+        """Subcarpetas y (nombre, ruta, stat) de los ficheros, con os.scandir"""
+        subdirs, files = [], []
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    if entry.name.startswith("."):
+                        continue
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+                        elif entry.is_file():
+                            files.append((entry.name, entry.path, entry.stat()))
+                    except OSError:
+                        continue
+        except OSError:
+            return None
+        self._count("listed")
+        return subdirs, files
+
+    @staticmethod
+    def _restat(path: str, names: Iterable[str]) -> List[tuple]:
+        """(nombre, ruta, stat) de los ficheros ya conocidos, sin listar la carpeta"""
+        files = []
+        for name in names:
+            full = os.path.join(path, name)
+            try:
+                st = os.stat(full)
+            except OSError:
+                continue
+            if stat.S_ISREG(st.st_mode):
+                files.append((name, full, st))
+        return files
+
+    def _scan_dir(self, path: str, new_dirs: Dict[str, dict]) -> Tuple[List[str], int]:
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return [], 0
+        cached = self.dirs.get(path)
+        old_files = cached["files"] if cached is not None else {}
+        if cached is not None and cached["mtime"] == mtime:
+            # Sin altas ni bajas: se reutiliza el listado anterior
+            subdirs, listing = cached["subdirs"], self._restat(path, old_files)
+        else:
+            listed = self._list(path)
+            if listed is None:
+                return [], 0
+            subdirs, listing = listed
+
+        files, appimages, binary = {}, [], None
+        for name, full, st in listing:
+            key = [st.st_size, st.st_mtime_ns, st.st_mode]
+            old = old_files.get(name)
+            if old is not None and old[:3] == key:
+                tipo = old[3]
+            else:
+                tipo = classify(full) if st.st_size >= MIN_SIZE else None
+                self._count("read")
+            files[name] = key + [tipo]
+            if tipo == "appimage":
+                appimages.append([full, tipo])
+            elif tipo == "binario" and st.st_mode & 0o111 and (binary is None or st.st_size > binary[1]):
+                binary = (full, st.st_size)
+        found = appimages + ([[binary[0], "binario"]] if binary else [])
+        new_dirs[path] = {"mtime": mtime, "subdirs": subdirs, "files": files, "found": found}
+        return subdirs, len(found)
+
+    def scan(self, roots: Iterable[str],
+             progress: Optional[Callable[[int, int], None]] = None) -> List[Game]:
+        """Escanea las raíces y devuelve los juegos encontrados (sin ID todavía).
+
+        progress(carpetas_recorridas, juegos_encontrados) se llama desde el
+        hilo que ejecuta scan(), como mucho cada PROGRESS_INTERVAL segundos
+        y una vez al final; no toca GTK.
+        """
+        self.stats = {"listed": 0, "read": 0}
+        roots = {os.path.abspath(os.path.expanduser(r)) for r in roots}
+        new_dirs: Dict[str, dict] = {}
+        done = found = 0
+        last_report = time.monotonic()
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            pending = {pool.submit(self._scan_dir, r, new_dirs) for r in roots if os.path.isdir(r)}
+            while pending:
+                finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    subdirs, n = future.result()
+                    done += 1
+                    found += n
+                    pending.update(pool.submit(self._scan_dir, sub, new_dirs) for sub in subdirs)
+                if progress is not None and time.monotonic() - last_report >= PROGRESS_INTERVAL:
+                    last_report = time.monotonic()
+                    progress(done, found)
+        if progress is not None:
+            progress(done, found)
+        # Las carpetas que ya no existen desaparecen de la caché
+        changed = self.stats["listed"] or self.stats["read"] or new_dirs.keys() != self.dirs.keys()
+        self.dirs = new_dirs
+        if changed:
+            self._save_cache()
+        games = []
+        for path in sorted(new_dirs):
+            for exe, tipo in new_dirs[path]["found"]:
+                games.append(to_game(exe, tipo, from_folder=tipo == "binario" and path not in roots))
+        return games
@@ -0,0 +1,94 @@
+"""Índice de búsqueda en memoria sobre nombre, categoría y descripción.
+
+Las palabras se normalizan (sin tildes, sin mayúsculas) y se guardan en un
+vocabulario ordenado con su lista de juegos. Una consulta encuentra los
+juegos que tienen, para cada palabra de la consulta, alguna palabra que
+empiece por ella ("cyb 20" encuentra "Cyberpunk 2077").
+
+Es seguro usarlo desde varios hilos (el hilo de carga indexa mientras la
+interfaz consulta).
+"""
+import re
+import threading
+import unicodedata
+from bisect import bisect_left, insort
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from pixellauncher.model import Game
+
+FIELDS = ("nombre", "categoria", "descripcion")
+WORD = re.compile(r"\w+")
+
+
+def fold(text: str) -> str:
+    """Normaliza para comparar: quita tildes/diacríticos y mayúsculas"""
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(c for c in decomposed if not unicodedata.combining(c)).casefold()
+
+
+def tokenize(text: str) -> List[str]:
+    return WORD.findall(fold(text))
+
+
+class SearchIndex:
+    def __init__(self):
+        self._postings: Dict[str, Set[int]] = {}
+        self._vocab: List[str] = []                  # Ordenado, para buscar por prefijo
+        self._doc_words: Dict[int, Tuple[str, ...]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._doc_words)
+
+    def add(self, game_id: int, game: Game):
+        words = set()
+        for field in FIELDS:
+            words.update(tokenize(getattr(game, field)))
+        with self._lock:
+            self._remove(game_id)
+            self._doc_words[game_id] = tuple(words)
+            for word in words:
+                ids = self._postings.get(word)
+                if ids is None:
+                    ids = self._postings[word] = set()
+                    insort(self._vocab, word)
+                ids.add(game_id)
+
+    def add_many(self, games: Iterable[Game]):
+        for game in games:
+            self.add(game.id, game)
+
+    def remove(self, game_id: int):
+        with self._lock:
+            self._remove(game_id)
+
+    def _remove(self, game_id: int):
+        for word in self._doc_words.pop(game_id, ()):
+            ids = self._postings[word]
+            ids.discard(game_id)
+            if not ids:
+                del self._postings[word]
+                del self._vocab[bisect_left(self._vocab, word)]
+
+    def _prefix_matches(self, prefix: str) -> Set[int]:
+        result = set()
+        vocab = self._vocab
+        i = bisect_left(vocab, prefix)
+        while i < len(vocab) and vocab[i].startswith(prefix):
+            result.update(self._postings[vocab[i]])
+            i += 1
+        return result
+
+    def search(self, query: str) -> Optional[Set[int]]:
+        """IDs que coinciden con la consulta, o None si la consulta está vacía"""
+        terms = sorted(set(tokenize(query)), key=len, reverse=True)
+        if not terms:
+            return None
+        with self._lock:
+            # Los términos más largos suelen ser los más selectivos: empezamos por ellos
+            result = self._prefix_matches(terms[0])
+            for term in terms[1:]:
+                if not result:
+                    break
+                result &= self._prefix_matches(term)
+        return result
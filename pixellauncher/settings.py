@@ -0,0 +1,41 @@
+"""Preferencias del launcher (settings.json junto a la biblioteca)."""
+import json
+from pathlib import Path
+from typing import Dict
+
+from pixellauncher.storage import write_json_atomic
+
+DEFAULTS = {
+    # Carpetas que recorre el escáner de biblioteca
+    "scan_roots": ["~/Games", "~/Applications", "~/AppImages"],
+    # Precargar el juego en la caché de páginas al verlo en la tarjeta de detalles
+    "prewarm": False,
+    # Memoria máxima para las miniaturas de portadas ya decodificadas
+    "cover_cache_mb": 64,
+    # Orden de la barra lateral (sorting.MODES) y grupos plegados en el modo por categoría
+    "sort_mode": "nombre",
+    "collapsed_groups": [],
+    # Efectos visuales (gui.RENDER_MODES): "rendimiento" quita sombras, degradados y transiciones
+    "render_mode": "normal",
+}
+
+
+def load_settings(path: Path) -> Dict:
+    settings = json.loads(json.dumps(DEFAULTS))  # copia profunda de los valores por defecto
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            settings.update(json.load(f))
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError) as e:
+        print(f"Error cargando preferencias: {e}")
+    return settings
+
+
+def save_settings(path: Path, settings: Dict) -> bool:
+    try:
+        write_json_atomic(path, settings)
+        return True
+    except OSError as e:
+        print(f"Error guardando preferencias: {e}")
+        return False
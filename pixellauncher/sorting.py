@@ -0,0 +1,231 @@
+"""Orden de la barra lateral: claves precalculadas e índices por categoría.
+
+Cada juego tiene su clave de ordenación calculada una vez (nombre sin tildes
+ni mayúsculas, con el id para desempatar), y se puede calcular de antemano
+en el hilo de carga con prepare(). Es lo único que toca otro hilo, y pasa
+por un cerrojo; las listas solo se tocan desde el bucle de GTK. Los modos se mantienen con listas
+ordenadas (bisect) que se actualizan al añadir o quitar un juego, sin volver
+a ordenar la biblioteca; un lote grande se añade al final y se fusiona
+(timsort une dos tramos ya ordenados en tiempo lineal):
+
+- nombre: por nombre.
+- categoria: un grupo por categoría, cada uno precedido de su cabecera y
+  ordenado por nombre.
+- recientes: por id descendente (los ids crecen con cada alta).
+- jugados: los juegos con tiempo de juego, de más a menos, y después el
+  resto por nombre.
+
+La vista de un modo es una lista de entradas: un int es el id de un juego y
+un str la cabecera de un grupo. insert() y delete() devuelven las posiciones
+que cambian en esa vista, para aplicarlas al modelo de la lista sin
+reconstruirlo.
+"""
+import threading
+from bisect import bisect_left, insort
+from collections import defaultdict
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from pixellauncher.model import Game
+from pixellauncher.search import fold
+
+MODES = {
+    "nombre": "Nombre",
+    "categoria": "Categoría",
+    "recientes": "Añadidos recientemente",
+    "jugados": "Más jugados",
+}
+STATS_MODES = {"jugados"}   # Modos cuyo orden cambia con el tiempo de juego
+NO_CATEGORY = "Sin categoría"
+BULK = 256     # A partir de este tamaño, un lote se fusiona en vez de insertarse juego a juego
+Entry = Union[int, str]
+NameKey = Tuple[str, int]
+
+
+def collation_key(text: str) -> str:
+    return (text.casefold() if text.isascii() else fold(text)).strip()
+
+
+def group_of(game: Game) -> str:
+    return game.categoria or NO_CATEGORY
+
+
+def _group_key(group: str) -> Tuple[str, str]:
+    # "Sin categoría" siempre al final
+    return ("\uffff" if group == NO_CATEGORY else collation_key(group)), group
+
+
+def _discard(items: list, value):
+    i = bisect_left(items, value)
+    if i < len(items) and items[i] == value:
+        del items[i]
+
+
+class SortIndex:
+    def __init__(self, playtime: Optional[Callable[[int], float]] = None):
+        """playtime(id) -> segundos jugados. Se consulta al añadir: tras un
+        cambio de tiempo de juego hay que llamar a update()"""
+        self.playtime = playtime or (lambda game_id: 0)
+        self.keys: Dict[int, Tuple[NameKey, str]] = {}        # id -> (clave de nombre, grupo)
+        self.names: List[NameKey] = []
+        self.ids: List[int] = []
+        self.groups: Dict[str, List[NameKey]] = {}             # grupo -> sus juegos por nombre
+        self.group_order: List[Tuple[str, str]] = []           # (clave, grupo), ordenada
+        self.played: List[Tuple[float, str, int]] = []         # (-segundos, clave, id)
+        self.played_names: List[NameKey] = []
+        self.played_secs: Dict[int, float] = {}                # Lo que hay ahora en played
+        self._prepared: Dict[int, str] = {}                   # Claves de prepare(), con _lock
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.keys)
+
+    def prepare(self, games: Iterable[Game]):
+        """Calcula las claves de antemano (se puede llamar desde otro hilo)"""
+        keys = {game.id: collation_key(game.nombre) for game in games}
+        with self._lock:
+            self._prepared.update(keys)
+
+    def _take_prepared(self, games: List[Game]) -> Dict[int, str]:
+        with self._lock:
+            if not self._prepared:
+                return {}
+            pop = self._prepared.pop
+            return {game.id: pop(game.id, None) for game in games}
+
+    @staticmethod
+    def _name_key(game: Game, prepared: Dict[int, str]) -> NameKey:
+        key = prepared.get(game.id)
+        return (key if key is not None else collation_key(game.nombre)), game.id
+
+    def _add(self, game: Game, prepared: Dict[int, str]):
+        name = self._name_key(game, prepared)
+        group = group_of(game)
+        self.keys[game.id] = (name, group)
+        insort(self.names, name)
+        insort(self.ids, game.id)
+        members = self.groups.get(group)
+        if members is None:
+            members = self.groups[group] = []
+            insort(self.group_order, _group_key(group))
+        insort(members, name)
+        self._add_played(game.id, name)
+
+    def _add_played(self, game_id: int, name: NameKey):
+        secs = self.playtime(game_id)
+        if secs:
+            self.played_secs[game_id] = secs
+            insort(self.played, (-secs, name[0], game_id))
+            insort(self.played_names, name)
+
+    def _remove_played(self, game_id: int, name: NameKey):
+        secs = self.played_secs.pop(game_id, None)
+        if secs is not None:
+            _discard(self.played, (-secs, name[0], game_id))
+            _discard(self.played_names, name)
+
+    def _add_bulk(self, games: List[Game], prepared: Dict[int, str]):
+        names, by_group = [], defaultdict(list)
+        for game in games:
+            name = self._name_key(game, prepared)
+            group = group_of(game)
+            self.keys[game.id] = (name, group)
+            names.append(name)
+            by_group[group].append(name)
+            secs = self.playtime(game.id)
+            if secs:
+                self.played_secs[game.id] = secs
+                self.played.append((-secs, name[0], game.id))
+                self.played_names.append(name)
+        for group, members in by_group.items():
+            if group not in self.groups:
+                self.groups[group] = []
+                insort(self.group_order, _group_key(group))
+            self.groups[group].extend(members)
+            self.groups[group].sort()
+        self.names.extend(names)
+        self.ids.extend(game.id for game in games)
+        for items in (self.names, self.ids, self.played, self.played_names):
+            items.sort()
+
+    def _remove(self, game_id: int):
+        name, group = self.keys.pop(game_id)
+        _discard(self.names, name)
+        _discard(self.ids, game_id)
+        members = self.groups[group]
+        _discard(members, name)
+        if not members:
+            del self.groups[group]
+            _discard(self.group_order, _group_key(group))
+        self._remove_played(game_id, name)
+
+    def header_position(self, group: str) -> int:
+        i = bisect_left(self.group_order, _group_key(group))
+        return i + sum(len(self.groups[g]) for _, g in self.group_order[:i])
+
+    def position(self, mode: str, game_id: int) -> int:
+        """Posición del juego en la vista del modo"""
+        name, group = self.keys[game_id]
+        if mode == "recientes":
+            return len(self.ids) - 1 - bisect_left(self.ids, game_id)
+        if mode == "categoria":
+            return self.header_position(group) + 1 + bisect_left(self.groups[group], name)
+        if mode == "jugados":
+            secs = self.played_secs.get(game_id)
+            if secs is not None:
+                return bisect_left(self.played, (-secs, name[0], game_id))
+            # Tras los jugados, el resto por nombre (sin contar los jugados)
+            return len(self.played) + bisect_left(self.names, name) - bisect_left(self.played_names, name)
+        return bisect_left(self.names, name)
+
+    def order(self, mode: str) -> List[Entry]:
+        """La vista completa del modo, sin ordenar nada"""
+        if mode == "recientes":
+            return self.ids[::-1]
+        if mode == "categoria":
+            view = []
+            for _, group in self.group_order:
+                view.append(group)
+                view.extend(game_id for _, game_id in self.groups[group])
+            return view
+        if mode == "jugados":
+            return ([game_id for _, _, game_id in self.played]
+                    + [game_id for _, game_id in self.names if game_id not in self.played_secs])
+        return [game_id for _, game_id in self.names]
+
+    def insert(self, games: Iterable[Game], mode: str) -> List[Tuple[int, Entry]]:
+        """Añade juegos. Devuelve (posición, entrada) a insertar en la vista, en orden creciente"""
+        games = list(games)
+        new_groups = {group_of(g) for g in games} - self.groups.keys()
+        prepared = self._take_prepared(games)
+        if len(games) >= BULK:
+            self._add_bulk(games, prepared)
+        else:
+            for game in games:
+                self._add(game, prepared)
+        changes = [(self.position(mode, game.id), game.id) for game in games]
+        if mode == "categoria":
+            changes += [(self.header_position(group), group) for group in new_groups]
+        changes.sort(key=lambda change: change[0])
+        return changes
+
+    def delete(self, game_id: int, mode: str) -> List[int]:
+        """Quita un juego. Devuelve las posiciones a quitar de la vista, de mayor a menor"""
+        positions = [self.position(mode, game_id)]
+        group = self.keys[game_id][1]
+        if mode == "categoria" and len(self.groups[group]) == 1:
+            positions.append(self.header_position(group))
+        self._remove(game_id)
+        return positions
+
+    def update(self, game: Game, mode: str) -> Tuple[List[int], List[Tuple[int, Entry]]]:
+        """Recoloca un juego cuyo nombre, categoría o tiempo de juego cambió"""
+        return self.delete(game.id, mode), self.insert([game], mode)
+
+    def refresh_playtime(self, game_id: int):
+        """Pone al día el tiempo de juego sin tocar la vista (para modos fuera de STATS_MODES)"""
+        name = self.keys[game_id][0]
+        self._remove_played(game_id, name)
+        self._add_played(game_id, name)
+
+    def group_ids(self, group: str) -> List[int]:
+        return [game_id for _, game_id in self.groups.get(group, ())]
@@ -0,0 +1,180 @@
+"""Estadísticas de juego: registro de sesiones en disco y totales por juego.
+
+Cada lanzamiento y cada salida se añaden al final de sessions.log como un
+registro binario de tamaño fijo (RECORD): una sola llamada a write() con
+O_APPEND, sin releer ni reescribir nada. Al mismo tiempo se actualizan en
+memoria los totales del juego (GameStats), que se consultan en O(1).
+
+Los totales se guardan en stats.json junto con la posición del registro
+hasta la que llegan. Al arrancar se cargan y se reaplica solo la cola del
+registro: si el launcher se cerró de golpe no se pierde ninguna sesión, y
+un registro a medias (escritura cortada) se descarta. Cada COMPACT_RECORDS
+registros se compacta: se guardan los totales y el registro vuelve a cero.
+"""
+import json
+import os
+import struct
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+from pixellauncher.storage import write_json_atomic
+
+# tipo (B), relleno, código de salida (h), id (I), instante (d), duración (f): 20 bytes
+RECORD = struct.Struct("<BxhIdf")
+LAUNCH, EXIT, FORGET = 1, 2, 3
+COMPACT_RECORDS = 10000          # Registros tras los que se compacta
+SNAPSHOT_VERSION = 1
+
+
+class GameStats:
+    __slots__ = ("launches", "playtime", "last_played")
+
+    def __init__(self, launches: int = 0, playtime: float = 0.0, last_played: float = 0.0):
+        self.launches = launches         # Veces lanzado
+        self.playtime = playtime         # Segundos jugados en total
+        self.last_played = last_played   # Último lanzamiento (epoch), 0 si nunca
+
+
+class StatsStore:
+    def __init__(self, directory: Path):
+        self.log_path = directory / "sessions.log"
+        self.snapshot_path = directory / "stats.json"
+        self.games: Dict[int, GameStats] = {}
+        self.pending = 0             # Registros en sessions.log (desde la última compactación)
+        self._fd = None
+        self._lock = threading.Lock()
+
+    # --- Consulta (O(1)) ---
+    def get(self, game_id: int) -> Optional[GameStats]:
+        return self.games.get(game_id)
+
+    def playtime(self, game_id: int) -> float:
+        stats = self.games.get(game_id)
+        return stats.playtime if stats is not None else 0.0
+
+    # --- Escritura ---
+    def record_launch(self, game_id: int, when: float):
+        self._append(LAUNCH, game_id, when)
+
+    def record_exit(self, game_id: int, when: float, duration: float, exit_code: Optional[int] = None):
+        self._append(EXIT, game_id, when, duration, exit_code or 0)
+
+    def forget(self, game_id: int):
+        """Borra las estadísticas de un juego eliminado.
+
+        Los IDs ya no se repiten, así que no es para que otro juego herede
+        sus números: sirve para que la instantánea no arrastre juegos que
+        ya no existen.
+        """
+        if game_id in self.games:
+            self._append(FORGET, game_id, 0.0)
+
+    def _append(self, kind: int, game_id: int, when: float, duration: float = 0.0, exit_code: int = 0):
+        record = RECORD.pack(kind, max(-32768, min(32767, exit_code)), game_id, when, duration)
+        with self._lock:
+            self._apply(kind, game_id, when, duration)
+            try:
+                if self._fd is None:
+                    self._fd = os.open(self.log_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+                os.write(self._fd, record)
+                self.pending += 1
+            except OSError as e:
+                print(f"Error guardando estadísticas: {e}")
+                return
+            if self.pending >= COMPACT_RECORDS:
+                self._compact()
+
+    def _apply(self, kind: int, game_id: int, when: float, duration: float):
+        if kind == FORGET:
+            self.games.pop(game_id, None)
+            return
+        stats = self.games.get(game_id)
+        if stats is None:
+            stats = self.games[game_id] = GameStats()
+        if kind == LAUNCH:
+            stats.launches += 1
+            stats.last_played = max(stats.last_played, when)
+        elif kind == EXIT:
+            stats.playtime += duration
+
+    # --- Arranque y compactación ---
+    def load(self) -> int:
+        """Carga los totales y reaplica la cola del registro. Devuelve los registros reaplicados"""
+        with self._lock:
+            offset = self._load_snapshot()
+            try:
+                size = os.path.getsize(self.log_path)
+            except OSError:
+                size = 0
+            if offset > size:
+                # Se cortó entre vaciar el registro y guardar los totales: se
+                # guardan ya con offset 0, antes de que el registro vuelva a crecer
+                offset = 0
+                self._write_snapshot(0)
+            usable = size - (size - offset) % RECORD.size
+            replayed = 0
+            if usable > offset:
+                with open(self.log_path, 'rb') as f:
+                    f.seek(offset)
+                    data = f.read(usable - offset)
+                apply = self._apply
+                for kind, _, game_id, when, duration in RECORD.iter_unpack(data):
+                    apply(kind, game_id, when, duration)
+                replayed = (usable - offset) // RECORD.size
+            if usable < size:
+                # Registro a medias de un cierre brusco: fuera, para no desalinear lo siguiente
+                print(f"Estadísticas: descartado un registro incompleto ({size - usable} bytes)")
+                os.truncate(self.log_path, usable)
+            self.pending = usable // RECORD.size
+            if self.pending >= COMPACT_RECORDS:
+                self._compact()
+            return replayed
+
+    def _load_snapshot(self) -> int:
+        try:
+            with open(self.snapshot_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") != SNAPSHOT_VERSION:
+                raise ValueError(f"versión desconocida {data.get('version')}")
+            self.games = {int(game_id): GameStats(*values) for game_id, values in data["games"].items()}
+            return int(data["offset"])
+        except FileNotFoundError:
+            self.games = {}
+            return 0
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            # Sin totales válidos: se rehacen con todo el registro
+            print(f"Error cargando estadísticas: {e}")
+            self.games = {}
+            return 0
+
+    def _compact(self):
+        """Guarda los totales y vacía el registro (con el cerrojo tomado)"""
+        try:
+            size = os.path.getsize(self.log_path) if self.log_path.exists() else 0
+            self._write_snapshot(size)
+            # Si se corta entre truncate y la segunda instantánea, al arrancar
+            # el offset pasa del tamaño del registro (vacío): load() lo pone a 0
+            # y no reaplica nada, porque estos totales ya lo incluyen todo
+            os.truncate(self.log_path, 0)
+            self._write_snapshot(0)
+            self.pending = 0
+        except OSError as e:
+            print(f"Error compactando estadísticas: {e}")
+
+    def _write_snapshot(self, offset: int):
+        write_json_atomic(self.snapshot_path, {
+            "version": SNAPSHOT_VERSION,
+            "offset": offset,
+            "games": {game_id: [s.launches, s.playtime, s.last_played] for game_id, s in self.games.items()},
+        })
+
+    def compact(self):
+        with self._lock:
+            self._compact()
+
+    def close(self):
+        with self._lock:
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
@@ -0,0 +1,407 @@
+"""Backends de almacenamiento de la biblioteca de juegos.
+
+- JsonStorage: el games.json clásico. Reescribe el fichero completo en cada
+  cambio, pero de forma atómica (fichero temporal + fsync + rename).
+- SqliteStorage: una fila por juego. Cada alta/baja/edición escribe solo ese
+  registro en una transacción. Migra el games.json existente la primera vez.
+
+Varios procesos pueden escribir a la vez (otra instancia, la línea de
+órdenes, un script). JsonStorage escribe con un cerrojo consultivo (flock)
+y, si el fichero cambió desde que lo leyó, lo relee y aplica su cambio sobre
+lo nuevo en vez de pisarlo; SQLite ya bloquea y escribe registro a registro.
+has_external_changes()/reload() permiten a la interfaz enterarse.
+
+Los backends guardan y devuelven model.Game; en disco el formato sigue siendo
+el dict de siempre. Cada juego lleva un "id" entero y estable asignado por el
+backend, que no se reutiliza: el de un juego eliminado no vuelve a darse a
+otro (SQLite con AUTOINCREMENT; JsonStorage guarda el siguiente ID en
+.games.json.next_id).
+"""
+import fcntl
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+
+from pixellauncher.model import Game
+from pixellauncher.trace import span
+
+
+class Storage:
+    """Interfaz común de los backends"""
+
+    def load(self) -> List[Game]:
+        return [game for batch in self.iter_batches() for game in batch]
+
+    def iter_batches(self, size: int = 500) -> Iterator[List[Game]]:
+        raise NotImplementedError
+
+    def save(self, games: List[Game]):
+        """Reemplaza la biblioteca completa (ruta de compatibilidad)"""
+        raise NotImplementedError
+
+    def add(self, game: Game):
+        """Inserta un juego y le asigna game.id"""
+        raise NotImplementedError
+
+    def add_many(self, games: List[Game]):
+        """Inserta un lote en una sola escritura"""
+        for game in games:
+            self.add(game)
+
+    def update(self, game: Game):
+        raise NotImplementedError
+
+    def remove(self, game: Game):
+        raise NotImplementedError
+
+    def watch_paths(self) -> List[Path]:
+        """Ficheros que cambian cuando alguien escribe en la biblioteca"""
+        return []
+
+    def has_external_changes(self) -> bool:
+        """Otro proceso cambió la biblioteca desde el último reload() (consulta barata)"""
+        return False
+
+    def reload(self) -> List[Game]:
+        """Relee la biblioteca completa tal como está ahora en disco"""
+        return self.load()
+
+    def close(self):
+        pass
+
+
+def _assign_ids(games: List[Game], next_id: int = 1) -> int:
+    """Da ID a los juegos que no tienen, a partir de next_id. Devuelve el siguiente libre"""
+    next_id = max(next_id, max((g.id for g in games if g.id is not None), default=0) + 1)
+    for game in games:
+        if game.id is None:
+            game.id = next_id
+            next_id += 1
+    return next_id
+
+
+def read_next_id(path: Path) -> int:
+    """Contador de IDs de JsonStorage (1 si no existe o no se puede leer)"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return max(1, int(f.read()))
+    except FileNotFoundError:
+        return 1
+    except (OSError, ValueError) as e:
+        print(f"Error leyendo el contador de IDs: {e}")
+        return 1
+
+
+def write_json_games(path: Path, games: List[Game]):
+    write_json_atomic(path, [game.to_dict() for game in games])
+
+
+def write_json_atomic(path: Path, data):
+    """Escribe JSON en un temporal y lo renombra: nunca deja un fichero a medias"""
+    tmp = path.with_name(f".{path.name}.tmp")
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=4, ensure_ascii=False)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+@contextmanager
+def file_lock(path: Path):
+    """Cerrojo consultivo entre procesos (flock) sobre un fichero auxiliar.
+
+    No se bloquea el propio games.json porque cada escritura lo sustituye
+    por otro fichero (rename).
+    """
+    with open(path, 'a') as f:
+        with span("flock: esperar", "storage"):
+            fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def file_signature(path: Path) -> Optional[Tuple[int, int, int]]:
+    """Identifica una versión del fichero: cada rename trae un inodo nuevo"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_ino, st.st_mtime_ns, st.st_size
+
+
+def read_json_games(path: Path) -> List[Game]:
+    """Lee un games.json. Si está corrupto lo aparta (.corrupt) en vez de perderlo.
+
+    Un error de lectura (permisos, E/S) no es corrupción: se propaga y el
+    fichero se queda donde está.
+    """
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+    except FileNotFoundError:
+        return []
+    try:
+        games = json.loads(data.decode('utf-8'))
+        if not isinstance(games, list):
+            raise ValueError("se esperaba una lista de juegos")
+        return [Game.from_dict(game) for game in games]
+    except (ValueError, AttributeError, TypeError) as e:
+        backup = path.with_name(path.name + ".corrupt")
+        print(f"Error cargando JSON: {e}. Copia apartada en {backup}")
+        try:
+            os.replace(path, backup)
+        except OSError:
+            pass
+        return []
+
+
+class JsonStorage(Storage):
+    def __init__(self, path: Path):
+        self.path = path
+        self.lock_path = path.with_name(f".{path.name}.lock")
+        self.next_id_path = path.with_name(f".{path.name}.next_id")
+        self.games = None
+        self.signature = None        # Versión del fichero que refleja self.games
+        self.foreign = False         # Se leyeron cambios de otro proceso desde el último reload()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def _locked(self):
+        with self._lock, file_lock(self.lock_path):
+            yield
+
+    def _games(self) -> List[Game]:
+        """La biblioteca en memoria; se relee si otro proceso cambió el fichero"""
+        signature = file_signature(self.path)
+        if self.games is None or signature != self.signature:
+            if self.games is not None:
+                self.foreign = True
+            with span("games.json: leer", "storage"):
+                self.games = read_json_games(self.path)
+            self._assign(self.games)
+            self.signature = signature
+        return self.games
+
+    def _assign(self, games: List[Game]):
+        """_assign_ids con el contador en disco, que queda por encima de todo ID visto.
+
+        Con el cerrojo tomado, antes de escribir games.json: si se corta
+        entre medias solo se salta algún ID.
+        """
+        stored = read_next_id(self.next_id_path)
+        next_id = _assign_ids(games, stored)
+        if next_id != stored:
+            write_json_atomic(self.next_id_path, next_id)
+
+    def _write(self, games: List[Game]):
+        with span("games.json: escribir", "storage"):
+            write_json_games(self.path, games)
+        self.signature = file_signature(self.path)
+
+    def iter_batches(self, size: int = 500) -> Iterator[List[Game]]:
+        with self._locked():
+            games = list(self._games())
+        for i in range(0, len(games), size):
+            yield games[i:i + size]
+
+    def save(self, games: List[Game]):
+        with self._locked():
+            self._assign(games)
+            self.games = list(games)
+            self._write(self.games)
+
+    # Altas, ediciones y bajas se aplican sobre la versión más reciente del
+    # fichero: lo que otro proceso escribió entre medias se conserva
+    def add(self, game: Game):
+        with self._locked():
+            games = self._games()
+            game.id = None
+            games.append(game)
+            self._assign(games)
+            self._write(games)
+
+    def add_many(self, games: List[Game]):
+        with self._locked():
+            stored = self._games()
+            for game in games:
+                game.id = None
+            stored.extend(games)
+            self._assign(stored)
+            self._write(stored)
+
+    def update(self, game: Game):
+        with self._locked():
+            games = self._games()
+            for i, existing in enumerate(games):
+                if existing.id == game.id:
+                    games[i] = game
+                    break
+            else:
+                return   # Otro proceso lo eliminó: gana la baja
+            self._write(games)
+
+    def remove(self, game: Game):
+        with self._locked():
+            self.games = [g for g in self._games() if g.id != game.id]
+            self._write(self.games)
+
+    def watch_paths(self) -> List[Path]:
+        return [self.path]
+
+    def has_external_changes(self) -> bool:
+        with self._lock:
+            return self.foreign or (self.games is not None and file_signature(self.path) != self.signature)
+
+    def reload(self) -> List[Game]:
+        with self._locked():
+            self.games = None
+            self.foreign = False
+            return list(self._games())
+
+
+class SqliteStorage(Storage):
+    # AUTOINCREMENT: el ID de un juego eliminado no se vuelve a dar
+    SCHEMA = "CREATE TABLE IF NOT EXISTS games (id INTEGER PRIMARY KEY AUTOINCREMENT, data TEXT NOT NULL)"
+
+    def __init__(self, path: Path, legacy_json: Path = None):
+        self.path = path
+        self._lock = threading.Lock()
+        # Si otro proceso está escribiendo, se espera a que termine (hasta 10 s)
+        self.db = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None, timeout=10)
+        try:
+            # WAL + NORMAL: cada commit es atómico y un cierre brusco no corrompe la base
+            self._enable_wal()
+            self.db.execute("PRAGMA synchronous=NORMAL")
+            self.db.execute(self.SCHEMA)
+            if legacy_json is not None and legacy_json.exists() and self._is_empty():
+                self._migrate(legacy_json)
+        except Exception:
+            # Sin migrar no se abre: una base vacía acabaría ocultando la biblioteca
+            self.db.close()
+            raise
+        self._seen_version = self._data_version()
+
+    def _enable_wal(self):
+        # Pasar a WAL necesita la base para sí sola y no respeta el timeout:
+        # si otro proceso la está abriendo o migrando a la vez, se reintenta
+        deadline = time.monotonic() + 10
+        while True:
+            try:
+                self.db.execute("PRAGMA journal_mode=WAL")
+                return
+            except sqlite3.OperationalError:
+                if time.monotonic() > deadline:
+                    raise
+                time.sleep(0.05)
+
+    def _data_version(self) -> int:
+        # Cambia solo cuando otra conexión (otro proceso) confirma una transacción
+        return self.db.execute("PRAGMA data_version").fetchone()[0]
+
+    def _is_empty(self) -> bool:
+        return self.db.execute("SELECT 1 FROM games LIMIT 1").fetchone() is None
+
+    def _migrate(self, legacy_json: Path):
+        # Comprobar que está vacía e importar en una sola transacción: si otro
+        # proceso migra a la vez (--add mientras arranca la interfaz), espera
+        # a que este termine y se encuentra la base ya llena
+        with self.db:
+            self.db.execute("BEGIN IMMEDIATE")
+            if not self._is_empty():
+                return
+            games = read_json_games(legacy_json)
+            self._insert_all(games)
+            # Los IDs que JsonStorage ya dio (y luego se eliminaron) siguen sin repetirse
+            next_id = read_next_id(legacy_json.with_name(f".{legacy_json.name}.next_id"))
+            seq = self.db.execute("SELECT seq FROM sqlite_sequence WHERE name = 'games'").fetchone()
+            if next_id - 1 > (seq[0] if seq else 0):
+                self.db.execute("DELETE FROM sqlite_sequence WHERE name = 'games'")
+                self.db.execute("INSERT INTO sqlite_sequence (name, seq) VALUES ('games', ?)", (next_id - 1,))
+        try:
+            os.replace(legacy_json, legacy_json.with_name(legacy_json.name + ".migrated"))
+        except FileNotFoundError:
+            pass   # Estaba corrupto (read_json_games lo apartó) u otro proceso ya lo renombró
+        print(f"Biblioteca migrada a {self.path.name} ({len(games)} juegos)")
+
+    @staticmethod
+    def _encode(game: Game) -> str:
+        return json.dumps(game.to_dict(with_id=False), ensure_ascii=False)
+
+    def iter_batches(self, size: int = 500) -> Iterator[List[Game]]:
+        with self._lock:
+            self._seen_version = self._data_version()
+            with span("sqlite: consultar", "storage"):
+                rows = self.db.execute("SELECT id, data FROM games ORDER BY id").fetchall()
+        for i in range(0, len(rows), size):
+            batch = []
+            with span("sqlite: decodificar lote", "storage"):
+                for game_id, data in rows[i:i + size]:
+                    game = Game.from_dict(json.loads(data))
+                    game.id = game_id
+                    batch.append(game)
+            yield batch
+
+    def save(self, games: List[Game]):
+        with self._lock:
+            with span("sqlite: reescribir", "storage"), self.db:
+                self.db.execute("BEGIN IMMEDIATE")
+                self.db.execute("DELETE FROM games")
+                self._insert_all(games)
+
+    def _insert_all(self, games: List[Game]):
+        """Inserta los juegos (dentro de una transacción ya abierta)"""
+        self.db.executemany("INSERT INTO games (id, data) VALUES (?, ?)",
+                            ((g.id, self._encode(g)) for g in games if g.id is not None))
+        # Los nuevos, con el siguiente ID de AUTOINCREMENT (nunca uno ya usado)
+        for game in games:
+            if game.id is None:
+                cur = self.db.execute("INSERT INTO games (data) VALUES (?)", (self._encode(game),))
+                game.id = cur.lastrowid
+
+    def add(self, game: Game):
+        with self._lock:
+            cur = self.db.execute("INSERT INTO games (data) VALUES (?)", (self._encode(game),))
+            game.id = cur.lastrowid
+
+    def add_many(self, games: List[Game]):
+        with self._lock:
+            with span("sqlite: insertar lote", "storage"), self.db:
+                self.db.execute("BEGIN IMMEDIATE")
+                for game in games:
+                    cur = self.db.execute("INSERT INTO games (data) VALUES (?)", (self._encode(game),))
+                    game.id = cur.lastrowid
+
+    def update(self, game: Game):
+        with self._lock:
+            self.db.execute("UPDATE games SET data = ? WHERE id = ?", (self._encode(game), game.id))
+
+    def remove(self, game: Game):
+        with self._lock:
+            self.db.execute("DELETE FROM games WHERE id = ?", (game.id,))
+
+    def watch_paths(self) -> List[Path]:
+        # En modo WAL las confirmaciones van al -wal; el .db cambia al consolidar
+        return [self.path, self.path.with_name(self.path.name + "-wal")]
+
+    def has_external_changes(self) -> bool:
+        with self._lock:
+            return self._data_version() != self._seen_version
+
+    def close(self):
+        with self._lock:
+            self.db.close()
+
+
+def open_storage(config_dir: Path, backend: str = "sqlite") -> Storage:
+    """Abre el backend indicado ("sqlite" o "json") dentro de config_dir"""
+    games_json = config_dir / "games.json"
+    if backend == "json":
+        return JsonStorage(games_json)
+    return SqliteStorage(config_dir / "games.db", legacy_json=games_json)
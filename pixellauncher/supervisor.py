@@ -0,0 +1,96 @@
+"""Supervisor de los juegos lanzados (requiere GLib).
+
+Cada proceso hijo queda registrado con una sesión (inicio, fin, código de
+salida). GLib los recoge (waitpid) con child_watch en el propio bucle
+principal, así que no quedan zombis ni hace falta un hilo que sondee, por
+muchos juegos que haya abiertos a la vez.
+"""
+import os
+import signal
+import subprocess
+import time
+from typing import Callable, Dict, List, Optional
+
+from gi.repository import GLib
+
+from pixellauncher.launch import spawn
+from pixellauncher.profiles import LaunchProfile
+
+CRASH_WINDOW = 10.0          # Salir con error antes de estos segundos cuenta como fallo al arrancar
+
+
+class Session:
+    __slots__ = ("game_id", "pid", "started", "ended", "exit_code", "process")
+
+    def __init__(self, game_id, process: subprocess.Popen):
+        self.game_id = game_id
+        self.pid = process.pid
+        self.process = process
+        self.started = time.time()
+        self.ended: Optional[float] = None
+        self.exit_code: Optional[int] = None   # Negativo: terminado por esa señal
+
+    @property
+    def running(self) -> bool:
+        return self.ended is None
+
+    @property
+    def crashed(self) -> bool:
+        """Terminó con error nada más arrancar"""
+        return (self.exit_code not in (None, 0)
+                and self.ended - self.started < CRASH_WINDOW)
+
+
+class AlreadyRunning(Exception):
+    pass
+
+
+class ProcessSupervisor:
+    def __init__(self, on_change: Callable[[Session], None] = None):
+        """on_change(sesión) se llama en el bucle principal al arrancar y al terminar un juego"""
+        self.on_change = on_change
+        self.running: Dict[object, Session] = {}
+        self.history: List[Session] = []
+
+    def is_running(self, game_id) -> bool:
+        return game_id in self.running
+
+    def launch(self, game_id, argv: List[str], cwd: Optional[str] = None,
+               env: Optional[Dict[str, str]] = None, profile: Optional[LaunchProfile] = None) -> Session:
+        """Arranca el juego (launch.spawn) y lo vigila.
+
+        Lanza AlreadyRunning si ya está abierto y OSError si no se puede ejecutar.
+        """
+        if game_id in self.running:
+            raise AlreadyRunning(game_id)
+        process = spawn(argv, cwd, env, profile)
+        session = Session(game_id, process)
+        self.running[game_id] = session
+        GLib.child_watch_add(GLib.PRIORITY_DEFAULT, process.pid, self._on_exit, session)
+        self._notify(session)
+        return session
+
+    def _on_exit(self, pid, status, session: Session):
+        session.exit_code = os.waitstatus_to_exitcode(status)
+        session.ended = time.time()
+        # GLib ya hizo el waitpid: que subprocess no lo intente de nuevo
+        session.process.returncode = session.exit_code
+        session.process = None
+        self.running.pop(session.game_id, None)
+        self.history.append(session)
+        self._notify(session)
+
+    def terminate(self, game_id, sig: int = signal.SIGTERM) -> bool:
+        """Envía la señal a todo el grupo de procesos del juego"""
+        session = self.running.get(game_id)
+        if session is None:
+            return False
+        try:
+            os.killpg(session.pid, sig)
+            return True
+        except ProcessLookupError:
+            return False
+
+    def _notify(self, session: Session):
+        if self.on_change is not None:
+            self.on_change(session)
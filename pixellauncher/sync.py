@@ -0,0 +1,39 @@
+"""Diferencias entre la biblioteca en memoria y la que hay en disco.
+
+Cuando otro proceso cambia la biblioteca, la interfaz la relee entera (en un
+hilo) y aplica solo lo que cambió: juegos nuevos, editados y eliminados,
+por ID. Comparar es barato: una tupla con los campos de cada juego.
+"""
+from operator import attrgetter
+from typing import Dict, Iterable, List, NamedTuple
+
+from pixellauncher.model import FIELDS, Game
+
+_state = attrgetter(*FIELDS, "perfil", "extra")
+
+
+class LibraryDiff(NamedTuple):
+    added: List[Game]
+    changed: List[Game]       # La versión nueva, con el mismo ID
+    removed: List[int]
+
+    def __bool__(self):
+        return bool(self.added or self.changed or self.removed)
+
+
+def same_game(a: Game, b: Game) -> bool:
+    return _state(a) == _state(b)
+
+
+def diff_library(current: Dict[int, Game], fresh: Iterable[Game]) -> LibraryDiff:
+    """Compara la biblioteca actual (id -> juego) con la recién leída"""
+    added, changed, seen = [], [], set()
+    for game in fresh:
+        seen.add(game.id)
+        old = current.get(game.id)
+        if old is None:
+            added.append(game)
+        elif not same_game(old, game):
+            changed.append(game)
+    removed = [game_id for game_id in current if game_id not in seen]
+    return LibraryDiff(added, changed, removed)
@@ -0,0 +1,23 @@
+"""Medición del arranque: tiempo transcurrido desde que se creó el proceso."""
+import os
+import time
+
+_IMPORTED = time.perf_counter()
+
+
+def process_uptime() -> float:
+    """Segundos desde el arranque del proceso.
+
+    En Linux se calcula con /proc (incluye el arranque del intérprete);
+    en otros sistemas, desde la importación de este módulo.
+    """
+    try:
+        with open("/proc/self/stat") as f:
+            # El campo 2 (comm) puede contener espacios: partimos tras el ')'
+            fields = f.read().rsplit(")", 1)[1].split()
+        start_ticks = int(fields[19])
+        with open("/proc/uptime") as f:
+            uptime = float(f.read().split()[0])
+        return uptime - start_ticks / os.sysconf("SC_CLK_TCK")
+    except (OSError, ValueError, IndexError):
+        return time.perf_counter() - _IMPORTED
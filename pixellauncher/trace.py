@@ -0,0 +1,162 @@
+"""Modo de instrumentación: spans, vigilante de bloqueos y traza para Chrome/Perfetto.
+
+Se activa con --trace[=FICHERO] o con PIXEL_LAUNCHER_TRACE=1|FICHERO, y
+tiene que decidirse antes de importar el resto del paquete: con el modo
+apagado, @traced devuelve la función tal cual y span() un contexto vacío
+ya creado. Ese with vacío aún cuesta unos 0,2 µs: en los bucles calientes
+(las portadas) se comprueba trace.ENABLED antes de abrirlo.
+
+Con el modo encendido:
+
+- cada función marcada con @traced deja un evento "X" (inicio y duración)
+  con el hilo en que se ejecutó;
+- los bloques with span(...) de las rutas calientes (lotes de la carga,
+  refresh_list, lecturas y escrituras del almacenamiento, portadas y
+  metadatos de AppImages) dejan sus fases como eventos dentro de esas
+  funciones;
+- un latido en el bucle de GLib (cada HEARTBEAT_MS) y un hilo vigilante
+  detectan las iteraciones que pasan de PIXEL_LAUNCHER_STALL_MS (100 por
+  defecto): se imprime la pila de Python del hilo principal en ese momento
+  y el bloqueo queda en la traza;
+- al salir se escribe {"traceEvents": [...]} (abrir en chrome://tracing o
+  ui.perfetto.dev).
+"""
+import atexit
+import contextlib
+import functools
+import json
+import os
+import sys
+import threading
+import time
+import traceback
+from pathlib import Path
+
+_setting = os.environ.get("PIXEL_LAUNCHER_TRACE", "")
+ENABLED = _setting not in ("", "0")
+STALL_MS = int(os.environ.get("PIXEL_LAUNCHER_STALL_MS", "100"))
+HEARTBEAT_MS = 20
+MAX_EVENTS = 1_000_000
+
+_events = []
+_pid = os.getpid()
+_null = contextlib.nullcontext()
+
+
+def _now_us() -> float:
+    return time.perf_counter_ns() / 1000
+
+
+def _record(name: str, cat: str, start: float, end: float, args: dict = None):
+    if len(_events) < MAX_EVENTS:
+        event = {"name": name, "cat": cat, "ph": "X", "ts": start, "dur": end - start,
+                 "pid": _pid, "tid": threading.get_ident()}
+        if args:
+            event["args"] = args
+        _events.append(event)
+
+
+def traced(fn):
+    """Decorador: mide cada llamada a fn (sin efecto con el modo apagado)"""
+    if not ENABLED:
+        return fn
+    name = fn.__qualname__
+    cat = fn.__module__.rsplit(".", 1)[-1]
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        start = _now_us()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            _record(name, cat, start, _now_us())
+    return wrapper
+
+
+def span(name: str, cat: str = "span"):
+    """with span("nombre"): ... mide un bloque"""
+    return _Span(name, cat) if ENABLED else _null
+
+
+class _Span:
+    __slots__ = ("name", "cat", "start")
+
+    def __init__(self, name: str, cat: str):
+        self.name, self.cat = name, cat
+
+    def __enter__(self):
+        self.start = _now_us()
+
+    def __exit__(self, *exc):
+        _record(self.name, self.cat, self.start, _now_us())
+        return False
+
+
+class Watchdog:
+    """Detecta iteraciones del bucle principal más largas que threshold_ms"""
+
+    def __init__(self, threshold_ms: int = STALL_MS):
+        self.threshold = threshold_ms / 1000
+        self.main_ident = threading.main_thread().ident
+        self.last_beat = time.perf_counter()
+        self.stall_start = None
+
+    def start(self):
+        from gi.repository import GLib
+        GLib.timeout_add(HEARTBEAT_MS, self._beat, priority=GLib.PRIORITY_HIGH)
+        threading.Thread(target=self._watch, name="trace-watchdog", daemon=True).start()
+
+    def _beat(self):
+        now = time.perf_counter()
+        if self.stall_start is not None:
+            start_us, stack = self.stall_start
+            self.stall_start = None
+            _record("main loop stall", "watchdog", start_us, now * 1e6, {"stack": stack})
+            print(f"[trace] bucle principal bloqueado {(now - self.last_beat) * 1000:.0f} ms", file=sys.stderr)
+        self.last_beat = now
+        return True
+
+    def _watch(self):
+        while True:
+            time.sleep(self.threshold / 2)
+            last = self.last_beat
+            if self.stall_start is None and time.perf_counter() - last > self.threshold:
+                frame = sys._current_frames().get(self.main_ident)
+                stack = "".join(traceback.format_stack(frame)) if frame is not None else ""
+                self.stall_start = (last * 1e6, stack)
+                print(f"[trace] el bucle principal lleva más de {self.threshold * 1000:.0f} ms "
+                      f"sin responder:\n{stack}", file=sys.stderr, flush=True)
+
+
+def start_watchdog():
+    if ENABLED:
+        Watchdog().start()
+
+
+def output_path() -> Path:
+    if _setting not in ("1", "true"):
+        return Path(_setting)
+    from pixellauncher.core import CACHE_DIR
+    return CACHE_DIR / "traces" / time.strftime("trace-%Y%m%d-%H%M%S.json")
+
+
+def export(path: Path = None) -> Path:
+    """Escribe la traza en formato Chrome Trace Event"""
+    path = path or output_path()
+    threads = [{"name": "thread_name", "ph": "M", "pid": _pid, "tid": t.ident, "args": {"name": t.name}}
+               for t in threading.enumerate()]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({"traceEvents": threads + _events, "displayTimeUnit": "ms"}, f)
+    return path
+
+
+def _export_at_exit():
+    try:
+        print(f"[trace] {len(_events)} eventos en {export()}", file=sys.stderr)
+    except OSError as e:
+        print(f"[trace] no se pudo escribir la traza: {e}", file=sys.stderr)
+
+
+if ENABLED:
+    atexit.register(_export_at_exit)
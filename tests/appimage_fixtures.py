@@ -0,0 +1,237 @@
+"""AppImages sintéticas para probar y medir pixellauncher.appimage.
+
+No hace falta mksquashfs: aquí hay un escritor mínimo de squashfs 4.0
+(directorios, ficheros con fragmentos y enlaces simbólicos; gzip o xz) y un
+runtime ELF de 128 bytes con la firma "AI" de tipo 2. Las AppImages
+resultantes no se pueden ejecutar, solo leer.
+
+    make_appimage(ruta, {"juego.desktop": b"...", "juego.png": png,
+                         ".DirIcon": Link("juego.png")}, compression="xz")
+"""
+import lzma
+import os
+import struct
+import zlib
+from typing import Dict, List, Tuple, Union
+
+METADATA_SIZE = 8192
+NO_FRAGMENT = 0xFFFFFFFF
+COMPRESSION_IDS = {"gzip": 1, "xz": 4}
+
+
+class Link:
+    def __init__(self, target: str):
+        self.target = target
+
+
+Tree = Dict[str, Union[bytes, Link, "Tree"]]
+
+
+def runtime_stub() -> bytes:
+    """Cabecera ELF64 con firma AppImage tipo 2 y una tabla de secciones vacía"""
+    ident = b"\x7fELF" + bytes([2, 1, 1, 0]) + b"AI\x02" + bytes(5)
+    header = ident + struct.pack("<HHIQQQIHHHHHH", 2, 62, 1, 0, 0, 64, 0, 64, 56, 0, 64, 1, 0)
+    return header + bytes(64)
+
+
+def tree_from_paths(files: Dict[str, Union[bytes, Link]]) -> Tree:
+    """{"usr/share/x.png": datos} -> árbol de diccionarios"""
+    tree: Tree = {}
+    for path, content in files.items():
+        node = tree
+        *dirs, name = path.split("/")
+        for d in dirs:
+            node = node.setdefault(d, {})
+        node[name] = content
+    return tree
+
+
+class _MetadataWriter:
+    def __init__(self, compress):
+        self.compress = compress
+        self.out = bytearray()
+        self.buf = bytearray()
+
+    def position(self) -> Tuple[int, int]:
+        """(inicio en disco del bloque actual, desplazamiento dentro de él)"""
+        return len(self.out), len(self.buf)
+
+    def write(self, data: bytes):
+        self.buf += data
+        while len(self.buf) >= METADATA_SIZE:
+            self._flush(bytes(self.buf[:METADATA_SIZE]))
+            del self.buf[:METADATA_SIZE]
+
+    def _flush(self, block: bytes):
+        packed = self.compress(block)
+        if len(packed) < len(block):
+            self.out += struct.pack("<H", len(packed)) + packed
+        else:
+            self.out += struct.pack("<H", len(block) | 0x8000) + block
+
+    def finish(self) -> bytes:
+        if self.buf:
+            self._flush(bytes(self.buf))
+            self.buf.clear()
+        return bytes(self.out)
+
+
+class SquashWriter:
+    def __init__(self, compression: str = "gzip", block_size: int = 4096, fragments: bool = True):
+        self.compression = COMPRESSION_IDS[compression]
+        if compression == "gzip":
+            self.compress = lambda data: zlib.compress(data, 9)
+        else:
+            self.compress = lambda data: lzma.compress(data, format=lzma.FORMAT_XZ, check=lzma.CHECK_CRC32)
+        self.block_size = block_size
+        self.use_fragments = fragments
+        self.data = bytearray()
+        self.fragments: List[Tuple[int, int]] = []     # (inicio, tamaño en disco)
+        self.fragment_buf = bytearray()
+        self.inodes = _MetadataWriter(self.compress)
+        self.dirs = _MetadataWriter(self.compress)
+        self.numbers: Dict[object, int] = {}
+        self.count = 0
+
+    def _store(self, block: bytes) -> int:
+        """Escribe un bloque de datos y devuelve su entrada de tamaño"""
+        packed = self.compress(block)
+        if len(packed) < len(block):
+            self.data += packed
+            return len(packed)
+        self.data += block
+        return len(block) | 0x1000000
+
+    def _flush_fragment(self):
+        if self.fragment_buf:
+            start = 96 + len(self.data)
+            size = self._store(bytes(self.fragment_buf))
+            self.fragments.append((start, size))
+            self.fragment_buf.clear()
+
+    def _file_inode(self, content: bytes) -> bytes:
+        bs = self.block_size
+        start = 96 + len(self.data)
+        full = len(content) // bs if self.use_fragments else -(-len(content) // bs)
+        sizes = [self._store(content[i * bs:(i + 1) * bs]) for i in range(full)]
+        tail = content[full * bs:]
+        fragment, frag_offset = NO_FRAGMENT, 0
+        if tail:
+            if len(self.fragment_buf) + len(tail) > bs:
+                self._flush_fragment()
+            fragment, frag_offset = len(self.fragments), len(self.fragment_buf)
+            self.fragment_buf += tail
+        return (struct.pack("<IIII", start, fragment, frag_offset, len(content))
+                + struct.pack(f"<{len(sizes)}I", *sizes))
+
+    def _number(self, tree: Tree):
+        """Números de inodo en preorden (la raíz es el 1)"""
+        self.count += 1
+        self.numbers[id(tree)] = self.count
+        for name in sorted(tree):
+            child = tree[name]
+            if isinstance(child, dict):
+                self._number(child)
+            else:
+                self.count += 1
+                self.numbers[id(tree), name] = self.count
+
+    def _write_inode(self, itype: int, number: int, body: bytes) -> int:
+        block, offset = self.inodes.position()
+        self.inodes.write(struct.pack("<HHHHII", itype, 0o755, 0, 0, 0, number) + body)
+        return (block << 16) | offset
+
+    def _write_dir(self, tree: Tree, parent: int) -> int:
+        number = self.numbers[id(tree)]
+        entries = []
+        for name in sorted(tree):
+            child = tree[name]
+            if isinstance(child, dict):
+                ref = self._write_dir(child, number)
+                entries.append((name, ref, self.numbers[id(child)], 1))
+            elif isinstance(child, Link):
+                child_number = self.numbers[id(tree), name]
+                target = child.target.encode()
+                ref = self._write_inode(3, child_number, struct.pack("<II", 1, len(target)) + target)
+                entries.append((name, ref, child_number, 3))
+            else:
+                child_number = self.numbers[id(tree), name]
+                ref = self._write_inode(2, child_number, self._file_inode(child))
+                entries.append((name, ref, child_number, 2))
+
+        block_index, block_offset = self.dirs.position()
+        listing = bytearray()
+        i = 0
+        while i < len(entries):
+            # Una cabecera agrupa entradas cuyos inodos empiezan en el mismo bloque
+            start = entries[i][1] >> 16
+            group = [entries[i]]
+            while (i + len(group) < len(entries) and len(group) < 256
+                   and entries[i + len(group)][1] >> 16 == start):
+                group.append(entries[i + len(group)])
+            base = group[0][2]
+            listing += struct.pack("<III", len(group) - 1, start, base)
+            for name, ref, child_number, itype in group:
+                encoded = name.encode()
+                listing += struct.pack("<HhHH", ref & 0xFFFF, child_number - base, itype, len(encoded) - 1)
+                listing += encoded
+            i += len(group)
+        self.dirs.write(bytes(listing))
+        body = struct.pack("<IIHHI", block_index, len(entries) + 2, len(listing) + 3, block_offset, parent)
+        return self._write_inode(1, number, body)
+
+    def build(self, tree: Tree) -> bytes:
+        self._number(tree)
+        root_ref = self._write_dir(tree, self.count + 1)
+        self._flush_fragment()
+
+        image = bytearray(bytes(96) + self.data)
+        inode_table = len(image)
+        image += self.inodes.finish()
+        dir_table = len(image)
+        image += self.dirs.finish()
+
+        fragment_meta = _MetadataWriter(self.compress)
+        fragment_meta.write(b"".join(struct.pack("<QII", start, size, 0) for start, size in self.fragments))
+        fragment_blocks = len(image)
+        image += fragment_meta.finish()
+        fragment_table = len(image)
+        image += struct.pack("<Q", fragment_blocks)
+
+        id_meta = _MetadataWriter(self.compress)
+        id_meta.write(struct.pack("<I", 0))
+        id_block = len(image)
+        image += id_meta.finish()
+        id_table = len(image)
+        image += struct.pack("<Q", id_block)
+
+        block_log = self.block_size.bit_length() - 1
+        flags = 0x0200 if self.use_fragments else 0x0210     # NO_XATTRS (y NO_FRAGMENTS)
+        image[:96] = struct.pack("<4sIIIIHHHHHHQQQQQQQQ", b"hsqs", self.count, 0, self.block_size,
+                                 len(self.fragments), self.compression, block_log, flags, 1, 4, 0,
+                                 root_ref, len(image), id_table, 0xFFFFFFFFFFFFFFFF,
+                                 inode_table, dir_table, fragment_table, 0xFFFFFFFFFFFFFFFF)
+        image += bytes(-len(image) % 4096)
+        return bytes(image)
+
+
+def make_appimage(path, files: Dict[str, Union[bytes, Link]], compression: str = "gzip",
+                  block_size: int = 4096, fragments: bool = True):
+    """Escribe en path una AppImage tipo 2 con esos ficheros dentro"""
+    image = SquashWriter(compression, block_size, fragments).build(tree_from_paths(files))
+    with open(path, 'wb') as f:
+        f.write(runtime_stub() + image)
+    os.chmod(path, 0o755)
+
+
+def desktop_file(name: str, comment: str = "", categories: str = "Game;", icon: str = "juego",
+                 extra: str = "") -> bytes:
+    return (f"[Desktop Entry]\nType=Application\nName={name}\nComment={comment}\n"
+            f"Exec=AppRun\nIcon={icon}\nCategories={categories}\n{extra}"
+            f"\n[Desktop Action Nueva]\nName=No es el nombre\n").encode()
+
+
+def fake_png(seed: int, size: int = 2000) -> bytes:
+    """Bytes con firma PNG (no es una imagen válida; el lector solo los copia)"""
+    body = bytes((seed * 31 + i * 7) & 0xFF for i in range(size))
+    return b"\x89PNG\r\n\x1a\n" + body
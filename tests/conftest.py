@@ -0,0 +1,50 @@
+"""Configuración común de los tests.
+
+Como en benchmarks/common.py, HOME se redirige a un directorio temporal
+ANTES de importar pixellauncher (core.CONFIG_DIR se calcula al importar):
+los tests nunca tocan la biblioteca real del usuario.
+"""
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+TEST_HOME = Path(tempfile.mkdtemp(prefix="pixel-test-"))
+os.environ["HOME"] = str(TEST_HOME)
+os.environ.pop("XDG_CACHE_HOME", None)
+
+
+@pytest.fixture
+def home() -> Path:
+    """HOME temporal; se vacía al terminar cada test"""
+    yield TEST_HOME
+    from pixellauncher.core import GamesManager
+    if GamesManager._storage is not None:
+        GamesManager._storage.close()
+        GamesManager._storage = None
+    for entry in TEST_HOME.iterdir():
+        if entry.is_dir() and not entry.is_symlink():
+            shutil.rmtree(entry, ignore_errors=True)
+        else:
+            entry.unlink()
+
+
+@pytest.fixture
+def make_library():
+    """Biblioteca sintética de n juegos, con IDs 1..n"""
+    from pixellauncher.model import Game
+    def make(n: int):
+        return [Game(id=i, nombre=f"Juego Ñandú {i}", ruta_ejecutable=f"/opt/juegos/{i}/juego",
+                     categoria="RPG", tipo="binario", icono_emoji="🎮") for i in range(1, n + 1)]
+    return make
+
+
+def pytest_sessionfinish(session, exitstatus):
+    shutil.rmtree(TEST_HOME, ignore_errors=True)
@@ -0,0 +1,32 @@
+-- Extracto del esquema de pga.db de Lutris (solo las columnas que se leen y
+-- algunas más para que se parezca al real). bench_importers.py crea la base
+-- a partir de este fichero.
+CREATE TABLE games (
+    id INTEGER PRIMARY KEY,
+    name TEXT,
+    sortname TEXT,
+    slug TEXT,
+    installer_slug TEXT,
+    parent_slug TEXT,
+    platform TEXT,
+    runner TEXT,
+    executable TEXT,
+    directory TEXT,
+    updated DATETIME,
+    lastplayed INTEGER,
+    installed INTEGER,
+    installed_at INTEGER,
+    year INTEGER,
+    configpath TEXT,
+    has_custom_banner INTEGER,
+    has_custom_icon INTEGER,
+    playtime REAL,
+    hidden INTEGER,
+    service TEXT,
+    service_id TEXT
+);
+INSERT INTO games (id, name, slug, platform, runner, directory, installed, configpath) VALUES
+    (1, 'World of Warcraft', 'world-of-warcraft', 'Windows', 'wine', '/home/jugador/Games/world-of-warcraft', 1, 'world-of-warcraft-1620000000'),
+    (2, 'Super Mario World', 'super-mario-world', 'Nintendo SNES', 'libretro', '', 1, 'super-mario-world-1620000001'),
+    (3, 'Diablo II', 'diablo-ii', 'Windows', 'wine', '', 0, ''),
+    (4, 'Señor de los Ladrones', 'senor-de-los-ladrones', 'Linux', 'linux', '/home/jugador/Games/ladrones', 1, 'senor-de-los-ladrones-1620000003');
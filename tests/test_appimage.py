@@ -0,0 +1,90 @@
+"""Metadatos de AppImages (appimage.MetadataCache) con AppImages sintéticas
+(tests.appimage_fixtures), también rotas: una AppImage corrupta cuenta como
+"sin metadatos" y no tumba al escáner ni al diálogo.
+"""
+import random
+
+import pytest
+
+from pixellauncher import appimage
+from pixellauncher.appimage import MetadataCache, fill_game
+from pixellauncher.scanner import to_game
+from tests.appimage_fixtures import Link, desktop_file, fake_png, make_appimage
+
+CATEGORIES = [("Game;RolePlaying;", "RPG"), ("Game;ActionGame;", "Acción"),
+              ("Game;StrategyGame;", "Estrategia"), ("Game;", "")]
+
+
+def make_game_appimage(path, i: int, compression: str) -> tuple:
+    categories, categoria = CATEGORIES[i % len(CATEGORIES)]
+    nombre = f"Juego Sintético {i}"
+    icon = fake_png(i, 2000 + 37 * i)
+    make_appimage(path, {
+        f"juego{i}.desktop": desktop_file(nombre, f"Descripción {i}", categories, f"juego{i}"),
+        f"usr/share/icons/hicolor/256x256/apps/juego{i}.png": icon,
+        ".DirIcon": Link(f"usr/share/icons/hicolor/256x256/apps/juego{i}.png"),
+        "AppRun": b"#!/bin/sh\n" * 50,
+        "usr/bin/juego": bytes(range(256)) * (40 + i),
+    }, compression=compression)
+    return nombre, f"Descripción {i}", categoria, icon
+
+
+@pytest.fixture
+def cache(home):
+    return MetadataCache(home / "cache" / "appimage-meta.json", home / "cache" / "icons")
+
+
+@pytest.mark.parametrize("compression", ("gzip", "xz"))
+def test_reads_metadata(home, cache, compression):
+    expected = {}
+    for i in range(len(CATEGORIES)):
+        path = home / f"Juego_{i}-x86_64.AppImage"
+        expected[str(path)] = make_game_appimage(path, i, compression)
+    metas = cache.get_many(expected)
+    for path, (nombre, descripcion, categoria, icon) in expected.items():
+        game = to_game(path, "appimage")
+        assert fill_game(game, metas[path])
+        assert (game.nombre, game.descripcion, game.categoria) == (nombre, descripcion, categoria)
+        with open(game.cover, 'rb') as f:
+            assert f.read() == icon
+
+
+def test_cache_survives_a_new_instance(home, cache, monkeypatch):
+    path = str(home / "Juego.AppImage")
+    make_game_appimage(path, 0, "gzip")
+    meta = cache.get_many([path])[path]
+    monkeypatch.setattr(appimage, "read_metadata", lambda *args: pytest.fail("se volvió a leer"))
+    assert MetadataCache(cache.cache_path, cache.icon_dir).get(path) == meta
+
+
+def test_truncated_is_cached_as_no_metadata(home, cache, monkeypatch):
+    path = home / "Rota.AppImage"
+    make_game_appimage(path, 0, "xz")
+    data = path.read_bytes()
+    path.write_bytes(data[:len(data) // 2])
+    assert cache.get(str(path)) is None
+    monkeypatch.setattr(appimage, "read_metadata", lambda *args: pytest.fail("se volvió a leer"))
+    assert cache.get(str(path)) is None
+
+
+def test_not_an_appimage(home, cache):
+    path = home / "texto.AppImage"
+    path.write_text("#!/bin/sh\necho hola\n")
+    assert cache.get(str(path)) is None
+    assert cache.get(str(home / "no existe.AppImage")) is None
+
+
+@pytest.mark.parametrize("compression", ("gzip", "xz"))
+def test_corrupt_bytes_never_raise(home, cache, compression):
+    path = home / "Corrupta.AppImage"
+    make_game_appimage(path, 1, compression)
+    good = path.read_bytes()
+    rnd = random.Random(7)
+    for _ in range(200):
+        data = bytearray(good)
+        for _ in range(rnd.randint(1, 8)):
+            data[rnd.randrange(128, len(data))] = rnd.randrange(256)
+        path.write_bytes(bytes(data))
+        cache.entries.clear()
+        meta = cache.get(str(path))
+        assert meta is None or isinstance(meta["nombre"], str)
@@ -0,0 +1,64 @@
+"""availability.AvailabilityIndex: rutas comprobadas en un hilo, carpetas
+vigiladas con Gio.FileMonitor hasta MAX_MONITORS y revisadas con stat()
+las que pasan de ahí.
+"""
+import os
+import time
+
+import pytest
+
+pytest.importorskip("gi")
+from gi.repository import GLib  # noqa: E402
+
+from pixellauncher import availability  # noqa: E402
+
+
+def run_until(cond, timeout: float = 10.0) -> bool:
+    """Hace girar un GLib.MainLoop hasta que cond() se cumple o pasa timeout"""
+    loop = GLib.MainLoop()
+    deadline = time.monotonic() + timeout
+    def check():
+        if cond() or time.monotonic() > deadline:
+            loop.quit()
+            return False
+        return True
+    GLib.timeout_add(5, check)
+    loop.run()
+    return cond()
+
+
+@pytest.fixture
+def games(home):
+    """Tres carpetas con un ejecutable cada una"""
+    paths = []
+    for i in range(3):
+        path = home / f"carpeta{i}" / "juego"
+        path.parent.mkdir()
+        path.touch(mode=0o755)
+        paths.append(str(path))
+    return paths
+
+
+def test_monitors_are_capped(games, monkeypatch):
+    monkeypatch.setattr(availability, "MAX_MONITORS", 1)
+    index = availability.AvailabilityIndex(lambda changed: None)
+    index.check(games)
+    assert run_until(lambda: len(index.status) == len(games))
+    assert all(index.get(path) for path in games)
+    assert len(index.monitors) == 1 and len(index.polled) == 2
+
+
+def test_polled_directory_is_rechecked(games, monkeypatch):
+    monkeypatch.setattr(availability, "MAX_MONITORS", 0)
+    changes = []
+    index = availability.AvailabilityIndex(changes.extend)
+    index.check(games)
+    assert run_until(lambda: len(index.status) == len(games))
+    changes.clear()
+
+    time.sleep(0.05)   # El mtime de la carpeta avanza a saltos de unos milisegundos
+    os.remove(games[1])
+    index._poll()   # Lo que haría el temporizador pasados POLL_SECONDS
+    assert run_until(lambda: index.get(games[1]) is False)
+    assert changes == [games[1]]
+    assert index.get(games[0]) and index.get(games[2])
@@ -0,0 +1,92 @@
+"""Importadores con los ficheros de ejemplo de tests/fixtures/importers
+(Steam, Lutris, Heroic y una carpeta de .desktop, sin ningún launcher
+instalado), y los duplicados: entre fuentes, con la biblioteca y al añadir
+desde la línea de órdenes.
+"""
+import os
+import shutil
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from pixellauncher import cli
+from pixellauncher.core import GamesManager
+from pixellauncher.importers import BulkImporter
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures" / "importers"
+
+EXPECTED = {
+    "desktop": {
+        ("SuperTux (es)", "/usr/games/supertux2", "binario", "Arcade"),
+        ("Celeste", "/opt/Mis Juegos/Celeste-x86_64.AppImage", "appimage", "Acción"),
+        ("Portal 2", "steam://rungameid/620", "steam", ""),
+        ("Control", "heroic://launch/legendary/Quail", "heroic", ""),
+    },
+    "steam": {
+        ("Portal 2", "steam://rungameid/620", "steam", ""),
+        ("Hollow Knight", "steam://rungameid/367520", "steam", ""),
+        ("Baldur's Gate 3", "steam://rungameid/1086940", "steam", ""),
+    },
+    "lutris": {
+        ("World of Warcraft", "lutris:rungameid/1", "lutris", ""),
+        ("Super Mario World", "lutris:rungameid/2", "lutris", ""),
+        ("Señor de los Ladrones", "lutris:rungameid/4", "lutris", ""),
+    },
+    "heroic": {
+        ("Control", "heroic://launch/legendary/Quail", "heroic", ""),
+        ("Red Dead Redemption 2", "heroic://launch/legendary/Fang", "heroic", ""),
+        ("Stardew Valley", "heroic://launch/gog/1453375253", "heroic", ""),
+        ("Sin Titulo", "heroic://launch/gog/1207658924", "heroic", ""),
+        ("Celeste (itch.io)", "heroic://launch/sideload/XpO1bQ3kdl2cCzMhZfw8cT", "heroic", ""),
+    },
+}
+SKIPPED = {"desktop": 1, "steam": 3, "lutris": 1, "heroic": 1}
+COVERS = {"steam": {"steam://rungameid/620"}, "lutris": {"lutris:rungameid/1"}}
+
+
+@pytest.fixture
+def sources(home, monkeypatch) -> dict:
+    """Copia los ejemplos, completa las rutas de Steam y crea pga.db. Devuelve fuente -> ruta"""
+    monkeypatch.setenv("LANG", "es_ES.UTF-8")   # Para Name[es] de los .desktop
+    target = home / "fixtures"
+    shutil.copytree(FIXTURES, target)
+    vdf = target / "steam" / "steamapps" / "libraryfolders.vdf"
+    text = vdf.read_text(encoding="utf-8")
+    vdf.write_text(text.replace("@STEAM@", str(target / "steam"))
+                   .replace("@LIBRARY2@", str(target / "steam-library2")), encoding="utf-8")
+    db = sqlite3.connect(str(target / "lutris" / "pga.db"))
+    db.executescript((target / "lutris" / "pga.sql").read_text(encoding="utf-8"))
+    db.close()
+    return {"desktop": target / "desktop", "steam": target / "steam",
+            "lutris": target / "lutris" / "pga.db", "heroic": target / "heroic"}
+
+
+@pytest.mark.parametrize("source", EXPECTED)
+def test_source(sources, source):
+    importer = BulkImporter()
+    games = importer.run([(source, str(sources[source]))])
+    assert {(g.nombre, g.ruta_ejecutable, g.tipo, g.categoria) for g in games} == EXPECTED[source]
+    assert importer.stats["skipped"] == SKIPPED[source]
+    assert {g.ruta_ejecutable for g in games if g.cover} == COVERS.get(source, set())
+
+
+def test_duplicates_across_sources_and_library(sources):
+    # SuperTux ya estaba en la biblioteca, con otra forma de la misma ruta
+    importer = BulkImporter(["/usr/games/../games/supertux2"])
+    games = importer.run([(source, str(sources[source])) for source in EXPECTED])
+    assert len(games) == len(set().union(*EXPECTED.values())) - 1
+    assert importer.stats["duplicates"] == 3
+    assert "/usr/games/supertux2" not in {g.ruta_ejecutable for g in games}
+
+
+def test_cli_add_does_not_duplicate(home, capsys):
+    game = home / "juegos" / "juego"
+    game.parent.mkdir()
+    game.write_text("#!/bin/sh\n")
+    game.chmod(0o755)
+    assert cli.run(["--add", str(game), "--nombre", "Juego"]) == 0
+    # La misma ruta escrita de otra forma
+    assert cli.run(["--add", os.path.join(str(home), "juegos", "..", "juegos", "juego")]) == 0
+    assert "Ya está en la biblioteca: Juego" in capsys.readouterr().out
+    assert [g.ruta_ejecutable for g in GamesManager.load_games()] == [str(game)]
@@ -0,0 +1,88 @@
+"""Instancia única: el cerrojo (instance.acquire_lock / is_running) y el
+reenvío de main.py a la instancia abierta.
+
+El reenvío se prueba con una instancia principal falsa (un Gio.Application
+con APP_ID que apunta lo que recibe), sin GTK. Necesita gi y un bus de
+sesión (en CI, dbus-run-session).
+"""
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from pixellauncher import instance
+
+ROOT = Path(__file__).resolve().parent.parent
+EXIT_CODE = 7
+
+PRIMARY = """
+import json, sys
+from gi.repository import Gio, GLib
+from pixellauncher import instance
+from pixellauncher.core import APP_ID
+app = Gio.Application(application_id=APP_ID, flags=Gio.ApplicationFlags.HANDLES_COMMAND_LINE)
+def on_command_line(app, command_line):
+    with open(sys.argv[1], "a") as f:
+        f.write(json.dumps(command_line.get_arguments()[1:]) + "\\n")
+    return %d
+app.connect("command-line", on_command_line)
+app.register(None)
+lock = instance.acquire_lock()
+GLib.MainLoop().run()   # Sin app.run: no se apunta su propia línea de órdenes
+""" % EXIT_CODE
+
+
+def test_remote_launch_name():
+    assert instance.remote_launch_name(["--launch", "Doom"]) == "Doom"
+    assert instance.remote_launch_name(["--trace", "--launch=Ōkami 2"]) == "Ōkami 2"
+    assert instance.remote_launch_name(["--launch"]) is None
+    assert instance.remote_launch_name(["--list"]) is None
+
+
+def test_lock(home, monkeypatch):
+    monkeypatch.setattr(instance, "LOCK_PATH", home / "run" / "instancia.lock")
+    assert not instance.is_running()
+    fd = instance.acquire_lock()
+    assert fd is not None and instance.is_running()
+    assert instance.acquire_lock() is None
+    os.close(fd)
+    assert not instance.is_running()
+
+
+@pytest.fixture
+def primary(home, monkeypatch):
+    """Instancia principal falsa. Devuelve (entorno, fichero donde apunta lo recibido)"""
+    pytest.importorskip("gi")
+    if not os.environ.get("DBUS_SESSION_BUS_ADDRESS"):
+        pytest.skip("sin bus de sesión")
+    received = home / "recibido.jsonl"
+    env = dict(os.environ, XDG_RUNTIME_DIR=str(home / "run"), PYTHONPATH=str(ROOT))
+    proc = subprocess.Popen([sys.executable, "-c", PRIMARY, str(received)], env=env)
+    monkeypatch.setattr(instance, "LOCK_PATH", home / "run" / instance.LOCK_PATH.name)
+    deadline = time.monotonic() + 10
+    while not instance.is_running():
+        assert proc.poll() is None, "la instancia principal terminó al arrancar"
+        assert time.monotonic() < deadline, "la instancia principal no tomó el cerrojo"
+        time.sleep(0.05)
+    yield env, received
+    proc.terminate()
+    proc.wait()
+
+
+def run_main(env, *args):
+    return subprocess.run([sys.executable, str(ROOT / "main.py")] + list(args), env=env,
+                          stdout=subprocess.DEVNULL, timeout=60).returncode
+
+
+def test_main_forwards_to_open_instance(primary):
+    env, received = primary
+    assert run_main(env) == EXIT_CODE
+    assert run_main(env, "--launch", "Juego Ñandú") == EXIT_CODE
+    # El resto de órdenes no se reenvían: las resuelve la línea de órdenes
+    assert run_main(env, "--list") == 0
+    lines = received.read_text().splitlines()
+    assert [json.loads(line) for line in lines] == [[], ["--launch", "Juego Ñandú"]]
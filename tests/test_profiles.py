@@ -0,0 +1,85 @@
+"""Perfiles de lanzamiento aplicados de verdad al proceso del juego.
+
+El "juego" es un stub ejecutable (script con shebang) que escribe en un
+fichero su afinidad de CPU, su nice, su clase de E/S, parte de su entorno y
+su proceso padre.
+"""
+import json
+import os
+import shutil
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from pixellauncher.core import GamesManager
+from pixellauncher.model import Game
+from pixellauncher.profiles import LaunchProfile, io_priority
+from pixellauncher.storage import open_storage
+
+STUB = f"""#!{sys.executable}
+import json, os, sys
+sys.path.insert(0, {str(Path(__file__).resolve().parent.parent)!r})
+from pixellauncher.profiles import io_priority
+report = {{
+    "cpus": sorted(os.sched_getaffinity(0)),
+    "nice": os.getpriority(os.PRIO_PROCESS, 0),
+    "io": list(io_priority()),
+    "env": {{k: v for k, v in os.environ.items() if k.startswith("PIXEL_")}},
+    "ppid": os.getppid(),
+}}
+with open(os.environ["PIXEL_STUB_REPORT"] + ".tmp", "w") as f:
+    json.dump(report, f)
+os.rename(os.environ["PIXEL_STUB_REPORT"] + ".tmp", os.environ["PIXEL_STUB_REPORT"])
+"""
+
+
+def own_state():
+    return sorted(os.sched_getaffinity(0)), os.getpriority(os.PRIO_PROCESS, 0), io_priority()
+
+
+def wait_report(path: Path, timeout: float = 10.0) -> dict:
+    deadline = time.monotonic() + timeout
+    while not path.exists():
+        assert time.monotonic() < deadline, "el stub no informó"
+        time.sleep(0.01)
+    return json.loads(path.read_text())
+
+
+@pytest.fixture
+def stub_game(home):
+    stub = home / "juego stub"
+    stub.write_text(STUB)
+    stub.chmod(0o755)
+    report = home / "informe.json"
+    available = sorted(os.sched_getaffinity(0))
+    cpus = available[-1:] if len(available) > 1 else available   # Con una sola CPU no se nota
+    profile = LaunchProfile(cpus=cpus, nice=min(19, os.getpriority(os.PRIO_PROCESS, 0) + 5), io_class="idle",
+                            env={"PIXEL_STUB_REPORT": str(report), "PIXEL_PERFIL": "sí, con ñ y espacios"},
+                            wrapper=f"{shutil.which('env')} PIXEL_ENVOLTORIO=1")
+    return Game(nombre="Stub", ruta_ejecutable=str(stub), tipo="binario", perfil=profile), report
+
+
+def test_launch_applies_profile(stub_game):
+    game, report_path = stub_game
+    before = own_state()
+    assert GamesManager.launch_game(game)
+    report = wait_report(report_path)
+    assert report["cpus"] == sorted(game.perfil.cpus)
+    assert report["nice"] == game.perfil.nice
+    assert report["io"] == ["idle", 0]
+    # El envoltorio se ejecutó, y sin shell entre medias: el padre es el launcher
+    assert report["env"] == {"PIXEL_STUB_REPORT": str(report_path), "PIXEL_PERFIL": "sí, con ñ y espacios",
+                             "PIXEL_ENVOLTORIO": "1"}
+    assert report["ppid"] == os.getpid()
+    assert own_state() == before, "el launcher cambió sus propios valores"
+
+
+@pytest.mark.parametrize("backend", ("json", "sqlite"))
+def test_profile_roundtrip(home, stub_game, backend):
+    game, _ = stub_game
+    storage = open_storage(home, backend)
+    storage.save([game])
+    storage.close()
+    assert open_storage(home, backend).load()[0].perfil == game.perfil
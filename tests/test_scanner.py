@@ -0,0 +1,99 @@
+"""Escáner de carpetas: qué reconoce y qué vuelve a leer al re-escanear con
+la caché en disco.
+"""
+import os
+import struct
+
+import pytest
+
+from pixellauncher.scanner import LibraryScanner, classify
+
+
+def elf(e_type: int = 2, appimage: bool = False) -> bytes:
+    """Cabecera ELF de 64 bits mínima (con la firma "AI" de las AppImage tipo 2)"""
+    ident = b"\x7fELF" + bytes([2, 1, 1, 0]) + (b"AI\x02" if appimage else b"\0\0\0") + b"\0" * 5
+    header = ident + struct.pack("<HHIQQQIHHHHHH", e_type, 62, 1, 0, 64, 0, 0, 64, 56, 1, 64, 0, 0)
+    return header + struct.pack("<IIQQQQQQ", 1, 4, 0, 0, 0, 0, 0, 8) + b"\0" * 64
+
+
+def write(path, data: bytes, mode: int = 0o644):
+    with open(path, 'wb') as f:
+        f.write(data)
+    os.chmod(path, mode)
+
+
+@pytest.fixture
+def tree(home):
+    """Juegos/Juego/{juego, data.bin} y Juegos/Otro-x86_64.AppImage"""
+    root = home / "Juegos"
+    (root / "Juego").mkdir(parents=True)
+    write(root / "Juego" / "juego", elf() + b"\0" * 1000, 0o755)
+    write(root / "Juego" / "data.bin", b"\0" * 500)
+    write(root / "Otro-x86_64.AppImage", elf(appimage=True), 0o755)
+    return root
+
+
+def scan(home, root):
+    scanner = LibraryScanner(home / "cache" / "scan.json")
+    games = scanner.scan([str(root)])
+    return {(g.nombre, g.tipo) for g in games}, scanner.stats
+
+
+def keep_dir_mtime(directory):
+    """Devuelve la carpeta a su mtime anterior (por si el cambio la tocó)"""
+    st = os.stat(directory)
+    return lambda: os.utime(directory, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+
+def test_classify(tree):
+    assert classify(str(tree / "Juego" / "juego")) == "binario"
+    assert classify(str(tree / "Otro-x86_64.AppImage")) == "appimage"
+    assert classify(str(tree / "Juego" / "data.bin")) is None
+    assert classify(str(tree / "no existe")) is None
+
+
+def test_rescan_uses_cache(home, tree):
+    found, stats = scan(home, tree)
+    assert found == {("Juego", "binario"), ("Otro", "appimage")}
+    assert stats == {"listed": 2, "read": 3}
+    found_again, stats = scan(home, tree)
+    assert found_again == found and stats == {"listed": 0, "read": 0}
+
+
+def test_new_file_lists_the_directory(home, tree):
+    scan(home, tree)
+    write(tree / "Nuevo.AppImage", elf(appimage=True), 0o755)
+    found, stats = scan(home, tree)
+    assert ("Nuevo", "appimage") in found
+    assert stats == {"listed": 1, "read": 1}
+
+
+def test_chmod_without_directory_change(home, tree):
+    scan(home, tree)
+    restore = keep_dir_mtime(tree / "Juego")
+    os.chmod(tree / "Juego" / "juego", 0o644)
+    restore()
+    found, stats = scan(home, tree)
+    assert found == {("Otro", "appimage")}
+    assert stats["listed"] == 0
+
+
+def test_rewrite_in_place_without_directory_change(home, tree):
+    scan(home, tree)
+    restore = keep_dir_mtime(tree)
+    path = tree / "Otro-x86_64.AppImage"
+    st = os.stat(path)
+    write(path, b"ya no es un ELF " * 8, 0o755)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1))
+    restore()
+    found, stats = scan(home, tree)
+    assert found == {("Juego", "binario")}
+    assert stats == {"listed": 0, "read": 1}
+
+
+def test_old_cache_is_discarded(home, tree):
+    (home / "cache").mkdir()
+    (home / "cache" / "scan.json").write_text('{"dirs": {"%s": {"mtime": 0}}}' % tree)
+    found, stats = scan(home, tree)
+    assert found == {("Juego", "binario"), ("Otro", "appimage")}
+    assert stats["listed"] == 2
@@ -0,0 +1,49 @@
+"""sorting.SortIndex: las vistas que se mantienen con bisect coinciden con
+ordenar la biblioteca desde cero.
+"""
+import queue
+import threading
+
+from pixellauncher.sorting import MODES, SortIndex
+
+
+def fresh_order(games, playtime, mode):
+    index = SortIndex(playtime.get)
+    index.insert(games, mode)
+    return index.order(mode)
+
+
+def test_refresh_playtime_keeps_jugados_in_order(make_library):
+    games = make_library(40)
+    playtime = {5: 100.0, 9: 50.0}
+    index = SortIndex(playtime.get)
+    index.insert(games, "nombre")
+    # Se juega en modo nombre: la vista no cambia, el índice sí
+    playtime[9] = 500.0
+    playtime[12] = 10.0
+    for game_id in (9, 12):
+        index.refresh_playtime(game_id)
+    assert index.order("nombre") == fresh_order(games, playtime, "nombre")
+    assert index.order("jugados")[:3] == [9, 5, 12]
+    for mode in MODES:
+        assert index.order(mode) == fresh_order(games, playtime, mode)
+
+
+def test_prepare_from_another_thread(make_library):
+    games = make_library(3000)
+    index = SortIndex()
+    batches = [games[i:i + 100] for i in range(0, len(games), 100)]
+    ready = queue.Queue()
+
+    def loader():
+        # Como MainWindow.load_library: prepara y entrega, mientras se inserta lo anterior
+        for batch in batches:
+            index.prepare(batch)
+            ready.put(batch)
+        ready.put(None)
+
+    threading.Thread(target=loader).start()
+    for batch in iter(ready.get, None):
+        index.insert(batch, "nombre")
+    assert not index._prepared
+    assert index.order("nombre") == fresh_order(games, {}, "nombre")
@@ -0,0 +1,125 @@
+"""supervisor.ProcessSupervisor con procesos de verdad (sleep, false, sh).
+
+Todo corre dentro de un GLib.MainLoop, como en la ventana: se comprueba que
+cada hijo se recoge, con su código de salida, y que crashed solo se marca
+si el error llega antes de CRASH_WINDOW.
+"""
+import os
+import shutil
+import signal
+import time
+
+import pytest
+
+pytest.importorskip("gi")
+from gi.repository import GLib  # noqa: E402
+
+from pixellauncher.supervisor import CRASH_WINDOW, AlreadyRunning, ProcessSupervisor  # noqa: E402
+
+SLEEP = shutil.which("sleep")
+FALSE = shutil.which("false")
+SH = shutil.which("sh")
+
+
+def run_until(cond, timeout: float = 10.0) -> bool:
+    """Hace girar un GLib.MainLoop hasta que cond() se cumple o pasa timeout"""
+    loop = GLib.MainLoop()
+    deadline = time.monotonic() + timeout
+    def check():
+        if cond() or time.monotonic() > deadline:
+            loop.quit()
+            return False
+        return True
+    GLib.timeout_add(5, check)
+    loop.run()
+    return cond()
+
+
+def proc_state(pid: int):
+    """(estado, ppid) de /proc/PID/stat, o None si el proceso ya no existe"""
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            fields = f.read().rsplit(")", 1)[1].split()
+    except OSError:
+        return None
+    return fields[0], int(fields[1])
+
+
+def alive(pid: int) -> bool:
+    state = proc_state(pid)
+    return state is not None and state[0] != "Z"
+
+
+def zombies() -> list:
+    """PIDs de hijos de este proceso que terminaron y nadie recogió"""
+    me = os.getpid()
+    return [int(name) for name in os.listdir("/proc")
+            if name.isdigit() and proc_state(int(name)) == ("Z", me)]
+
+
+def test_launch_and_reap():
+    events = []
+    supervisor = ProcessSupervisor(lambda s: events.append((s.game_id, s.running)))
+    session = supervisor.launch(1, [SLEEP, "0.2"])
+    assert supervisor.is_running(1) and supervisor.running[1] is session and session.running
+
+    assert run_until(lambda: not supervisor.is_running(1))
+    assert not supervisor.running
+    assert session.exit_code == 0 and not session.crashed
+    assert session.ended >= session.started and session.process is None
+    assert events == [(1, True), (1, False)]
+    assert supervisor.history == [session]
+    assert proc_state(session.pid) is None and not zombies()
+
+
+def test_already_running():
+    supervisor = ProcessSupervisor()
+    supervisor.launch(1, [SLEEP, "0.2"])
+    with pytest.raises(AlreadyRunning):
+        supervisor.launch(1, [SLEEP, "0.2"])
+    assert len(supervisor.running) == 1
+    assert run_until(lambda: not supervisor.running)
+
+
+def test_error_at_start_is_crashed():
+    supervisor = ProcessSupervisor()
+    session = supervisor.launch(1, [FALSE])
+    assert run_until(lambda: not supervisor.running)
+    assert session.exit_code == 1 and session.crashed
+    assert not zombies()
+
+
+def test_error_after_crash_window_is_not_crashed():
+    supervisor = ProcessSupervisor()
+    session = supervisor.launch(1, [FALSE])
+    # El bucle aún no ha recogido al hijo: se adelanta el inicio
+    session.started -= CRASH_WINDOW
+    assert run_until(lambda: not supervisor.running)
+    assert session.exit_code == 1 and not session.crashed
+
+
+def test_terminate_kills_the_process_group(home):
+    supervisor = ProcessSupervisor()
+    pid_file = home / "nieto.pid"
+    session = supervisor.launch(1, [SH, "-c", f'{SLEEP} 60 & echo $! > "{pid_file}.tmp"; '
+                                              f'mv "{pid_file}.tmp" "{pid_file}"; wait'])
+    assert run_until(pid_file.exists, 5.0)
+    grandchild = int(pid_file.read_text())
+    assert alive(grandchild) and os.getpgid(grandchild) == session.pid
+
+    assert supervisor.terminate(1)
+    assert run_until(lambda: not supervisor.is_running(1))
+    assert session.exit_code == -signal.SIGTERM
+    # El nieto lo adopta init: puede quedar un instante como zombi suyo, pero ya no corre
+    assert run_until(lambda: not alive(grandchild), 5.0)
+    assert not supervisor.terminate(1)
+    assert not zombies()
+
+
+def test_many_children_are_all_reaped():
+    supervisor = ProcessSupervisor()
+    sessions = [supervisor.launch(i, [SH, "-c", "sleep 0.2; exit $0", str(i % 7)]) for i in range(100)]
+    assert run_until(lambda: not supervisor.running, 30.0)
+    assert len(supervisor.history) == 100
+    assert [s.exit_code for s in sessions] == [i % 7 for i in range(100)]
+    assert not zombies()
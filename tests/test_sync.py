@@ -0,0 +1,118 @@
+"""Relectura por diferencias (sync.diff_library) y dos procesos escribiendo
+la misma biblioteca a la vez, con los dos backends.
+"""
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from pixellauncher.model import Game
+from pixellauncher.storage import open_storage
+from pixellauncher.sync import diff_library
+
+BACKENDS = ("json", "sqlite")
+WORKERS = ("A", "B")
+EDITS = 20
+SHARED_ID = 1        # Lo editan los dos procesos: gana la última escritura
+
+# Cada proceso da de alta, edita juegos distintos, edita el compartido y da de baja otros
+WORKER = """
+import sys, time
+from pathlib import Path
+from pixellauncher.model import Game
+from pixellauncher.storage import open_storage
+backend, directory, tag, edits, start = sys.argv[1:]
+edits, offset = int(edits), "AB".index(tag) * int(edits)
+storage = open_storage(Path(directory), backend)
+games = {game.id: game for game in storage.load()}
+time.sleep(max(0.0, float(start) - time.time()))
+for i in range(edits):
+    storage.add(Game(nombre=f"Nuevo {tag} {i}", ruta_ejecutable=f"/opt/{tag}/{i}", tipo="binario"))
+    game = games[2 + offset + i]
+    game.descripcion = f"editado por {tag}"
+    storage.update(game)
+    storage.remove(games[2 + 2 * edits + offset + i])
+    shared = games[1]
+    shared.descripcion = f"último: {tag}"
+    storage.update(shared)
+storage.close()
+"""
+
+
+def plan(tag: str):
+    """IDs que edita y que elimina cada proceso (los mismos que en WORKER)"""
+    offset = WORKERS.index(tag) * EDITS
+    edited = [2 + offset + i for i in range(EDITS)]
+    removed = [2 + len(WORKERS) * EDITS + offset + i for i in range(EDITS)]
+    return edited, removed
+
+
+def test_diff_library(make_library):
+    current = {game.id: game for game in make_library(5)}
+    fresh = make_library(5)
+    fresh[1].descripcion = "editado"
+    del fresh[4]
+    fresh.append(Game(id=9, nombre="Nuevo", ruta_ejecutable="/opt/nuevo"))
+    diff = diff_library(current, fresh)
+    assert [g.id for g in diff.added] == [9]
+    assert [g.id for g in diff.changed] == [2] and diff.changed[0] is fresh[1]
+    assert diff.removed == [5]
+    assert not diff_library(current, make_library(5))
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_two_processes_and_reload(home, make_library, backend):
+    storage = open_storage(home, backend)
+    storage.save(make_library(200))
+    storage.close()
+    watcher = open_storage(home, backend)
+    snapshot = {game.id: game for game in watcher.load()}
+
+    env = dict(os.environ, PYTHONPATH=str(Path(__file__).resolve().parent.parent))
+    start = repr(time.time() + 0.3)
+    procs = [subprocess.Popen([sys.executable, "-c", WORKER, backend, str(home), tag, str(EDITS), start],
+                              env=env) for tag in WORKERS]
+    assert [proc.wait() for proc in procs] == [0] * len(WORKERS)
+
+    final = open_storage(home, backend).load()
+    by_id = {game.id: game for game in final}
+    names = {game.nombre for game in final}
+    assert len(by_id) == len(final), "IDs repetidos"
+    for tag in WORKERS:
+        edited, removed = plan(tag)
+        assert all(f"Nuevo {tag} {i}" in names for i in range(EDITS))
+        assert all(by_id[i].descripcion == f"editado por {tag}" for i in edited)
+        assert not [i for i in removed if i in by_id]
+    assert by_id[SHARED_ID].descripcion in {f"último: {tag}" for tag in WORKERS}
+
+    assert watcher.has_external_changes()
+    diff = diff_library(snapshot, watcher.reload())
+    n = len(WORKERS) * EDITS
+    assert (len(diff.added), len(diff.changed), len(diff.removed)) == (n, n + 1, n)
+    watcher.add(Game(nombre="Propio", ruta_ejecutable="/opt/propio", tipo="binario"))
+    assert not watcher.has_external_changes(), "una escritura propia se tomó por externa"
+    watcher.close()
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_deleted_id_is_not_reused(home, make_library, backend):
+    first = open_storage(home, backend)
+    games = make_library(10)
+    first.save(games)
+    watcher = open_storage(home, backend)
+    snapshot = {game.id: game for game in watcher.load()}
+    first.remove(games[-1])
+    first.close()
+
+    second = open_storage(home, backend)
+    game = Game(nombre="Otro", ruta_ejecutable="/opt/otro", tipo="binario")
+    second.add(game)
+    second.close()
+    assert game.id > games[-1].id
+    # El nuevo no hereda el ID: la relectura lo ve como baja + alta, no como edición
+    diff = diff_library(snapshot, watcher.reload())
+    assert (len(diff.added), len(diff.changed), len(diff.removed)) == (1, 0, 1)
+    watcher.close()